@@ -0,0 +1,83 @@
+"""Compare peak RSS of symbolic and numeric-only compute over a long batch run.
+
+Each mode runs in a fresh subprocess (peak RSS only ever grows within a
+process) and keeps every per-row result alive, as a batch job collecting its
+results would::
+
+    python benchmarks/compute_memory.py --rows 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import subprocess
+import sys
+
+from uncertainty_calculator import Digits, Equation, Variable
+from uncertainty_calculator.compute import compute, compute_numeric
+from uncertainty_calculator.parsers import parse_inputs
+
+EQUATION = Equation(latex_name=r"\zeta", expression="(K*pi*eta*u*l)/(4*pi*phi*e_0*e_r)")
+NOMINAL = {
+    "K": (4.0, 0.0),
+    "eta": (0.9358e-3, 5.77e-05),
+    "u": (3.68e-5, 0.11e-5),
+    "l": (0.2256, 0.0019),
+    "phi": (100.0, 0.577),
+    "e_0": (8.8541878128e-12, 0.0),
+    "e_r": (78.7, 0.0577),
+}
+
+
+def _rows(count: int) -> list[list[Variable]]:
+    rng = random.Random(0)
+    return [
+        [
+            Variable(
+                name=name, value=value * rng.uniform(0.9, 1.1), uncertainty=sigma, latex_name=name
+            )
+            for name, (value, sigma) in NOMINAL.items()
+        ]
+        for _ in range(count)
+    ]
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _run_mode(mode: str, count: int) -> None:
+    rows = _rows(count)
+    baseline = _peak_rss_mib()
+    if mode == "symbolic":
+        kept: list[object] = []
+        for variables in rows:
+            parse_state = parse_inputs(EQUATION, variables)
+            kept.append((parse_state, compute(parse_state, Digits(mu=3, sigma=3))))
+    else:
+        kept = [compute_numeric(EQUATION, variables) for variables in rows]
+    print(f"{mode:>8}: {len(kept)} rows, peak RSS +{_peak_rss_mib() - baseline:.1f} MiB")
+
+
+def main() -> None:
+    """Run both modes in subprocesses, or a single mode when `--mode` is given."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--mode", choices=["symbolic", "numeric"])
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        _run_mode(args.mode, args.rows)
+        return
+    for mode in ("symbolic", "numeric"):
+        subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--rows", str(args.rows)], check=True
+        )
+
+
+if __name__ == "__main__":
+    main()
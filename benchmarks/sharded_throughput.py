@@ -0,0 +1,78 @@
+"""Measure batch propagation throughput as the number of worker processes grows.
+
+Inputs are written once into a shared-memory batch; each worker count reuses
+it, so the timings cover only the sharded propagation itself::
+
+    python benchmarks/sharded_throughput.py --rows 2000000 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from uncertainty_calculator import Equation, Variable
+from uncertainty_calculator.compiled import compile_equation
+from uncertainty_calculator.sharding import ShardedExecutor
+
+EQUATION = Equation(
+    latex_name=r"\zeta", expression="(K*pi*eta*u*l)/(4*pi*phi*e_0*e_r) * exp(-l/phi)"
+)
+NOMINAL = {
+    "K": (4.0, 0.0),
+    "eta": (0.9358e-3, 5.77e-05),
+    "u": (3.68e-5, 0.11e-5),
+    "l": (0.2256, 0.0019),
+    "phi": (100.0, 0.577),
+    "e_0": (8.8541878128e-12, 0.0),
+    "e_r": (78.7, 0.0577),
+}
+VARIABLES = [
+    Variable(name=name, value=value, uncertainty=sigma, latex_name=name)
+    for name, (value, sigma) in NOMINAL.items()
+]
+
+
+def main() -> None:
+    """Time single-process propagation, then the sharded executor per worker count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = {
+        name: value * rng.uniform(0.9, 1.1, args.rows) for name, (value, _) in NOMINAL.items()
+    }
+    sigmas = {name: sigma for name, (_, sigma) in NOMINAL.items()}
+
+    compiled = compile_equation(EQUATION, VARIABLES)
+    started = time.perf_counter()
+    compiled.propagate(values, sigmas)
+    baseline = time.perf_counter() - started
+    print(f"in-process: {args.rows / baseline:>14,.0f} rows/s")
+
+    for workers in sorted(set(args.workers)):
+        with (
+            ShardedExecutor(EQUATION, VARIABLES, workers=workers) as executor,
+            executor.batch(args.rows) as batch,
+        ):
+            batch.fill(values, sigmas)
+            executor.propagate(batch)  # Warm up: start workers and attach.
+            best = float("inf")
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                executor.propagate(batch)
+                best = min(best, time.perf_counter() - started)
+        print(
+            f"{workers:>3} workers: {args.rows / best:>14,.0f} rows/s "
+            f"({baseline / best:.2f}x in-process)"
+        )
+
+
+if __name__ == "__main__":
+    main()
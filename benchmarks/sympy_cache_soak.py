@@ -0,0 +1,98 @@
+"""Soak test: resident memory over many thousands of distinct formulas.
+
+Each policy runs in a fresh subprocess that renders `--formulas` distinct
+random formulas through `UncertaintyCalculator.run` and samples the current
+RSS as it goes. Without clearing, SymPy's global caches keep filling until
+each reaches `SYMPY_CACHE_SIZE`; with a policy the curve stays flat::
+
+    python benchmarks/sympy_cache_soak.py --formulas 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import resource
+import subprocess
+import sys
+
+from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
+from uncertainty_calculator.sympy_cache import set_sympy_cache_policy, sympy_cache_info
+
+NAMES = ("a", "b", "c", "d", "e")
+POLICIES = {
+    "none": {},
+    "every-200-runs": {"every_runs": 200},
+    "max-10000-entries": {"max_entries": 10000},
+}
+
+
+def _formula(rng: random.Random) -> str:
+    terms = []
+    for _ in range(rng.randint(2, 5)):
+        a, b = rng.sample(NAMES, 2)
+        terms.append(f"{rng.randint(1, 99)}*{a}**{rng.randint(1, 4)}*{b}")
+    return " + ".join(terms)
+
+
+def _current_rss_mib() -> float:
+    try:
+        with open("/proc/self/statm") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # No procfs (e.g. macOS): fall back to the peak, in bytes there.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**20
+
+
+def _run_policy(policy: str, formulas: int, samples: int) -> None:
+    set_sympy_cache_policy(**POLICIES[policy])
+    calculator = UncertaintyCalculator(Digits(mu=3, sigma=2), None, False, True, True)
+    variables = [
+        Variable(name=name, value=1.0 + i / 10, uncertainty=0.01 * (i + 1), latex_name=name)
+        for i, name in enumerate(NAMES)
+    ]
+    rng = random.Random(0)
+    report_every = max(1, formulas // samples)
+    points = []
+    for i in range(1, formulas + 1):
+        calculator.run(Equation(latex_name="f", expression=_formula(rng)), variables)
+        if i % report_every == 0:
+            points.append(f"{_current_rss_mib():.0f}")
+    info = sympy_cache_info()
+    print(
+        f"{policy:>18}: RSS MiB {' '.join(points)} | "
+        f"{info.entries} SymPy cache entries, {info.clears} clears"
+    )
+
+
+def main() -> None:
+    """Run every policy in its own subprocess, or a single one when `--policy` is given."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--formulas", type=int, default=5000)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--policy", choices=list(POLICIES))
+    args = parser.parse_args()
+
+    if args.policy is not None:
+        _run_policy(args.policy, args.formulas, args.samples)
+        return
+    for policy in POLICIES:
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--policy",
+                policy,
+                "--formulas",
+                str(args.formulas),
+                "--samples",
+                str(args.samples),
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
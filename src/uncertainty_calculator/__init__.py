@@ -1,7 +1,22 @@
 """Uncertainty Calculator Package."""
 
-from uncertainty_calculator._types import Digits, Equation, Variable, Variables
+from uncertainty_calculator._types import (
+    Digits,
+    Equation,
+    Equations,
+    IndexedVariable,
+    Variable,
+    Variables,
+)
 from uncertainty_calculator.calculator import UncertaintyCalculator
 
 __version__ = "0.2.0"
-__all__ = ["Digits", "Equation", "UncertaintyCalculator", "Variable", "Variables"]
+__all__ = [
+    "Digits",
+    "Equation",
+    "Equations",
+    "IndexedVariable",
+    "UncertaintyCalculator",
+    "Variable",
+    "Variables",
+]
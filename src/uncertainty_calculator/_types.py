@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from numbers import Real
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
 
 
 @dataclass
@@ -23,6 +27,25 @@ class Equation:
     expression: str
 
 
+@dataclass
+class Equations:
+    """Several equations computed from one shared set of variables.
+
+    Attributes:
+        equations: The output equations, in output order.
+
+    """
+
+    equations: list[Equation]
+
+    def __post_init__(self) -> None:
+        """Validate that at least one equation is given."""
+        self.equations = list(self.equations)
+        if not self.equations:
+            msg = "equations must contain at least one Equation"
+            raise ValueError(msg)
+
+
 @dataclass
 class Variable:
     r"""A variable definition for the uncertainty calculator.
@@ -50,6 +73,51 @@ class Variable:
             setattr(self, field_name, float(field_value))
 
 
+@dataclass
+class IndexedVariable:
+    r"""An array of repeated readings of one quantity, referenced as `name[i]` inside `sum()`.
+
+    Attributes:
+        name: The variable symbol used in the equation (e.g., "x" for `sum(x[i])`).
+        values: The numeric value of every reading.
+        uncertainties: The uncertainty of every reading, or one uncertainty shared by all.
+        latex_name: The LaTeX representation of the variable; readings render as
+            `{latex_name}_{i}`.
+
+    """
+
+    name: str
+    values: Sequence[float] | NDArray[np.float64]
+    uncertainties: Sequence[float] | NDArray[np.float64] | float
+    latex_name: str
+
+    def __post_init__(self) -> None:
+        """Validate the readings and normalize them to equal-length tuples of floats."""
+        # Items are checked below, so they are not trusted to be floats yet.
+        values: tuple[Any, ...] = tuple(self.values)
+        if not values:
+            msg = f"values of indexed variable {self.name!r} must not be empty"
+            raise ValueError(msg)
+        uncertainties: tuple[Any, ...] = (
+            tuple(self.uncertainties)
+            if isinstance(self.uncertainties, Iterable)
+            else (self.uncertainties,) * len(values)
+        )
+        if len(uncertainties) != len(values):
+            msg = (
+                f"indexed variable {self.name!r} has {len(values)} values but "
+                f"{len(uncertainties)} uncertainties"
+            )
+            raise ValueError(msg)
+        for field_name, items in (("values", values), ("uncertainties", uncertainties)):
+            for item in items:
+                if isinstance(item, bool) or not isinstance(item, Real):
+                    msg = f"{field_name} must contain real numbers (got {item!r})"
+                    raise TypeError(msg)
+        self.values = tuple(float(item) for item in values)
+        self.uncertainties = tuple(float(item) for item in uncertainties)
+
+
 @dataclass
 class Digits:
     """Digits configuration for result rounding."""
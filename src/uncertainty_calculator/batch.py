@@ -0,0 +1,216 @@
+"""Memory-mapped `.npy` storage for batch propagation inputs and results."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from numpy.typing import ArrayLike
+
+from uncertainty_calculator._types import Variables
+from uncertainty_calculator.compiled import CompiledEquation, Propagation
+
+NAMES_FILE = "names.json"
+SCALAR_FIELDS = ("mu", "sigma")
+PER_VARIABLE_FIELDS = ("gradient", "contributions")
+DEFAULT_CHUNK_ROWS = 65536
+
+
+@dataclass
+class BatchOutput:
+    """Preallocated result files in one directory, opened as memory maps.
+
+    Each field is a standalone `.npy` file (`mu.npy`, `sigma.npy` with shape
+    `(rows,)`; `gradient.npy`, `contributions.npy` with shape `(rows, n_vars)`),
+    so downstream code can open any of them zero-copy with
+    `numpy.load(path, mmap_mode="r")`. Variable column order is stored in
+    `names.json`.
+    """
+
+    directory: Path
+    names: tuple[str, ...]
+    mu: np.memmap
+    sigma: np.memmap
+    gradient: np.memmap
+    contributions: np.memmap
+
+    @classmethod
+    def create(cls, directory: str | Path, rows: int, names: tuple[str, ...]) -> BatchOutput:
+        """Allocate zero-filled result files for `rows` rows of variables `names`."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / NAMES_FILE).write_text(json.dumps(list(names)))
+        arrays = {
+            field: open_memmap(directory / f"{field}.npy", mode="w+", dtype=np.float64, shape=shape)
+            for fields, shape in (
+                (SCALAR_FIELDS, (rows,)),
+                (PER_VARIABLE_FIELDS, (rows, len(names))),
+            )
+            for field in fields
+        }
+        return cls(directory=directory, names=tuple(names), **arrays)
+
+    @classmethod
+    def open(cls, directory: str | Path, mode: Literal["r", "r+"] = "r") -> BatchOutput:
+        """Map existing result files; workers use `"r+"` to fill their slices."""
+        directory = Path(directory)
+        names = tuple(json.loads((directory / NAMES_FILE).read_text()))
+        arrays = {
+            field: np.load(directory / f"{field}.npy", mmap_mode=mode)
+            for field in (*SCALAR_FIELDS, *PER_VARIABLE_FIELDS)
+        }
+        return cls(directory=directory, names=names, **arrays)
+
+    @property
+    def rows(self) -> int:
+        """Number of result rows."""
+        return self.mu.shape[0]
+
+    def view(self, start: int, stop: int) -> Propagation:
+        """Return writable views of rows `[start, stop)` without copying."""
+        return Propagation(
+            mu=self.mu[start:stop],
+            sigma=self.sigma[start:stop],
+            gradient=self.gradient[start:stop],
+            contributions=self.contributions[start:stop],
+        )
+
+    def flush(self) -> None:
+        """Write dirty pages of every result file back to disk."""
+        for array in (self.mu, self.sigma, self.gradient, self.contributions):
+            array.flush()
+
+
+def propagate_into(
+    compiled: CompiledEquation,
+    values: Mapping[str, ArrayLike],
+    uncertainties: Mapping[str, ArrayLike],
+    output: BatchOutput,
+    start: int,
+) -> int:
+    """Propagate one chunk of rows straight into `output` starting at row `start`.
+
+    The chunk's row count is broadcast from both `values` and `uncertainties`,
+    so per-row uncertainty columns over scalar values are propagated row by row.
+    Returns the row index after the chunk, so consecutive calls can be chained.
+    Disjoint `[start, stop)` ranges may be filled concurrently by separate
+    workers that each opened the directory with `BatchOutput.open(..., "r+")`.
+    """
+    if tuple(compiled.names) != output.names:
+        msg = "Compiled equation variables do not match the output columns."
+        raise ValueError(msg)
+    shape = np.broadcast_shapes(
+        *(np.shape(column) for column in (*values.values(), *uncertainties.values()))
+    )
+    rows = shape[0] if shape else 1
+    stop = start + rows
+    if stop > output.rows:
+        msg = f"Rows [{start}, {stop}) exceed the {output.rows} preallocated rows."
+        raise ValueError(msg)
+    compiled.propagate(values, uncertainties, out=output.view(start, stop))
+    return stop
+
+
+@dataclass
+class ColumnarInput:
+    """Per-variable value and uncertainty columns backed by memory-mapped `.npy` files.
+
+    Columns are keyed by `Variable.name`; a variable without a column falls back
+    to its scalar `value`/`uncertainty`, so the same `Equation` and `Variable`
+    definitions serve single runs and archives alike.
+    """
+
+    values: dict[str, np.ndarray]
+    uncertainties: dict[str, np.ndarray]
+    rows: int
+
+    @classmethod
+    def from_files(
+        cls,
+        variables: Variables,
+        values: Mapping[str, str | Path],
+        uncertainties: Mapping[str, str | Path] | None = None,
+    ) -> ColumnarInput:
+        """Map the given `.npy` files, falling back to scalar fields of `variables`."""
+        uncertainties = uncertainties or {}
+        value_columns: dict[str, np.ndarray] = {}
+        uncertainty_columns: dict[str, np.ndarray] = {}
+        for variable in variables:
+            value_columns[variable.name] = _column(values.get(variable.name), variable.value)
+            uncertainty_columns[variable.name] = _column(
+                uncertainties.get(variable.name), variable.uncertainty
+            )
+
+        lengths = {
+            column.shape[0]
+            for column in (*value_columns.values(), *uncertainty_columns.values())
+            if column.ndim
+        }
+        if len(lengths) > 1:
+            msg = f"Columns have mismatched lengths: {sorted(lengths)}"
+            raise ValueError(msg)
+        return cls(
+            values=value_columns,
+            uncertainties=uncertainty_columns,
+            rows=lengths.pop() if lengths else 1,
+        )
+
+    @classmethod
+    def from_directory(cls, directory: str | Path, variables: Variables) -> ColumnarInput:
+        """Map `<name>.npy` value and `sigma_<name>.npy` uncertainty columns in `directory`."""
+        directory = Path(directory)
+        variables = list(variables)
+        return cls.from_files(
+            variables,
+            values=_existing(directory, {var.name: f"{var.name}.npy" for var in variables}),
+            uncertainties=_existing(
+                directory, {var.name: f"sigma_{var.name}.npy" for var in variables}
+            ),
+        )
+
+    def chunks(
+        self, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[tuple[int, dict[str, np.ndarray], dict[str, np.ndarray]]]:
+        """Yield `(start, values, uncertainties)` with aligned row-slice views of every column."""
+        for start in range(0, self.rows, chunk_rows):
+            stop = min(start + chunk_rows, self.rows)
+            yield start, _slice(self.values, start, stop), _slice(self.uncertainties, start, stop)
+
+
+def propagate_columns(
+    compiled: CompiledEquation,
+    source: ColumnarInput,
+    output: BatchOutput,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> None:
+    """Stream every chunk of `source` through `compiled` into `output`."""
+    if output.rows != source.rows:
+        msg = f"Output has {output.rows} rows but the input has {source.rows}."
+        raise ValueError(msg)
+    for start, values, uncertainties in source.chunks(chunk_rows):
+        propagate_into(compiled, values, uncertainties, output, start)
+    output.flush()
+
+
+def _column(path: str | Path | None, fallback: float) -> np.ndarray:
+    if path is None:
+        return np.asarray(fallback, dtype=np.float64)
+    column = np.load(path, mmap_mode="r")
+    if column.ndim != 1:
+        msg = f"Column file {path} must be 1-D (got shape {column.shape})."
+        raise ValueError(msg)
+    return column
+
+
+def _existing(directory: Path, files: Mapping[str, str]) -> dict[str, Path]:
+    return {name: directory / file for name, file in files.items() if (directory / file).exists()}
+
+
+def _slice(columns: Mapping[str, np.ndarray], start: int, stop: int) -> dict[str, np.ndarray]:
+    # Scalar fallbacks broadcast against the sliced file columns.
+    return {name: column[start:stop] if column.ndim else column for name, column in columns.items()}
@@ -0,0 +1,146 @@
+"""Thread-safe bounded caches shared by the pipeline stages."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Snapshot of cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    waits: int = 0
+    evictions: int = 0
+
+
+class LRUCache[K: Hashable, V]:
+    """A bounded least-recently-used mapping guarded by a lock.
+
+    `get_or_create` is single-flight: concurrent misses on the same key run the
+    factory once while the other callers wait for its result (counted as
+    `waits`), so a burst of identical requests compiles a formula only once.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Create an empty cache holding at most `maxsize` entries."""
+        _check_maxsize(maxsize)
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: dict[K, Future[V]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._waits = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for `key` (marking it recently used), or None."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store `value` under `key`, evicting the least recently used entries if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def discard(self, key: K) -> None:
+        """Remove `key` if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """Return the cached value for `key`, building and storing it on a miss.
+
+        If the factory raises, every waiting caller receives the same exception
+        and nothing is cached.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return self._data[key]
+            pending = self._inflight.get(key)
+            if pending is None:
+                self._misses += 1
+                future: Future[V] = Future()
+                self._inflight[key] = future
+            else:
+                self._waits += 1
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = factory()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+
+    def resize(self, maxsize: int) -> None:
+        """Change the size limit, evicting entries that no longer fit."""
+        _check_maxsize(maxsize)
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._waits = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return current hit/miss counters and occupancy."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._data),
+                waits=self._waits,
+                evictions=self._evictions,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._data)
+
+    def _evict(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+
+def _check_maxsize(maxsize: int) -> None:
+    if isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize < 0:
+        msg = f"maxsize must be a non-negative integer (got {maxsize!r})"
+        raise ValueError(msg)
@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
-from uncertainty_calculator._types import Digits, Equation, Variables
-from uncertainty_calculator.compute import ComputeState, compute
-from uncertainty_calculator.parsers import ParseState, parse_inputs
-from uncertainty_calculator.render import RenderOptions, render_output
+from collections.abc import Iterable
+from typing import Literal, overload
+
+from uncertainty_calculator._types import (
+    Digits,
+    Equation,
+    Equations,
+    IndexedVariable,
+    Variable,
+    Variables,
+)
+from uncertainty_calculator.compute import NumericState, compute_numeric
+from uncertainty_calculator.indexed import compute_indexed, parse_indexed
+from uncertainty_calculator.metrics import REGISTRY
+from uncertainty_calculator.multi import MultiOutput, run_equations
+from uncertainty_calculator.parsers import parse_inputs
+from uncertainty_calculator.render import RenderOptions, render_indexed
+from uncertainty_calculator.result import CalculationResult
+from uncertainty_calculator.result_cache import ResultCache, result_key
+from uncertainty_calculator.sympy_cache import maybe_clear_sympy_cache
 from uncertainty_calculator.validation import validate_inputs
 
 
@@ -19,24 +35,117 @@ class UncertaintyCalculator:
         separate: bool,
         insert: bool,
         include_equation_number: bool,
+        result_cache: ResultCache | None = None,
+        prune_threshold: float | None = None,
+        coverage_factor: float | None = None,
     ) -> None:
-        """Initialize the calculator with rendering and precision configuration."""
+        """Initialize the calculator with rendering and precision configuration.
+
+        An optional `result_cache` returns previously rendered output for
+        identical equation, variables, digits and render options. With
+        `prune_threshold`, contributions below that fraction of the largest one
+        are skipped (see `compute.compute`). With `coverage_factor` k, worst-case
+        bounds over `value +/- k*uncertainty` (see `interval`) are rendered after
+        the result.
+        """
         self.digits = digits
         self.last_unit = last_unit
         self.separate = separate
         self.insert = insert
         self.include_equation_number = include_equation_number
+        self.result_cache = result_cache
+        self.prune_threshold = prune_threshold
+        self.coverage_factor = coverage_factor
+
+    @overload
+    def run(
+        self, equation: Equation, variables: Variables, *, lazy: Literal[False] = False
+    ) -> str: ...
+
+    @overload
+    def run(
+        self, equation: Equation, variables: Variables, *, lazy: Literal[True]
+    ) -> CalculationResult: ...
+
+    def run(
+        self, equation: Equation, variables: Variables, *, lazy: bool = False
+    ) -> str | CalculationResult:
+        """Execute the calculation pipeline and return the LaTeX string.
+
+        With `lazy=True`, return a `CalculationResult` right after parsing and
+        validation instead: partials are computed and LaTeX is rendered only
+        when first needed, once per `RenderOptions`. The result cache is not
+        consulted for lazy results.
+        """
+        REGISTRY.inc("runs_total")
+        with REGISTRY.time("run_seconds"):
+            try:
+                if lazy:
+                    return self._result(equation, variables, self._render_options())
+                return self._run_cached(equation, variables)
+            except Exception:
+                REGISTRY.inc("run_errors_total")
+                raise
+            finally:
+                maybe_clear_sympy_cache()
+
+    def run_many(self, equations: Equations, variables: Variables) -> MultiOutput:
+        """Render each output of `equations` and propagate their joint covariance matrix."""
+        return run_equations(equations, variables, self.digits, self._render_options())
+
+    def run_indexed(
+        self, equation: Equation, variables: Iterable[Variable | IndexedVariable]
+    ) -> str:
+        """Render an equation that sums over the readings of `IndexedVariable`s.
 
-    def run(self, equation: Equation, variables: Variables) -> str:
-        """Execute the calculation pipeline and return the LaTeX string."""
-        parse_state: ParseState = parse_inputs(equation, variables)
-        validate_inputs(parse_state)
-        compute_state: ComputeState = compute(parse_state, self.digits)
+        Symbolic work is independent of the number of readings; see `indexed`.
+        """
+        parse_state = parse_indexed(equation, variables)
+        compute_state = compute_indexed(parse_state, self.digits)
+        return render_indexed(parse_state, compute_state, self._render_options())
 
-        options = RenderOptions(
+    def run_numeric(self, equation: Equation, variables: Variables) -> NumericState:
+        """Propagate numerically without building or retaining symbolic derivatives."""
+        return compute_numeric(equation, variables)
+
+    def _render_options(self) -> RenderOptions:
+        return RenderOptions(
             last_unit=self.last_unit,
             separate=self.separate,
             insert=self.insert,
             include_equation_number=self.include_equation_number,
         )
-        return render_output(parse_state, compute_state, options)
+
+    def _run_cached(self, equation: Equation, variables: Variables) -> str:
+        options = self._render_options()
+        if self.result_cache is None:
+            return self._run(equation, variables, options)
+
+        variables = list(variables)
+        key = result_key(
+            equation,
+            variables,
+            self.digits,
+            options,
+            self.prune_threshold,
+            coverage_factor=self.coverage_factor,
+        )
+        return self.result_cache.get_or_create(key, lambda: self._run(equation, variables, options))
+
+    def _run(self, equation: Equation, variables: Variables, options: RenderOptions) -> str:
+        return self._result(equation, variables, options).latex()
+
+    def _result(
+        self, equation: Equation, variables: Variables, options: RenderOptions
+    ) -> CalculationResult:
+        with REGISTRY.time("stage_seconds", stage="parse"):
+            parse_state = parse_inputs(equation, variables)
+        with REGISTRY.time("stage_seconds", stage="validate"):
+            validate_inputs(parse_state)
+        return CalculationResult(
+            parse_state,
+            self.digits,
+            options,
+            prune_threshold=self.prune_threshold,
+            coverage_factor=self.coverage_factor,
+        )
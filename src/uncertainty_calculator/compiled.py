@@ -0,0 +1,298 @@
+"""Numeric evaluation of equations compiled from their symbolic form."""
+
+from __future__ import annotations
+
+import builtins
+import dis
+import math
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Any
+
+import mpmath
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from sympy import Add, S, Symbol, diff, lambdify
+
+from uncertainty_calculator._types import Equation, Variables
+from uncertainty_calculator.cache import CacheInfo, LRUCache
+from uncertainty_calculator.native import build_native_kernel
+from uncertainty_calculator.parsers import ParseState, parse_inputs
+from uncertainty_calculator.structure import terms_by_symbol
+from uncertainty_calculator.validation import validate_inputs
+
+DEFAULT_COMPILED_CACHE_SIZE = 128
+
+# `lambdify(modules="numpy")` maps these to scalar-only `math` functions, which
+# reject array columns. SciPy provides ufuncs for them; without it they are
+# applied elementwise.
+_MATH_ONLY_FUNCTIONS = ("erf", "erfc", "gamma", "lgamma")
+
+_LAMBDIFY_MODULES: list[Any] = (
+    ["numpy", "scipy"]
+    if find_spec("scipy") is not None
+    else [
+        {
+            name: np.vectorize(getattr(math, name), otypes=[np.float64])
+            for name in _MATH_ONLY_FUNCTIONS
+        },
+        "numpy",
+    ]
+)
+
+type Kernel = Callable[[NDArray[np.float64]], tuple[NDArray[np.float64], NDArray[np.float64]]]
+"""Maps an `(n_vars, rows)` input matrix to `(value[rows], gradient[rows, n_vars])`."""
+
+
+@dataclass(frozen=True)
+class Evaluation:
+    """Value and gradient of an equation over one or many input rows."""
+
+    value: NDArray[np.float64]
+    gradient: NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class Propagation:
+    """First-order propagated uncertainty over one or many input rows.
+
+    Attributes:
+        mu: Equation value per row.
+        sigma: Propagated standard uncertainty per row.
+        gradient: Partial derivatives, shape `(rows, n_vars)`.
+        contributions: `(partial * uncertainty)**2` per variable, shape `(rows, n_vars)`.
+
+    """
+
+    mu: NDArray[np.float64]
+    sigma: NDArray[np.float64]
+    gradient: NDArray[np.float64]
+    contributions: NDArray[np.float64]
+
+
+class CompiledEquation:
+    """An equation compiled to a numeric value-and-gradient kernel.
+
+    Inputs are given per variable name as scalars or 1-D arrays (broadcast to a
+    common number of rows); outputs always carry a leading row axis. Gradient
+    columns follow `gradient_names`, which omits variables compiled as exact.
+    """
+
+    def __init__(
+        self,
+        names: tuple[str, ...],
+        kernel: Kernel,
+        backend: str,
+        gradient_names: tuple[str, ...] | None = None,
+    ) -> None:
+        """Wrap a kernel evaluating the equation over variables `names` (in order)."""
+        self.names = names
+        self.kernel = kernel
+        self.backend = backend
+        self.gradient_names = names if gradient_names is None else gradient_names
+
+    def columns(self, values: Mapping[str, ArrayLike]) -> NDArray[np.float64]:
+        """Stack per-variable inputs into a C-contiguous `(n_vars, rows)` float matrix."""
+        return input_columns(self.names, values)
+
+    def evaluate(self, values: Mapping[str, ArrayLike]) -> Evaluation:
+        """Evaluate the equation value and gradient."""
+        value, gradient = self.kernel(self.columns(values))
+        return Evaluation(value=value, gradient=gradient)
+
+    def propagate(
+        self,
+        values: Mapping[str, ArrayLike],
+        uncertainties: Mapping[str, ArrayLike],
+        out: Propagation | None = None,
+    ) -> Propagation:
+        """Evaluate the equation and propagate independent uncertainties to first order.
+
+        When `out` is given (e.g. slices of memory-mapped result files), results
+        are written into its arrays in place and `out` is returned.
+        """
+        evaluation = self.evaluate(values)
+        sigmas = input_columns(self.gradient_names, uncertainties).T
+        if out is None:
+            contributions = (evaluation.gradient * sigmas) ** 2
+            return Propagation(
+                mu=evaluation.value,
+                sigma=np.sqrt(contributions.sum(axis=1)),
+                gradient=evaluation.gradient,
+                contributions=contributions,
+            )
+
+        out.mu[...] = evaluation.value
+        out.gradient[...] = evaluation.gradient
+        np.multiply(evaluation.gradient, sigmas, out=out.contributions)
+        np.square(out.contributions, out=out.contributions)
+        np.sum(out.contributions, axis=1, out=out.sigma)
+        np.sqrt(out.sigma, out=out.sigma)
+        return out
+
+
+def input_columns(names: tuple[str, ...], values: Mapping[str, ArrayLike]) -> NDArray[np.float64]:
+    """Stack inputs for variables `names` into a C-contiguous `(n_vars, rows)` float matrix."""
+    missing = [name for name in names if name not in values]
+    if missing:
+        msg = f"Missing values for variables: {', '.join(missing)}"
+        raise ValueError(msg)
+    arrays = np.broadcast_arrays(*[np.atleast_1d(values[name]) for name in names])
+    if arrays and arrays[0].ndim != 1:
+        msg = "Variable values must be scalars or 1-D arrays."
+        raise ValueError(msg)
+    return np.ascontiguousarray(np.stack(arrays) if arrays else np.empty((0, 1)), np.float64)
+
+
+_compiled_cache: LRUCache[tuple[str, tuple[str, ...], bool, tuple[str, ...]], CompiledEquation] = (
+    LRUCache(DEFAULT_COMPILED_CACHE_SIZE)
+)
+
+
+def compiled_cache_info() -> CacheInfo:
+    """Return hit/miss/wait statistics of the process-wide compiled-equation cache."""
+    return _compiled_cache.info()
+
+
+def set_compiled_cache_size(maxsize: int) -> None:
+    """Bound the process-wide compiled-equation cache to `maxsize` entries (0 disables it)."""
+    _compiled_cache.resize(maxsize)
+
+
+def clear_compiled_cache() -> None:
+    """Drop all cached compiled equations and reset statistics."""
+    _compiled_cache.clear()
+
+
+def compile_equation(
+    equation: Equation,
+    variables: Variables,
+    *,
+    native: bool = False,
+    exact: Collection[str] = (),
+) -> CompiledEquation:
+    """Compile `equation` over `variables` for numeric evaluation.
+
+    With `native=True` the value and gradient are generated as C and built with
+    the system compiler (see `uncertainty_calculator.native`); when that is not
+    possible the NumPy kernel is used instead, as reported by `backend`.
+
+    Variables named in `exact` stay kernel inputs but are not differentiated,
+    so their gradient columns are neither built nor evaluated.
+
+    Compiled equations are cached process-wide by expression, variable names,
+    backend and exact names; concurrent first requests for one key compile it
+    only once.
+    """
+    variables = list(variables)
+    names = tuple(var.name for var in variables)
+    key = (equation.expression, names, native, _exact_names(names, exact))
+    return _compiled_cache.get_or_create(key, lambda: _compile(equation, variables, native, key[3]))
+
+
+def compile_parse_state(
+    parse_state: ParseState, *, native: bool = False, exact: Collection[str] = ()
+) -> CompiledEquation:
+    """Compile an already parsed and validated equation, sharing `compile_equation`'s cache.
+
+    Entries are keyed by the normalized expression source and variable names, so
+    repeated calls (e.g. pruning every run of one formula) reuse one kernel.
+    """
+    names = tuple(symbol.name for symbol in parse_state.symbols)
+    key = (parse_state.expression_tree.source, names, native, _exact_names(names, exact))
+    return _compiled_cache.get_or_create(key, lambda: _compile_parsed(parse_state, native, key[3]))
+
+
+def _exact_names(names: tuple[str, ...], exact: Collection[str]) -> tuple[str, ...]:
+    return tuple(name for name in names if name in exact)
+
+
+def _compile(
+    equation: Equation, variables: Variables, native: bool, exact: tuple[str, ...]
+) -> CompiledEquation:
+    parse_state = parse_inputs(equation, variables)
+    validate_inputs(parse_state)
+    return _compile_parsed(parse_state, native, exact)
+
+
+def _compile_parsed(
+    parse_state: ParseState, native: bool, exact: tuple[str, ...] = ()
+) -> CompiledEquation:
+    differentiated = [symbol for symbol in parse_state.symbols if symbol.name not in exact]
+    gradient = gradient_expressions(parse_state, differentiated)
+    names = tuple(symbol.name for symbol in parse_state.symbols)
+    gradient_names = tuple(symbol.name for symbol in differentiated)
+
+    if native:
+        kernel = build_native_kernel(parse_state.symbols, parse_state.equation_expression, gradient)
+        if kernel is not None:
+            return CompiledEquation(names, kernel, "native", gradient_names)
+
+    kernel = numpy_kernel(parse_state.symbols, parse_state.equation_expression, gradient)
+    return CompiledEquation(names, kernel, "numpy", gradient_names)
+
+
+def gradient_expressions(parse_state: ParseState, symbols: list[Any] | None = None) -> list[Any]:
+    """Return the unsimplified partial derivative with respect to every symbol.
+
+    Only `symbols` are differentiated when given. Variables are real, so they
+    are differentiated as real symbols: `Abs(x)` then gives `sign(x)` instead of
+    an unprintable `Derivative(re(x), x)`.
+    """
+    real = {symbol: Symbol(symbol.name, real=True) for symbol in parse_state.symbols}
+    restore = {alias: symbol for symbol, alias in real.items()}
+    terms_index = terms_by_symbol(parse_state.equation_expression)
+    return [
+        diff(Add(*terms_index[symbol]).xreplace(real), real[symbol]).xreplace(restore)
+        if symbol in terms_index
+        else S.Zero
+        for symbol in (parse_state.symbols if symbols is None else symbols)
+    ]
+
+
+def vectorized_lambdify(symbols: list[Any], expressions: Any, **kwargs: Any) -> Callable[..., Any]:
+    """Lambdify `expressions` into a function accepting NumPy array arguments.
+
+    Functions the NumPy printer leaves undefined (e.g. `polygamma` in the
+    derivative of `gamma`) are evaluated elementwise with `mpmath`; anything
+    else without a numeric implementation raises `ValueError` here rather than
+    on first evaluation.
+    """
+    try:
+        func = lambdify(symbols, expressions, modules=_LAMBDIFY_MODULES, **kwargs)
+    except NotImplementedError as exc:
+        msg = f"No NumPy implementation for the expression: {exc}"
+        raise ValueError(msg) from None
+    namespace = func.__globals__
+    for instruction in dis.get_instructions(func):
+        name = instruction.argval
+        if instruction.opname != "LOAD_GLOBAL" or name in namespace or hasattr(builtins, name):
+            continue
+        function = getattr(mpmath, name, None)
+        if not callable(function):
+            msg = f"No NumPy implementation for function {name!r}."
+            raise ValueError(msg)
+        namespace[name] = _elementwise(function)
+    return func
+
+
+def _elementwise(function: Callable[..., Any]) -> Callable[..., Any]:
+    return np.vectorize(lambda *args: float(function(*args)), otypes=[np.float64])
+
+
+def numpy_kernel(symbols: list[Any], expression: Any, gradient: list[Any]) -> Kernel:
+    """Build a vectorized kernel by lambdifying the value and gradient together."""
+    func = vectorized_lambdify(symbols, [expression, *gradient], cse=True)
+
+    def kernel(columns: NDArray[np.float64]) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        rows = columns.shape[1]
+        outputs = func(*columns)
+        value = np.empty(rows)
+        value[:] = outputs[0]
+        partials = np.empty((rows, len(gradient)))
+        for j, partial in enumerate(outputs[1:]):
+            partials[:, j] = partial
+        return value, partials
+
+    return kernel
@@ -2,33 +2,121 @@
 
 from __future__ import annotations
 
+import math
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
-from sympy import S, diff, simplify, sqrt
+import numpy as np
+from numpy.typing import NDArray
+from sympy import Add, Float, S, diff, simplify, sqrt
 
-from uncertainty_calculator._types import Digits
+from uncertainty_calculator._types import Digits, Equation, Variables
+from uncertainty_calculator.cache import CacheInfo, LRUCache
+from uncertainty_calculator.compiled import compile_equation, compile_parse_state
 from uncertainty_calculator.format import latex_number
 from uncertainty_calculator.parsers import ParseState
+from uncertainty_calculator.structure import closed_form_derivative, terms_by_symbol
+
+DEFAULT_DERIVATIVE_CACHE_SIZE = 256
+
+_derivative_cache: LRUCache[tuple[Any, tuple[Any, ...]], tuple[Any, ...]] = LRUCache(
+    DEFAULT_DERIVATIVE_CACHE_SIZE
+)
+
+
+def derivative_cache_info() -> CacheInfo:
+    """Return hit/miss/wait statistics of the process-wide derivative cache."""
+    return _derivative_cache.info()
+
+
+def set_derivative_cache_size(maxsize: int) -> None:
+    """Bound the process-wide derivative cache to `maxsize` entries (0 disables it)."""
+    _derivative_cache.resize(maxsize)
+
+
+def clear_derivative_cache() -> None:
+    """Drop all cached derivatives and reset statistics."""
+    _derivative_cache.clear()
 
 
 @dataclass
 class ComputeState:
-    """Computed derivatives and final results."""
+    """Computed derivatives and final results.
+
+    With pruning, `pruned` holds the symbols whose contributions were dropped
+    (their `pdv_results` entries carry only the numeric partial) and
+    `sigma_error_bound` the amount by which the reported sigma underestimates
+    the full first-order sigma.
+    """
 
     pdv_results: list[tuple[Any, Any, Any]]
     result_mu: str
     result_sigma: str
+    pruned: frozenset[Any] = frozenset()
+    sigma_error_bound: float = 0.0
+
+    @cached_property
+    def rounded_pdvs(self) -> dict[Any, str]:
+        """LaTeX of every numeric partial rounded to two significant digits.
+
+        Built once and shared by every line and layout that prints a partial.
+        """
+        return {symbol: latex_number(num.evalf(2)) for symbol, _, num in self.pdv_results}
 
 
-def compute(parse_state: ParseState, digits: Digits) -> ComputeState:
-    """Compute partial derivatives and formatted mu/sigma results."""
+@dataclass
+class NumericState:
+    """Float-only results of a numeric compute run.
+
+    Attributes:
+        names: Names of the variables with a non-zero uncertainty, in the order
+            of the per-variable arrays; exact variables are not differentiated.
+        mu: Equation value.
+        sigma: Propagated standard uncertainty.
+        partials: Partial derivative with respect to each named variable.
+        contributions: `(partial * uncertainty)**2` for each named variable.
+
+    """
+
+    names: tuple[str, ...]
+    mu: float
+    sigma: float
+    partials: NDArray[np.float64]
+    contributions: NDArray[np.float64]
+
+
+def compute(
+    parse_state: ParseState, digits: Digits, prune_threshold: float | None = None
+) -> ComputeState:
+    """Compute partial derivatives and formatted mu/sigma results.
+
+    With `prune_threshold`, every contribution `(pdv * sigma)**2` is first
+    estimated from a numeric gradient; variables contributing less than
+    `prune_threshold` (between 0 and 1) times the largest contribution are
+    neither simplified nor included in sigma, and the resulting sigma error is
+    bounded exactly (see `ComputeState.sigma_error_bound`).
+    """
+    if prune_threshold is not None and not 0 <= prune_threshold <= 1:
+        msg = f"prune_threshold must be between 0 and 1 (got {prune_threshold!r})"
+        raise ValueError(msg)
+    uncertain = uncertain_symbols(parse_state)
+    pruned: dict[Any, Any] = {}
+    sigma_error_bound = 0.0
+    if prune_threshold is not None and uncertain:
+        pruned, sigma_error_bound = _prune(parse_state, uncertain, prune_threshold)
+        uncertain = tuple(symbol for symbol in uncertain if symbol not in pruned)
+    pdvs = dict(zip(uncertain, derivatives(parse_state.equation_expression, uncertain)))
+
     pdv_results: list[tuple[Any, Any, Any]] = []
     for symbol in parse_state.symbols:
-        if parse_state.uncertainty_values[symbol]:
-            pdv = simplify(diff(parse_state.equation_expression, symbol))
-            num = pdv.subs(parse_state.output_number)  # type: ignore
+        if symbol in pdvs:
+            pdv = pdvs[symbol]
+            num = _substitute(pdv, parse_state.output_number)
             pdv_results.append((symbol, pdv, num))
+        elif symbol in pruned:
+            pdv_results.append((symbol, pruned[symbol], pruned[symbol]))
         else:
             pdv_results.append((symbol, S.Zero, S.Zero))
 
@@ -36,10 +124,116 @@ def compute(parse_state: ParseState, digits: Digits) -> ComputeState:
         parse_state.equation_expression.evalf(digits.mu, subs=parse_state.output_number)  # type: ignore
     )
 
-    pdv_nums = [res[2] for res in pdv_results]
-    sum_squares = sum(
-        (num * sigma_value) ** 2 for num, sigma_value in zip(pdv_nums, parse_state.input_sigma)
-    )
+    # A single n-ary Add avoids rebuilding the partial sum n times.
+    sum_squares = Add(*[
+        (num * sigma_value) ** 2
+        for (symbol, _, num), sigma_value in zip(pdv_results, parse_state.input_sigma)
+        if symbol not in pruned
+    ])
     result_sigma = latex_number(sqrt(sum_squares).evalf(digits.sigma))  # type: ignore
 
-    return ComputeState(pdv_results=pdv_results, result_mu=result_mu, result_sigma=result_sigma)
+    return ComputeState(
+        pdv_results=pdv_results,
+        result_mu=result_mu,
+        result_sigma=result_sigma,
+        pruned=frozenset(pruned),
+        sigma_error_bound=sigma_error_bound,
+    )
+
+
+def uncertain_symbols(parse_state: ParseState) -> tuple[Any, ...]:
+    """Return the symbols with a non-zero uncertainty, in variable order."""
+    return tuple(symbol for symbol in parse_state.symbols if parse_state.uncertainty_values[symbol])
+
+
+def _prune(
+    parse_state: ParseState, uncertain: tuple[Any, ...], threshold: float
+) -> tuple[dict[Any, Any], float]:
+    """Return the numeric partials of negligible variables and the sigma error bound.
+
+    Formulas the NumPy kernel cannot evaluate (e.g. undefined functions) are
+    left unpruned.
+    """
+    # The cached kernel's unsimplified derivatives are exact when evaluated;
+    # exact variables are not differentiated since they contribute nothing.
+    exact = [symbol.name for symbol in parse_state.symbols if symbol not in uncertain]
+    try:
+        evaluation = compile_parse_state(parse_state, exact=exact).evaluate({
+            symbol.name: float(parse_state.output_number[symbol]) for symbol in parse_state.symbols
+        })
+    except (ArithmeticError, NotImplementedError, TypeError, ValueError):
+        return {}, 0.0
+    partials = dict(zip(uncertain, evaluation.gradient[0]))
+    contributions = {
+        symbol: (partials[symbol] * float(parse_state.uncertainty_values[symbol])) ** 2
+        for symbol in uncertain
+    }
+    total = math.fsum(contributions.values())
+    cutoff = threshold * max(contributions.values())
+    negligible = {symbol for symbol, contribution in contributions.items() if contribution < cutoff}
+    if not negligible or not math.isfinite(total):
+        return {}, 0.0
+
+    dropped = math.fsum(contributions[symbol] for symbol in negligible)
+    kept = total - dropped
+    # sqrt(kept + dropped) - sqrt(kept), written without cancellation.
+    bound = dropped / (math.sqrt(total) + math.sqrt(kept))
+    return {symbol: Float(partials[symbol]) for symbol in negligible}, bound
+
+
+def compute_numeric(equation: Equation, variables: Variables) -> NumericState:
+    """Propagate numerically, retaining no SymPy objects in the result.
+
+    The formula is compiled once into a NumPy kernel. The parse and kernel
+    caches keep the SymPy trees used to build it alive, but the returned
+    `NumericState` holds only floats and small arrays, so long batch runs
+    retain no per-result SymPy objects. Exact (zero-uncertainty) variables are
+    evaluated but not differentiated, so runs sharing the same exact variables
+    share one kernel.
+    """
+    variables = list(variables)
+    exact = [var.name for var in variables if var.uncertainty == 0]
+    compiled = compile_equation(equation, variables, exact=exact)
+    result = compiled.propagate(
+        {var.name: var.value for var in variables},
+        {var.name: var.uncertainty for var in variables},
+    )
+    return NumericState(
+        names=compiled.gradient_names,
+        mu=float(result.mu[0]),
+        sigma=float(result.sigma[0]),
+        partials=result.gradient[0],
+        contributions=result.contributions[0],
+    )
+
+
+def derivatives(expression: Any, symbols: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Return the simplified partial derivatives of `expression` w.r.t. `symbols`.
+
+    Results are shared process-wide; concurrent requests for the same formula
+    wait for a single computation instead of each differentiating it.
+    """
+    return _derivative_cache.get_or_create(
+        (expression, symbols), lambda: _derivatives(expression, symbols)
+    )
+
+
+def _derivatives(expression: Any, symbols: tuple[Any, ...]) -> tuple[Any, ...]:
+    terms_index = terms_by_symbol(expression)
+    return tuple(_derivative(terms_index.get(symbol, []), symbol) for symbol in symbols)
+
+
+def _derivative(terms: list[Any], symbol: Any) -> Any:
+    # Only the terms containing `symbol` contribute, so differentiate just those.
+    # Exact variables stay symbolic: folding them into placeholders changes
+    # which form `simplify` picks, and with it the rendered partials.
+    pdv = closed_form_derivative(terms, symbol)
+    if pdv is None:
+        pdv = simplify(diff(Add(*terms), symbol))
+    return pdv
+
+
+def _substitute(expr: Any, numbers: Mapping[Any, Any]) -> Any:
+    # `subs` walks every pair it is given; restricting the mapping to the free
+    # symbols keeps the cost independent of the total number of variables.
+    return expr.subs({symbol: numbers[symbol] for symbol in expr.free_symbols})
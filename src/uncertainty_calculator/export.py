@@ -0,0 +1,140 @@
+"""Export an equation as a standalone Python module without a SymPy dependency."""
+
+from __future__ import annotations
+
+import keyword
+from pathlib import Path
+from typing import Any, Literal
+
+from sympy import cse, numbered_symbols
+from sympy.printing.numpy import NumPyPrinter
+from sympy.printing.pycode import PythonCodePrinter
+
+from uncertainty_calculator._types import Equation, Variables
+from uncertainty_calculator.compiled import gradient_expressions
+from uncertainty_calculator.compute import derivatives
+from uncertainty_calculator.format import latex_symbol
+from uncertainty_calculator.parsers import ParseState, parse_inputs
+from uncertainty_calculator.validation import validate_inputs
+
+_INDENT = "    "
+# Names the generated functions look up at call time; a parameter with one of
+# these names would shadow it inside `sigma`.
+_GENERATED_NAMES = frozenset({"gradient", "sigma", "sum", "uncertainties", "value", "zip"})
+
+
+def export_module(
+    equation: Equation,
+    variables: Variables,
+    path: str | Path | None = None,
+    *,
+    backend: Literal["math", "numpy"] = "math",
+    include_latex: bool = False,
+) -> str:
+    """Generate (and optionally write to `path`) a module evaluating `equation`.
+
+    The module defines `NAMES`, `UNCERTAINTIES` (the defaults from `variables`)
+    and `value(...)`, `gradient(...)` and `sigma(..., uncertainties=...)`, taking
+    one positional argument per variable in `NAMES` order. With
+    `backend="numpy"` the functions accept arrays; with `"math"` only the
+    standard library is imported. `include_latex` adds pre-rendered LaTeX for
+    the equation and its partial derivatives.
+
+    Raises `ValueError` for functions the chosen backend cannot print, and
+    for functions only available from `math` when `backend="numpy"`, since
+    those would fail on array arguments.
+
+    Output depends only on the inputs, so generated files can be checked in
+    and diffed across regenerations.
+    """
+    variables = list(variables)
+    parse_state = parse_inputs(equation, variables)
+    validate_inputs(parse_state)
+    for symbol in parse_state.symbols:
+        name = symbol.name
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith("_"):
+            msg = f"Variable name {name!r} is not a valid public Python identifier."
+            raise ValueError(msg)
+
+    symbols = tuple(parse_state.symbols)
+    printer: PythonCodePrinter = (
+        NumPyPrinter()
+        if backend == "numpy"
+        else PythonCodePrinter({"fully_qualified_modules": True})
+    )
+    try:
+        value_body = _body([parse_state.equation_expression], printer, tuple_result=False)
+        gradient_body = _body(gradient_expressions(parse_state), printer, tuple_result=True)
+    except NotImplementedError as exc:
+        msg = f"Cannot export {equation.expression!r} with backend {backend!r}: {exc}"
+        raise ValueError(msg) from None
+    if backend == "numpy" and printer.module_imports.get("math"):
+        functions = ", ".join(sorted(printer.module_imports["math"]))
+        msg = f"No NumPy implementation for {functions}; export with backend='math' instead."
+        raise ValueError(msg)
+    modules = sorted({backend, *printer.module_imports})
+
+    reserved = _GENERATED_NAMES | set(modules)
+    for symbol in symbols:
+        if symbol.name in reserved:
+            msg = f"Variable name {symbol.name!r} clashes with a name used by the generated module."
+            raise ValueError(msg)
+
+    signature = ", ".join(symbol.name for symbol in symbols)
+    lines = [
+        f'"""Generated by uncertainty_calculator from {equation.expression!r}; do not edit."""',
+        "",
+        *(f"import {module}" for module in modules),
+        "",
+        f"NAMES = {tuple(symbol.name for symbol in symbols)!r}",
+        f"UNCERTAINTIES = {tuple(var.uncertainty for var in variables)!r}",
+    ]
+    if include_latex:
+        partials = derivatives(parse_state.equation_expression, symbols)
+        lines.extend(_latex_constants(parse_state, partials))
+    lines.extend([
+        "",
+        "",
+        f"def value({signature}):",
+        f'{_INDENT}"""Return the equation value."""',
+        *value_body,
+        "",
+        "",
+        f"def gradient({signature}):",
+        f'{_INDENT}"""Return the partial derivatives, one per name in NAMES."""',
+        *gradient_body,
+        "",
+        "",
+        f"def sigma({signature}, uncertainties=UNCERTAINTIES):",
+        f'{_INDENT}"""Return the first-order propagated standard uncertainty."""',
+        f"{_INDENT}_partials = gradient({signature})",
+        f"{_INDENT}_total = sum((_p * _u) ** 2 for _p, _u in zip(_partials, uncertainties))",
+        f"{_INDENT}return {backend}.sqrt(_total)",
+        "",
+    ])
+    source = "\n".join(lines)
+
+    if path is not None:
+        Path(path).write_text(source)
+    return source
+
+
+def _body(outputs: list[Any], printer: PythonCodePrinter, tuple_result: bool) -> list[str]:
+    temporaries, reduced = cse(outputs, symbols=numbered_symbols("_cse"))
+    lines = [f"{_INDENT}{name} = {printer.doprint(rhs)}" for name, rhs in temporaries]
+    printed = [printer.doprint(expr) for expr in reduced]
+    if tuple_result:
+        items = ", ".join(printed) + ("," if len(printed) == 1 else "")
+        lines.append(f"{_INDENT}return ({items})")
+    else:
+        lines.append(f"{_INDENT}return {printed[0]}")
+    return lines
+
+
+def _latex_constants(parse_state: ParseState, partials: tuple[Any, ...]) -> list[str]:
+    latex_partials = tuple(latex_symbol(pdv, parse_state.output_symbol) for pdv in partials)
+    return [
+        f"LATEX_NAME = {parse_state.equation_latex_name!r}",
+        f"LATEX_EXPRESSION = {latex_symbol(parse_state.equation_expression, parse_state.output_symbol)!r}",
+        f"LATEX_PARTIALS = {latex_partials!r}",
+    ]
@@ -0,0 +1,292 @@
+"""Restricted-grammar expressions parsed with `ast`, evaluated numerically without SymPy.
+
+The grammar covers numbers, variable names, the constants `pi` and `E`,
+`+ - * / ** ^` with unary signs, and function calls. Calls to `FUNCTIONS`
+are evaluated numerically; any other name is resolved symbolically the way
+`sympify` resolves it (a SymPy function such as `erf` or `Max`, or else an
+undefined function). Every identifier is checked against the variable names
+while parsing, so invalid input fails before any SymPy object is built. Conversion to SymPy
+(`ExpressionTree.to_sympy`) happens only when symbolic derivatives or LaTeX
+are needed and reproduces what `sympify` would build for the same string.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from types import CodeType
+from typing import Any
+
+import numpy as np
+import sympy
+
+CONSTANTS = ("pi", "E")
+
+# name -> (accepted argument counts, SymPy function, NumPy function)
+FUNCTIONS: dict[str, tuple[tuple[int, ...], Callable[..., Any], Callable[..., Any]]] = {
+    "sin": ((1,), sympy.sin, np.sin),
+    "cos": ((1,), sympy.cos, np.cos),
+    "tan": ((1,), sympy.tan, np.tan),
+    "asin": ((1,), sympy.asin, np.arcsin),
+    "acos": ((1,), sympy.acos, np.arccos),
+    "atan": ((1,), sympy.atan, np.arctan),
+    "atan2": ((2,), sympy.atan2, np.arctan2),
+    "sinh": ((1,), sympy.sinh, np.sinh),
+    "cosh": ((1,), sympy.cosh, np.cosh),
+    "tanh": ((1,), sympy.tanh, np.tanh),
+    "asinh": ((1,), sympy.asinh, np.arcsinh),
+    "acosh": ((1,), sympy.acosh, np.arccosh),
+    "atanh": ((1,), sympy.atanh, np.arctanh),
+    "exp": ((1,), sympy.exp, np.exp),
+    "log": ((1, 2), sympy.log, lambda x, base=np.e: np.log(x) / np.log(base)),
+    "ln": ((1,), sympy.log, np.log),
+    "sqrt": ((1,), sympy.sqrt, np.sqrt),
+    "Abs": ((1,), sympy.Abs, np.abs),
+    "abs": ((1,), sympy.Abs, np.abs),
+}
+
+# What `sympify` sees for a called name: SymPy's public namespace.
+_SYMPY_NAMESPACE: dict[str, Any] = {name: getattr(sympy, name) for name in sympy.__all__}
+
+NUMPY_NAMESPACE: dict[str, Any] = {
+    "pi": np.pi,
+    "E": np.e,
+    **{name: numeric for name, (_, _, numeric) in FUNCTIONS.items()},
+}
+
+_BINARY_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
+_UNARY_OPERATORS = (ast.UAdd, ast.USub)
+
+
+@dataclass(frozen=True)
+class ExpressionTree:
+    """A validated expression ready for numeric evaluation or SymPy conversion.
+
+    Attributes:
+        source: The expression string, stripped, with `^` written as `**`.
+        names: Variable names referenced by the expression, in order of first use.
+        tree: The validated syntax tree of `source`.
+        functions: Names of the called functions, in order of first use.
+
+    """
+
+    source: str
+    names: tuple[str, ...]
+    tree: ast.Expression
+    functions: tuple[str, ...] = ()
+
+    def evaluate(
+        self, values: Mapping[str, Any], namespace: Mapping[str, Any] = NUMPY_NAMESPACE
+    ) -> Any:
+        """Evaluate with `values` per variable name (scalars or broadcastable arrays).
+
+        `namespace` supplies the constants and functions; the default maps
+        them to NumPy so evaluation is vectorized over array inputs. Other
+        namespaces accept the value types they operate on (e.g. intervals).
+        """
+        missing = [name for name in self.names if name not in values]
+        if missing:
+            msg = f"Missing values for variables: {', '.join(missing)}"
+            raise ValueError(msg)
+        symbolic = [name for name in self.functions if name not in namespace]
+        if symbolic:
+            msg = f"No numeric implementation for functions: {', '.join(symbolic)}"
+            raise ValueError(msg)
+        local = {name: values[name] for name in self.names}
+        # The code object is compiled lazily, so symbolic-only callers never pay for it.
+        return eval(self.code, {"__builtins__": {}, **namespace}, local)
+
+    @cached_property
+    def code(self) -> CodeType:
+        """Bytecode of the tree, with a long top-level sum regrouped as a balanced tree.
+
+        CPython's compiler recurses once per nesting level, so the left-nested
+        chain `t1 + t2 + ... + tn` of a model with thousands of terms would
+        exceed the recursion limit.
+        """
+        terms = [
+            ast.UnaryOp(op=ast.USub(), operand=term) if negate else term
+            for negate, term in _signed_terms(self.tree.body)
+        ]
+        while len(terms) > 1:
+            pairs = [
+                ast.BinOp(left=left, op=ast.Add(), right=right)
+                for left, right in zip(terms[0::2], terms[1::2])
+            ]
+            terms = pairs + terms[len(pairs) * 2 :]
+        body = ast.fix_missing_locations(ast.Expression(body=terms[0]))
+        return compile(body, "<equation>", "eval")
+
+    def to_sympy(self, symbol_map: Mapping[str, Any]) -> Any:
+        """Build the SymPy expression, identical to `sympify(source, locals=symbol_map)`.
+
+        A top-level sum is assembled as one n-ary `Add`; evaluating `t1 + ... + tn`
+        left to right re-flattens and re-sorts the partial sum at every step,
+        which is quadratic in the number of terms.
+        """
+        converter = _SympyConverter(self.source, symbol_map)
+        signed_terms = _signed_terms(self.tree.body)
+        if len(signed_terms) == 1:
+            return converter.convert(signed_terms[0][1])
+
+        terms = []
+        for negate, term_node in signed_terms:
+            term = converter.convert(term_node)
+            # Splice nested sums in place so like terms combine in left-to-right order.
+            terms.extend(sympy.Add.make_args(-term if negate else term))
+        return sympy.Add(*terms)
+
+
+def parse_tree(expression: str, names: tuple[str, ...]) -> ExpressionTree:
+    """Parse and validate `expression` against the variable `names`.
+
+    Raises `ValueError` for syntax errors, constructs outside the grammar,
+    unknown functions, and identifiers that are neither variables nor constants.
+    """
+    # Like `sympify`'s default `convert_xor`, `^` is textually a power operator
+    # (and binds as tightly as `**`); strings are not in the grammar, so a
+    # plain replacement is exact.
+    source = expression.strip().replace("^", "**")
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as exc:
+        msg = f"Invalid equation expression {expression!r}: {exc.msg}"
+        raise ValueError(msg) from None
+
+    defined = set(names)
+    used: dict[str, None] = {}
+    functions: dict[str, None] = {}
+    callees: set[int] = set()
+    # ast.walk is breadth-first, so each call is checked before its callee name.
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if id(node) in callees:
+                continue
+            if node.id in defined:
+                used[node.id] = None
+            elif node.id not in CONSTANTS:
+                msg = f"Symbol '{node.id}' used in equation but not defined in variables."
+                raise ValueError(msg)
+        elif isinstance(node, ast.Call):
+            functions[_check_call(node, defined)] = None
+            callees.add(id(node.func))
+        else:
+            _check_node(node)
+
+    return ExpressionTree(
+        source=source,
+        names=tuple(used),
+        tree=tree,
+        functions=tuple(functions),
+    )
+
+
+def _signed_terms(node: ast.expr) -> list[tuple[bool, ast.expr]]:
+    """Split a top-level `+`/`-` chain into `(negated, term)` pairs, left to right."""
+    signed_terms: list[tuple[bool, ast.expr]] = []
+    while isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        signed_terms.append((isinstance(node.op, ast.Sub), node.right))
+        node = node.left
+    signed_terms.append((False, node))
+    return signed_terms[::-1]
+
+
+def _check_call(node: ast.Call, defined: set[str]) -> str:
+    """Validate a call and return the name of the called function."""
+    if not isinstance(node.func, ast.Name):
+        msg = f"Unsupported function {ast.unparse(node.func)!r} in equation."
+        raise ValueError(msg)
+    name = node.func.id
+    if name in defined:
+        msg = f"Variable {name!r} cannot be called as a function."
+        raise ValueError(msg)
+    if name in FUNCTIONS:
+        arities = FUNCTIONS[name][0]
+        if node.keywords or len(node.args) not in arities:
+            msg = f"{name}() takes {' or '.join(map(str, arities))} positional argument(s)."
+            raise ValueError(msg)
+    elif name in _SYMPY_NAMESPACE and not _is_sympy_function(_SYMPY_NAMESPACE[name]):
+        msg = f"Unsupported function {name!r} in equation."
+        raise ValueError(msg)
+    elif node.keywords:
+        msg = f"{name}() takes positional arguments only."
+        raise ValueError(msg)
+    return name
+
+
+def _is_sympy_function(obj: Any) -> bool:
+    # Mathematical functions (`erf`, `Max`, `cbrt`, ...) live in `sympy.functions`;
+    # this keeps out helpers such as `plot` or `integrate` that `sympify` would run.
+    return isinstance(obj, sympy.FunctionClass) or (
+        callable(obj) and getattr(obj, "__module__", "").startswith("sympy.functions")
+    )
+
+
+def _sympy_function(name: str) -> Any:
+    if name in FUNCTIONS:
+        return FUNCTIONS[name][1]
+    if name in _SYMPY_NAMESPACE:
+        return _SYMPY_NAMESPACE[name]
+    # Like `sympify`, an unknown name followed by arguments is an undefined function.
+    return sympy.Function(name)
+
+
+def _check_node(node: ast.AST) -> None:
+    if isinstance(node, ast.Constant):
+        if type(node.value) not in (int, float):
+            msg = f"Unsupported literal {node.value!r} in equation."
+            raise ValueError(msg)
+    elif isinstance(node, (ast.BinOp, ast.UnaryOp)):
+        if not isinstance(node.op, (*_BINARY_OPERATORS, *_UNARY_OPERATORS)):
+            msg = f"Unsupported operator {type(node.op).__name__} in equation."
+            raise ValueError(msg)
+    elif not isinstance(node, (ast.Expression, ast.Load, *_BINARY_OPERATORS, *_UNARY_OPERATORS)):
+        msg = f"Unsupported syntax {type(node).__name__} in equation."
+        raise ValueError(msg)
+
+
+class _SympyConverter:
+    """Translate a validated tree into SymPy with the same arithmetic `sympify` performs."""
+
+    def __init__(self, source: str, symbol_map: Mapping[str, Any]) -> None:
+        self.symbol_map = symbol_map
+        self.constants = {"pi": sympy.pi, "E": sympy.E}
+        # AST offsets count UTF-8 bytes; float literals are re-read from the
+        # source so their SymPy precision matches `sympify`.
+        self.encoded = source.encode()
+        self.line_starts = [0]
+        for line in self.encoded.splitlines(keepends=True):
+            self.line_starts.append(self.line_starts[-1] + len(line))
+
+    def convert(self, node: ast.expr) -> Any:
+        if isinstance(node, ast.BinOp):
+            left, right = self.convert(node.left), self.convert(node.right)
+            if isinstance(node.op, ast.Add):
+                return left + right
+            if isinstance(node.op, ast.Sub):
+                return left - right
+            if isinstance(node.op, ast.Mult):
+                return left * right
+            if isinstance(node.op, ast.Div):
+                return left / right
+            return left**right
+        if isinstance(node, ast.UnaryOp):
+            operand = self.convert(node.operand)
+            return -operand if isinstance(node.op, ast.USub) else +operand
+        if isinstance(node, ast.Name):
+            if node.id in self.symbol_map:
+                return self.symbol_map[node.id]
+            return self.constants[node.id]
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            function = _sympy_function(node.func.id)
+            return function(*(self.convert(arg) for arg in node.args))
+        if isinstance(node.value, int):  # type: ignore[attr-defined]
+            return sympy.Integer(node.value)  # type: ignore[attr-defined]
+        return sympy.Float(self._literal(node))
+
+    def _literal(self, node: ast.expr) -> str:
+        start = self.line_starts[node.lineno - 1] + node.col_offset
+        end = self.line_starts[node.end_lineno - 1] + node.end_col_offset  # type: ignore[operator]
+        return self.encoded[start:end].decode().replace("_", "")
@@ -0,0 +1,147 @@
+"""Vectorized weighted least-squares fits whose parameters feed the propagation."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from uncertainty_calculator._types import Variable, Variables
+
+
+@dataclass(frozen=True)
+class FitResult:
+    """Weighted polynomial fit of one or many datasets.
+
+    Coefficients are in increasing powers of x (`p0 + p1*x + ...`), so for a
+    linear fit column 0 is the intercept and column 1 the slope.
+
+    Attributes:
+        coefficients: Fitted parameters, shape `(datasets, degree + 1)`.
+        covariance: Parameter covariance, shape `(datasets, degree + 1, degree + 1)`.
+        chi2: Weighted sum of squared residuals, shape `(datasets,)`.
+        dof: Degrees of freedom, points minus parameters.
+
+    """
+
+    coefficients: NDArray[np.float64]
+    covariance: NDArray[np.float64]
+    chi2: NDArray[np.float64]
+    dof: int
+
+    @property
+    def uncertainties(self) -> NDArray[np.float64]:
+        """Standard uncertainty of each parameter, shape `(datasets, degree + 1)`."""
+        return np.sqrt(np.diagonal(self.covariance, axis1=1, axis2=2))
+
+    def variables(
+        self,
+        names: Sequence[str],
+        latex_names: Mapping[str, str] | None = None,
+        dataset: int = 0,
+    ) -> list[Variable]:
+        """Return the parameters of one dataset as `Variable`s named `names`.
+
+        The returned uncertainties are the marginal ones; pass
+        `input_covariance` to the propagation to keep their correlation.
+        """
+        self._check_names(names)
+        latex_names = latex_names or {}
+        return [
+            Variable(
+                name=name,
+                value=float(self.coefficients[dataset, j]),
+                uncertainty=float(self.uncertainties[dataset, j]),
+                latex_name=latex_names.get(name, name),
+            )
+            for j, name in enumerate(names)
+        ]
+
+    def columns(self, names: Sequence[str]) -> dict[str, NDArray[np.float64]]:
+        """Return each parameter across datasets, keyed by `names`, as batch input columns."""
+        self._check_names(names)
+        return {name: self.coefficients[:, j] for j, name in enumerate(names)}
+
+    def input_covariance(self, variables: Variables, names: Sequence[str]) -> NDArray[np.float64]:
+        """Build the `(datasets, n_vars, n_vars)` covariance of `variables` in their order.
+
+        Variables named in `names` take the fit covariance block; every other
+        variable is independent with variance `uncertainty**2`.
+        """
+        self._check_names(names)
+        variables = list(variables)
+        position = {var.name: i for i, var in enumerate(variables)}
+        missing = [name for name in names if name not in position]
+        if missing:
+            msg = f"Fit parameters missing from variables: {', '.join(missing)}"
+            raise ValueError(msg)
+
+        datasets = self.coefficients.shape[0]
+        matrix = np.zeros((datasets, len(variables), len(variables)))
+        matrix[:, range(len(variables)), range(len(variables))] = [
+            var.uncertainty**2 for var in variables
+        ]
+        indices = [position[name] for name in names]
+        rows, columns = np.ix_(indices, indices)
+        matrix[:, rows, columns] = self.covariance
+        return matrix
+
+    def _check_names(self, names: Sequence[str]) -> None:
+        if len(names) != self.coefficients.shape[1]:
+            msg = f"Expected {self.coefficients.shape[1]} parameter names (got {len(names)})."
+            raise ValueError(msg)
+
+
+def polynomial_fit(
+    x: ArrayLike,
+    y: ArrayLike,
+    sigma_y: ArrayLike,
+    degree: int = 1,
+    *,
+    absolute_sigma: bool = True,
+) -> FitResult:
+    """Fit `y = p0 + p1*x + ... + p_degree*x**degree` weighted by `1/sigma_y**2`.
+
+    `x`, `y` and `sigma_y` broadcast to `(datasets, points)` (1-D inputs are
+    one dataset), and every dataset is solved in one batched QR decomposition.
+    With `absolute_sigma=False` the covariance is scaled by the reduced
+    chi-squared, for data whose uncertainties are only known up to a factor.
+    """
+    if not isinstance(degree, int) or degree < 0:
+        msg = f"degree must be a non-negative integer (got {degree!r})"
+        raise ValueError(msg)
+    xs, ys, sigmas = np.broadcast_arrays(
+        *(np.atleast_2d(np.asarray(array, dtype=np.float64)) for array in (x, y, sigma_y))
+    )
+    if xs.ndim != 2:
+        msg = "x, y and sigma_y must be at most 2-D (datasets, points)."
+        raise ValueError(msg)
+    if np.any(sigmas <= 0):
+        msg = "sigma_y must be positive."
+        raise ValueError(msg)
+    n_params = degree + 1
+    dof = xs.shape[1] - n_params
+    if dof < 0 or (dof == 0 and not absolute_sigma):
+        msg = f"Not enough points ({xs.shape[1]}) for a degree-{degree} fit."
+        raise ValueError(msg)
+
+    design = np.power(xs[..., np.newaxis], np.arange(n_params)) / sigmas[..., np.newaxis]
+    targets = ys / sigmas
+    q, r = np.linalg.qr(design)
+    coefficients = np.linalg.solve(r, np.einsum("dpk,dp->dk", q, targets)[..., np.newaxis])[..., 0]
+    r_inv = np.linalg.inv(r)
+    covariance = r_inv @ r_inv.transpose(0, 2, 1)
+    residuals = targets - np.einsum("dpk,dk->dp", design, coefficients)
+    chi2 = np.square(residuals).sum(axis=1)
+    if not absolute_sigma:
+        covariance = covariance * (chi2 / dof)[:, np.newaxis, np.newaxis]
+    return FitResult(coefficients=coefficients, covariance=covariance, chi2=chi2, dof=dof)
+
+
+def linear_fit(
+    x: ArrayLike, y: ArrayLike, sigma_y: ArrayLike, *, absolute_sigma: bool = True
+) -> FitResult:
+    """Fit `y = intercept + slope*x`; see `polynomial_fit`."""
+    return polynomial_fit(x, y, sigma_y, degree=1, absolute_sigma=absolute_sigma)
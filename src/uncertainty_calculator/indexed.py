@@ -0,0 +1,369 @@
+"""Equations over arrays of repeated readings, written with `sum()` and index notation.
+
+An `IndexedVariable` `x` holds N readings and appears in the equation only as
+`x[i]` inside `sum(...)`, e.g. `sum(x[i])/N` for a mean or
+`sqrt(sum((x[i] - sum(x[i])/N)**2)/(N - 1))`; `N` is the number of readings.
+Each sum body is parsed and differentiated once for the generic reading
+`x[i]`, and the outer formula once for each sum as a whole, so the symbolic
+work does not grow with N. By the chain rule the partial derivative for
+reading j is `sum_k dF/dS_k * dg_k/dx[i]` evaluated at `i = j`, which NumPy
+evaluates for all readings at once.
+"""
+
+from __future__ import annotations
+
+import ast
+import math
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+from sympy import Add, Float, S, Sum, Symbol
+
+from uncertainty_calculator._types import Digits, Equation, IndexedVariable, Variable
+from uncertainty_calculator.cache import CacheInfo, LRUCache
+from uncertainty_calculator.compiled import vectorized_lambdify
+from uncertainty_calculator.compute import derivatives
+from uncertainty_calculator.expression import parse_tree
+from uncertainty_calculator.format import latex_number
+
+COUNT = "N"
+"""Name under which equations refer to the number of readings."""
+
+# Identifiers substituted for `sum(...)` calls and `x[i]` readings before the
+# outer formula and the sum bodies are parsed by the restricted grammar.
+_SUM_PREFIX = "_sum"
+_READING_PREFIX = "_reading_"
+
+DEFAULT_LAMBDIFIED_CACHE_SIZE = 256
+
+_lambdified_cache: LRUCache[tuple[Any, tuple[Symbol, ...]], Callable[..., Any]] = LRUCache(
+    DEFAULT_LAMBDIFIED_CACHE_SIZE
+)
+
+
+def lambdified_cache_info() -> CacheInfo:
+    """Return hit/miss/wait statistics of the process-wide indexed evaluation cache."""
+    return _lambdified_cache.info()
+
+
+def set_lambdified_cache_size(maxsize: int) -> None:
+    """Bound the process-wide indexed evaluation cache to `maxsize` entries (0 disables it)."""
+    _lambdified_cache.resize(maxsize)
+
+
+def clear_lambdified_cache() -> None:
+    """Drop all cached indexed evaluation functions and reset statistics."""
+    _lambdified_cache.clear()
+
+
+@dataclass
+class IndexedParseState:
+    """Parsed inputs of an equation over indexed variables.
+
+    Attributes:
+        equation_latex_name: The rendered left-hand symbol.
+        index: The summation index, e.g. `i`.
+        count: The symbol `N` for the number of readings.
+        length: The number of readings.
+        scalars: Symbols of the scalar variables, in variable order.
+        readings: Symbol of the generic reading `x[i]` per indexed variable, in variable order.
+        sums: Placeholder symbol per `sum()` call, standing for its value.
+        expression: The outer formula over `scalars`, `count` and `sums`.
+        bodies: The summand of each `sum()` call, over `scalars`, `count`, `readings`
+            and the sums nested in it (which always come earlier in `sums`).
+        names: Variable name of every scalar and reading symbol.
+        numbers: Value of every scalar (float), reading (array) and `count`.
+        uncertainties: Uncertainty of every scalar (float) and reading (array).
+        output_symbol: LaTeX name of every scalar, reading and `count`.
+        output_value: LaTeX inserted for every scalar and `count` in `insert` mode;
+            readings keep their symbol.
+
+    """
+
+    equation_latex_name: str
+    index: Symbol
+    count: Symbol
+    length: int
+    scalars: list[Symbol]
+    readings: list[Symbol]
+    sums: list[Symbol]
+    expression: Any
+    bodies: list[Any]
+    names: Mapping[Symbol, str]
+    numbers: Mapping[Symbol, Any]
+    uncertainties: Mapping[Symbol, Any]
+    output_symbol: Mapping[Symbol, str]
+    output_value: Mapping[Symbol, str]
+
+    def display(self, expr: Any) -> Any:
+        """Replace the sum placeholders in `expr` by the `Sum`s they stand for."""
+        sums: dict[Symbol, Any] = {}
+        for placeholder, body in zip(self.sums, self.bodies):
+            sums[placeholder] = Sum(body.xreplace(sums), (self.index, 1, self.count))
+        return expr.xreplace(sums)
+
+
+@dataclass
+class IndexedComputeState:
+    """Partial derivatives and propagated results of an indexed equation.
+
+    Attributes:
+        pdv_results: `(symbol, pdv, numeric)` per uncertain variable, in variable
+            order. `symbol` is the generic reading for indexed variables, whose
+            `numeric` partial is an array over the readings; `pdv` is ready to render.
+        mu: Equation value.
+        sigma: Propagated standard uncertainty.
+        contributions: Squared contribution to sigma per variable name, summed
+            over the readings of indexed variables.
+        result_mu: `mu` rounded to `digits.mu` significant digits, as LaTeX.
+        result_sigma: `sigma` rounded to `digits.sigma` significant digits, as LaTeX.
+
+    """
+
+    pdv_results: list[tuple[Symbol, Any, Any]]
+    mu: float
+    sigma: float
+    contributions: dict[str, float]
+    result_mu: str
+    result_sigma: str
+
+
+def parse_indexed(
+    equation: Equation, variables: Iterable[Variable | IndexedVariable]
+) -> IndexedParseState:
+    """Parse an equation whose `sum()` calls range over the readings of indexed variables."""
+    variables = list(variables)
+    scalar_vars = [var for var in variables if isinstance(var, Variable)]
+    indexed_vars = [var for var in variables if isinstance(var, IndexedVariable)]
+    names = [var.name for var in variables]
+    for name in names:
+        if names.count(name) > 1:
+            msg = f"Duplicate variable name detected: {name!r}"
+            raise ValueError(msg)
+        if name == COUNT or name.startswith((_SUM_PREFIX, _READING_PREFIX)):
+            msg = f"Variable name {name!r} is reserved in indexed equations."
+            raise ValueError(msg)
+    if not indexed_vars:
+        msg = "Indexed equations need at least one IndexedVariable."
+        raise ValueError(msg)
+    lengths = {len(var.values) for var in indexed_vars}
+    if len(lengths) > 1:
+        msg = (
+            f"Indexed variables must all have the same number of readings (got {sorted(lengths)})."
+        )
+        raise ValueError(msg)
+    length = lengths.pop()
+
+    source = equation.expression.strip().replace("^", "**")
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as exc:
+        msg = f"Invalid equation expression {equation.expression!r}: {exc.msg}"
+        raise ValueError(msg) from None
+    extractor = _SumExtractor({var.name for var in indexed_vars})
+    outer = extractor.visit(tree)
+    if not extractor.bodies:
+        msg = "Indexed variables must be summed, e.g. sum(x[i])/N."
+        raise ValueError(msg)
+
+    index = Symbol(extractor.index, integer=True)
+    count = Symbol(COUNT)
+    scalars = [Symbol(var.name) for var in scalar_vars]
+    readings = [Symbol(f"{var.name}[{index}]") for var in indexed_vars]
+    sums = [Symbol(f"{_SUM_PREFIX}{k}") for k in range(len(extractor.bodies))]
+    scalar_map = {var.name: symbol for var, symbol in zip(scalar_vars, scalars)}
+    scalar_map[COUNT] = count
+    reading_map = {
+        f"{_READING_PREFIX}{var.name}": symbol for var, symbol in zip(indexed_vars, readings)
+    }
+
+    sum_map = {symbol.name: symbol for symbol in sums}
+    expression = _to_sympy(outer, {**scalar_map, **sum_map})
+    bodies = [
+        _to_sympy(body, {**scalar_map, **reading_map, **sum_map}) for body in extractor.bodies
+    ]
+
+    numbers: dict[Symbol, Any] = {count: length}
+    uncertainties: dict[Symbol, Any] = {}
+    output_symbol: dict[Symbol, str] = {count: COUNT}
+    output_value: dict[Symbol, str] = {count: str(length)}
+    for var, symbol in zip(scalar_vars, scalars):
+        numbers[symbol] = var.value
+        uncertainties[symbol] = var.uncertainty
+        output_symbol[symbol] = var.latex_name.strip()
+        output_value[symbol] = f"\\left({latex_number(Float(var.value))}\\right)"
+    for indexed_var, symbol in zip(indexed_vars, readings):
+        numbers[symbol] = np.array(indexed_var.values)
+        uncertainties[symbol] = np.array(indexed_var.uncertainties)
+        output_symbol[symbol] = output_value[symbol] = (
+            f"{{{indexed_var.latex_name.strip()}}}_{{{index}}}"
+        )
+
+    return IndexedParseState(
+        equation_latex_name=equation.latex_name,
+        index=index,
+        count=count,
+        length=length,
+        scalars=scalars,
+        readings=readings,
+        sums=sums,
+        expression=expression,
+        bodies=bodies,
+        names={
+            **{symbol: var.name for var, symbol in zip(scalar_vars, scalars)},
+            **{symbol: var.name for var, symbol in zip(indexed_vars, readings)},
+        },
+        numbers=numbers,
+        uncertainties=uncertainties,
+        output_symbol=output_symbol,
+        output_value=output_value,
+    )
+
+
+def compute_indexed(parse_state: IndexedParseState, digits: Digits) -> IndexedComputeState:
+    """Differentiate once per formula part and propagate over all readings with NumPy."""
+    length = parse_state.length
+    numbers = dict(parse_state.numbers)
+    for placeholder, body in zip(parse_state.sums, parse_state.bodies):
+        numbers[placeholder] = float(np.sum(_evaluate(body, numbers, length)))
+    mu = float(_evaluate(parse_state.expression, numbers, 1)[0])
+
+    variables = [*parse_state.scalars, *parse_state.readings]
+    uncertain = tuple(
+        symbol for symbol in variables if np.any(parse_state.uncertainties[symbol] != 0)
+    )
+    targets = (*uncertain, *parse_state.sums)
+    outer = dict(zip(targets, derivatives(parse_state.expression, targets)))
+    inner = [dict(zip(targets, derivatives(body, targets))) for body in parse_state.bodies]
+
+    # dF/dS_k through every path, symbolic and numeric. A body only refers to
+    # sums found inside it, which come earlier, so walk the sums backwards.
+    adjoints: list[Any] = [S.Zero] * len(parse_state.sums)
+    adjoint_values = [0.0] * len(parse_state.sums)
+    for k in reversed(range(len(parse_state.sums))):
+        placeholder = parse_state.sums[k]
+        adjoints[k] = outer[placeholder]
+        adjoint_values[k] = float(_evaluate(outer[placeholder], numbers, 1)[0])
+        for m in range(k + 1, len(parse_state.sums)):
+            pdv = inner[m][placeholder]
+            if pdv != 0:
+                adjoints[k] += adjoints[m] * _sum(parse_state, pdv)
+                adjoint_values[k] += adjoint_values[m] * np.sum(_evaluate(pdv, numbers, length))
+
+    pdv_results: list[tuple[Symbol, Any, Any]] = []
+    contributions: dict[str, float] = {}
+    for symbol in uncertain:
+        chained = [
+            (adjoint, value, pdvs[symbol])
+            for adjoint, value, pdvs in zip(adjoints, adjoint_values, inner)
+            if pdvs[symbol] != 0
+        ]
+        num: NDArray[np.float64] | float
+        if symbol in parse_state.readings:
+            # A reading enters only through the sums, once per reading.
+            pdv = Add(*(adjoint * inner_pdv for adjoint, _, inner_pdv in chained))
+            num = np.zeros(length)
+            for _, value, inner_pdv in chained:
+                num += value * _evaluate(inner_pdv, numbers, length)
+        else:
+            pdv = outer[symbol] + Add(
+                *(adjoint * _sum(parse_state, inner_pdv) for adjoint, _, inner_pdv in chained)
+            )
+            num = float(_evaluate(outer[symbol], numbers, 1)[0]) + math.fsum(
+                value * np.sum(_evaluate(inner_pdv, numbers, length))
+                for _, value, inner_pdv in chained
+            )
+        pdv_results.append((symbol, parse_state.display(pdv), num))
+        contributions[parse_state.names[symbol]] = float(
+            np.sum((num * parse_state.uncertainties[symbol]) ** 2)
+        )
+
+    sigma = math.sqrt(math.fsum(contributions.values()))
+    return IndexedComputeState(
+        pdv_results=pdv_results,
+        mu=mu,
+        sigma=sigma,
+        contributions=contributions,
+        result_mu=latex_number(Float(mu).evalf(digits.mu)),
+        result_sigma=latex_number(Float(sigma).evalf(digits.sigma)),
+    )
+
+
+class _SumExtractor(ast.NodeTransformer):
+    """Replace `sum(...)` calls by placeholders and collect their bodies.
+
+    Inside a body every `x[i]` becomes the reading placeholder of `x`; indexed
+    variables anywhere else and mixed index names are rejected. A nested sum
+    is complete over the same index, so it is a single value inside its body.
+    """
+
+    def __init__(self, indexed: set[str]) -> None:
+        self.indexed = indexed
+        self.bodies: list[ast.Expression] = []
+        self.index: str | None = None
+        self._in_sum = False
+        self._readings = 0
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if not (isinstance(node.func, ast.Name) and node.func.id == "sum"):
+            return self.generic_visit(node)
+        if node.keywords or len(node.args) != 1:
+            msg = "sum() takes 1 positional argument(s)."
+            raise ValueError(msg)
+        # An inner sum is complete before the outer body is, so it gets the lower number.
+        in_sum, readings = self._in_sum, self._readings
+        self._in_sum, self._readings = True, 0
+        body = self.visit(node.args[0])
+        if not self._readings:
+            msg = f"sum({ast.unparse(node.args[0])}) does not reference any indexed variable."
+            raise ValueError(msg)
+        self._in_sum, self._readings = in_sum, readings + self._readings
+        self.bodies.append(ast.Expression(body=body))
+        return ast.Name(id=f"{_SUM_PREFIX}{len(self.bodies) - 1}", ctx=ast.Load())
+
+    def visit_Subscript(self, node: ast.Subscript) -> ast.AST:
+        if not (
+            isinstance(node.value, ast.Name)
+            and node.value.id in self.indexed
+            and isinstance(node.slice, ast.Name)
+        ):
+            msg = f"Unsupported subscript {ast.unparse(node)!r}; write x[i] for an indexed x."
+            raise ValueError(msg)
+        if not self._in_sum:
+            msg = f"Indexed variable {node.value.id!r} can only be used inside sum()."
+            raise ValueError(msg)
+        if self.index not in (None, node.slice.id):
+            msg = f"All sums must use the same index (got {self.index!r} and {node.slice.id!r})."
+            raise ValueError(msg)
+        self.index = node.slice.id
+        self._readings += 1
+        return ast.Name(id=f"{_READING_PREFIX}{node.value.id}", ctx=ast.Load())
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id in self.indexed:
+            msg = f"Indexed variable {node.id!r} must be subscripted, e.g. {node.id}[i]."
+            raise ValueError(msg)
+        return node
+
+
+def _to_sympy(tree: ast.Expression, symbol_map: Mapping[str, Symbol]) -> Any:
+    # Re-parse through the restricted grammar, which also rejects unknown names.
+    source = ast.unparse(ast.fix_missing_locations(tree))
+    return parse_tree(source, tuple(symbol_map)).to_sympy(symbol_map)
+
+
+def _sum(parse_state: IndexedParseState, summand: Any) -> Any:
+    return Sum(summand, (parse_state.index, 1, parse_state.count))
+
+
+def _evaluate(expr: Any, numbers: Mapping[Symbol, Any], rows: int) -> NDArray[np.float64]:
+    """Evaluate `expr` with NumPy, broadcast to `rows` values."""
+    symbols = tuple(sorted(expr.free_symbols & numbers.keys(), key=str))
+    func = _lambdified_cache.get_or_create(
+        (expr, symbols), lambda: vectorized_lambdify(list(symbols), expr)
+    )
+    value = func(*(numbers[symbol] for symbol in symbols))
+    return np.broadcast_to(np.asarray(value, dtype=np.float64), (rows,))
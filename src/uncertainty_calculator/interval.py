@@ -0,0 +1,378 @@
+"""Worst-case bounds by interval arithmetic with outward rounding.
+
+Each variable is taken as `[value - k*uncertainty, value + k*uncertainty]` and
+the validated expression tree is evaluated with `Interval` operands, so the
+result encloses every value the equation takes over the input box. Interval
+endpoints are NumPy arrays and every operation is vectorized, so one call
+bounds a whole batch of rows.
+
+After every operation the lower endpoint is moved down and the upper endpoint
+up by at least one unit in the last place. IEEE arithmetic and `sqrt` are
+correctly rounded, so one step suffices for them; libm functions are widened
+by `LIBM_ULPS`. Decimal literals such as `0.1` are widened as well, since
+their binary value is only the nearest double. Rows whose input box leaves the
+domain of a function (e.g. `sqrt` of a possibly negative value) yield NaN
+endpoints.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from uncertainty_calculator.expression import ExpressionTree
+from uncertainty_calculator.parsers import ParseState
+
+LIBM_ULPS = 2
+
+type Bound = NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class Interval:
+    """Closed intervals `[lower, upper]`, one per element of the endpoint arrays.
+
+    Attributes:
+        lower: Lower endpoints.
+        upper: Upper endpoints (broadcast-compatible with `lower`).
+
+    """
+
+    lower: Bound
+    upper: Bound
+
+    def __post_init__(self) -> None:
+        """Store the endpoints as float arrays."""
+        object.__setattr__(self, "lower", np.asarray(self.lower, dtype=np.float64))
+        object.__setattr__(self, "upper", np.asarray(self.upper, dtype=np.float64))
+
+    @classmethod
+    def from_uncertainty(
+        cls, value: ArrayLike, uncertainty: ArrayLike, coverage_factor: float = 1.0
+    ) -> Interval:
+        """Return `[value - k*uncertainty, value + k*uncertainty]`, rounded outward."""
+        if coverage_factor < 0:
+            msg = f"coverage_factor must be non-negative (got {coverage_factor})"
+            raise ValueError(msg)
+        value = np.asarray(value, dtype=np.float64)
+        half_width = _up(coverage_factor * np.abs(np.asarray(uncertainty, dtype=np.float64)))
+        return cls(_down(value - half_width), _up(value + half_width))
+
+    @property
+    def width(self) -> Bound:
+        """Upper minus lower endpoint (rounded up)."""
+        return _up(self.upper - self.lower)
+
+    def contains(self, value: ArrayLike) -> NDArray[np.bool_]:
+        """Return whether each interval contains `value`."""
+        x = np.asarray(value, dtype=np.float64)
+        return (self.lower <= x) & (x <= self.upper)
+
+    def __add__(self, other: Any) -> Interval:
+        """Interval sum."""
+        other = _coerce(other)
+        return Interval(_down(self.lower + other.lower), _up(self.upper + other.upper))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> Interval:
+        """Interval difference."""
+        other = _coerce(other)
+        return Interval(_down(self.lower - other.upper), _up(self.upper - other.lower))
+
+    def __rsub__(self, other: Any) -> Interval:
+        """Interval difference with a plain number on the left."""
+        return _coerce(other) - self
+
+    def __mul__(self, other: Any) -> Interval:
+        """Interval product."""
+        other = _coerce(other)
+        with np.errstate(invalid="ignore"):
+            products = _corners(np.multiply, self, other)
+        # 0 * inf is 0 for the enclosure, not an undefined value.
+        products = np.where(np.isnan(products), 0.0, products)
+        undefined = _undefined(self, other)
+        return _enclose(products.min(axis=0), products.max(axis=0), undefined, ulps=1)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Any) -> Interval:
+        """Interval quotient; unbounded when the divisor contains zero."""
+        other = _coerce(other)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quotients = _corners(np.divide, self, other)
+        unbounded = ((other.lower <= 0) & (other.upper >= 0)) | np.isnan(quotients).any(axis=0)
+        lower = np.where(unbounded, -np.inf, quotients.min(axis=0))
+        upper = np.where(unbounded, np.inf, quotients.max(axis=0))
+        return _enclose(lower, upper, _undefined(self, other), ulps=1)
+
+    def __rtruediv__(self, other: Any) -> Interval:
+        """Interval quotient with a plain number on the left."""
+        return _coerce(other) / self
+
+    def __pow__(self, other: Any) -> Interval:
+        """Interval power (any base for integer exponents, otherwise non-negative bases)."""
+        return _power(self, _coerce(other))
+
+    def __rpow__(self, other: Any) -> Interval:
+        """Interval power with a plain number as the base."""
+        return _power(_coerce(other), self)
+
+    def __neg__(self) -> Interval:
+        """Negated interval (exact)."""
+        return Interval(-self.upper, -self.lower)
+
+    def __pos__(self) -> Interval:
+        """Return the interval unchanged."""
+        return self
+
+
+def propagate_bounds(
+    tree: ExpressionTree,
+    values: Mapping[str, ArrayLike],
+    uncertainties: Mapping[str, ArrayLike],
+    coverage_factor: float = 1.0,
+) -> Interval:
+    """Bound `tree` with each variable in `value +/- coverage_factor * uncertainty`.
+
+    Values and uncertainties are scalars or broadcastable arrays per variable
+    name; the result has the broadcast shape.
+    """
+    boxes = {
+        name: Interval.from_uncertainty(values[name], uncertainties[name], coverage_factor)
+        for name in tree.names
+    }
+    return _coerce(tree.evaluate(boxes, INTERVAL_NAMESPACE))
+
+
+def parse_state_bounds(parse_state: ParseState, coverage_factor: float = 1.0) -> Interval:
+    """Bound the parsed equation at its variables' values, reusing the parsed tree."""
+    values = {
+        str(symbol): float(parse_state.output_number[symbol]) for symbol in parse_state.symbols
+    }
+    uncertainties = {
+        str(symbol): float(parse_state.uncertainty_values[symbol]) for symbol in parse_state.symbols
+    }
+    return propagate_bounds(parse_state.expression_tree, values, uncertainties, coverage_factor)
+
+
+def outward_decimal(lower: float, upper: float, digits: int) -> tuple[Decimal, Decimal]:
+    """Round `[lower, upper]` outward to `digits` significant digits of its larger endpoint.
+
+    An infinite endpoint is kept as is and the finite one is rounded on its own scale.
+    """
+    if math.isnan(lower) or math.isnan(upper):
+        msg = "Interval bounds are undefined: the input ranges leave the equation's domain."
+        raise ValueError(msg)
+    magnitude = max((abs(bound) for bound in (lower, upper) if math.isfinite(bound)), default=0.0)
+    if magnitude == 0:
+        return Decimal(lower), Decimal(upper)
+    quantum = Decimal(1).scaleb(math.floor(math.log10(magnitude)) - digits + 1)
+    return (
+        _quantize(Decimal(lower), quantum, ROUND_FLOOR),
+        _quantize(Decimal(upper), quantum, ROUND_CEILING),
+    )
+
+
+def _quantize(bound: Decimal, quantum: Decimal, rounding: str) -> Decimal:
+    return bound if bound.is_infinite() else bound.quantize(quantum, rounding=rounding)
+
+
+def _down(value: ArrayLike, ulps: int = 1) -> Bound:
+    x = np.asarray(value, dtype=np.float64)
+    for _ in range(ulps):
+        x = np.nextafter(x, -np.inf)
+    return x
+
+
+def _up(value: ArrayLike, ulps: int = 1) -> Bound:
+    x = np.asarray(value, dtype=np.float64)
+    for _ in range(ulps):
+        x = np.nextafter(x, np.inf)
+    return x
+
+
+def _coerce(value: Any) -> Interval:
+    if isinstance(value, Interval):
+        return value
+    x = np.asarray(value, dtype=np.float64)
+    exact = ~np.isfinite(x) | (x == np.round(x))
+    return Interval(np.where(exact, x, _down(x)), np.where(exact, x, _up(x)))
+
+
+def _undefined(*intervals: Interval) -> NDArray[np.bool_]:
+    undefined = np.zeros((), dtype=bool)
+    for interval in intervals:
+        undefined = undefined | np.isnan(interval.lower) | np.isnan(interval.upper)
+    return undefined
+
+
+def _enclose(lower: Bound, upper: Bound, undefined: NDArray[np.bool_], ulps: int) -> Interval:
+    return Interval(
+        np.where(undefined, np.nan, _down(lower, ulps)),
+        np.where(undefined, np.nan, _up(upper, ulps)),
+    )
+
+
+def _corners(op: Callable[..., Bound], a: Interval, b: Interval) -> NDArray[np.float64]:
+    return np.stack(
+        np.broadcast_arrays(
+            op(a.lower, b.lower), op(a.lower, b.upper), op(a.upper, b.lower), op(a.upper, b.upper)
+        )
+    )
+
+
+def _abs_range(x: Interval) -> tuple[Bound, Bound]:
+    """Smallest and largest `|x|` over each interval."""
+    contains_zero = (x.lower <= 0) & (x.upper >= 0)
+    smallest = np.where(contains_zero, 0.0, np.minimum(np.abs(x.lower), np.abs(x.upper)))
+    return smallest, np.maximum(np.abs(x.lower), np.abs(x.upper))
+
+
+def _power(base: Interval, exponent: Interval) -> Interval:
+    if exponent.lower.ndim == 0 and exponent.lower == exponent.upper:
+        n = float(exponent.lower)
+        if n.is_integer():
+            return _integer_power(base, int(n))
+    # x**y is monotonic in each argument for x >= 0, so the corners bound it.
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        values = _corners(np.power, base, exponent)
+    outside = base.lower < 0
+    return _enclose(
+        values.min(axis=0), values.max(axis=0), outside | _undefined(base, exponent), LIBM_ULPS
+    )
+
+
+def _integer_power(base: Interval, n: int) -> Interval:
+    if n == 0:
+        return Interval(np.ones_like(base.lower), np.ones_like(base.upper))
+    if n < 0:
+        return 1 / _integer_power(base, -n)
+    with np.errstate(over="ignore"):
+        if n % 2:
+            lower, upper = base.lower**n, base.upper**n
+            return _enclose(lower, upper, _undefined(base), LIBM_ULPS if n > 1 else 1)
+        smallest, largest = _abs_range(base)
+        enclosed = _enclose(smallest**n, largest**n, _undefined(base), LIBM_ULPS if n > 2 else 1)
+    # Even powers are never negative; keep an exact zero instead of rounding below it.
+    return Interval(np.maximum(enclosed.lower, 0.0), enclosed.upper)
+
+
+def _monotonic(
+    function: Callable[[Bound], Bound],
+    increasing: bool = True,
+    domain: tuple[float, float] = (-np.inf, np.inf),
+    ulps: int = LIBM_ULPS,
+) -> Callable[[Any], Interval]:
+    def apply(x: Any) -> Interval:
+        x = _coerce(x)
+        outside = (x.lower < domain[0]) | (x.upper > domain[1]) | _undefined(x)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            lower, upper = function(x.lower), function(x.upper)
+        if not increasing:
+            lower, upper = upper, lower
+        return _enclose(lower, upper, outside, ulps)
+
+    return apply
+
+
+def _hits(x: Interval, point: float, period: float) -> NDArray[np.bool_]:
+    """Whether each interval contains `point + k*period` for some integer k.
+
+    A relative slack errs towards containing the point, which only widens bounds.
+    """
+    first, last = (x.lower - point) / period, (x.upper - point) / period
+    slack = 1e-9 * np.maximum(1.0, np.maximum(np.abs(first), np.abs(last)))
+    return np.ceil(first - slack) <= np.floor(last + slack)
+
+
+def _periodic(
+    function: Callable[[Bound], Bound], peak: float, trough: float
+) -> Callable[[Any], Interval]:
+    def apply(x: Any) -> Interval:
+        x = _coerce(x)
+        ends = np.stack(np.broadcast_arrays(function(x.lower), function(x.upper)))
+        lower = np.where(_hits(x, trough, 2 * np.pi), -1.0, ends.min(axis=0))
+        upper = np.where(_hits(x, peak, 2 * np.pi), 1.0, ends.max(axis=0))
+        infinite = ~(np.isfinite(x.lower) & np.isfinite(x.upper))
+        enclosed = _enclose(lower, upper, _undefined(x), LIBM_ULPS)
+        return Interval(
+            np.where(infinite, -1.0, np.maximum(enclosed.lower, -1.0)),
+            np.where(infinite, 1.0, np.minimum(enclosed.upper, 1.0)),
+        )
+
+    return apply
+
+
+def _tan(x: Any) -> Interval:
+    x = _coerce(x)
+    pole = _hits(x, np.pi / 2, np.pi) | ~(np.isfinite(x.lower) & np.isfinite(x.upper))
+    enclosed = _enclose(np.tan(x.lower), np.tan(x.upper), _undefined(x), LIBM_ULPS)
+    return Interval(np.where(pole, -np.inf, enclosed.lower), np.where(pole, np.inf, enclosed.upper))
+
+
+def _cosh(x: Any) -> Interval:
+    x = _coerce(x)
+    smallest, largest = _abs_range(x)
+    with np.errstate(over="ignore"):
+        return _enclose(np.cosh(smallest), np.cosh(largest), _undefined(x), LIBM_ULPS)
+
+
+def _abs(x: Any) -> Interval:
+    x = _coerce(x)
+    smallest, largest = _abs_range(x)
+    return Interval(smallest, largest)
+
+
+def _atan2(y: Any, x: Any) -> Interval:
+    y, x = _coerce(y), _coerce(x)
+    # Away from the origin and the branch cut along the negative x axis the
+    # angle is continuous and monotonic along each box edge, so the corners
+    # bound it; otherwise it takes every value in [-pi, pi].
+    around_origin = (x.lower <= 0) & (x.upper >= 0) & (y.lower <= 0) & (y.upper >= 0)
+    across_cut = (x.lower < 0) & (y.lower < 0) & (y.upper >= 0)
+    angles = _corners(np.arctan2, y, x)
+    full = around_origin | across_cut
+    enclosed = _enclose(angles.min(axis=0), angles.max(axis=0), _undefined(x, y), LIBM_ULPS)
+    return Interval(
+        np.where(full, _down(-np.pi), enclosed.lower), np.where(full, _up(np.pi), enclosed.upper)
+    )
+
+
+def _log(x: Any, base: Any = None) -> Interval:
+    natural = _ln(x)
+    return natural if base is None else natural / _ln(base)
+
+
+_ln = _monotonic(np.log, domain=(0.0, np.inf))
+
+INTERVAL_NAMESPACE: dict[str, Any] = {
+    "pi": Interval(_down(np.pi), _up(np.pi)),
+    "E": Interval(_down(np.e), _up(np.e)),
+    "sin": _periodic(np.sin, peak=np.pi / 2, trough=-np.pi / 2),
+    "cos": _periodic(np.cos, peak=0.0, trough=np.pi),
+    "tan": _tan,
+    "asin": _monotonic(np.arcsin, domain=(-1.0, 1.0)),
+    "acos": _monotonic(np.arccos, increasing=False, domain=(-1.0, 1.0)),
+    "atan": _monotonic(np.arctan),
+    "atan2": _atan2,
+    "sinh": _monotonic(np.sinh),
+    "cosh": _cosh,
+    "tanh": _monotonic(np.tanh),
+    "asinh": _monotonic(np.arcsinh),
+    "acosh": _monotonic(np.arccosh, domain=(1.0, np.inf)),
+    "atanh": _monotonic(np.arctanh, domain=(-1.0, 1.0)),
+    "exp": _monotonic(np.exp),
+    "log": _log,
+    "ln": _ln,
+    "sqrt": _monotonic(np.sqrt, domain=(0.0, np.inf), ulps=1),
+    "Abs": _abs,
+    "abs": _abs,
+}
+"""Constants and functions of the expression grammar over `Interval`s."""
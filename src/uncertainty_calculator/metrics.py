@@ -0,0 +1,274 @@
+"""Process-wide metrics: counters, gauges, latency histograms and cache statistics.
+
+Metrics are disabled by default. While disabled every recording call returns
+after one attribute check, and `time` hands out a shared no-op context
+manager, so instrumented code paths cost next to nothing. Cache statistics
+are pulled from the caches only when a snapshot is taken.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import math
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+from uncertainty_calculator.cache import CacheInfo
+from uncertainty_calculator.compiled import compiled_cache_info
+from uncertainty_calculator.compute import derivative_cache_info
+from uncertainty_calculator.indexed import lambdified_cache_info
+from uncertainty_calculator.multi import compiled_equations_cache_info
+from uncertainty_calculator.parsers import parse_cache_info
+from uncertainty_calculator.sympy_cache import sympy_cache_info
+
+PREFIX = "uncertainty_calculator_"
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+type Labels = tuple[tuple[str, str], ...]
+type MetricKey = tuple[str, Labels]
+type Sample = tuple[Literal["counter", "gauge"], str, Labels, float]
+"""A pulled sample: metric kind, name, labels and value."""
+type Collector = Callable[[], Iterable[Sample]]
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Observations of one histogram.
+
+    Attributes:
+        buckets: Upper bounds of the finite buckets.
+        counts: Observations per bucket (not cumulative), plus a final `+Inf` bucket.
+        sum: Sum of all observed values.
+        count: Number of observations.
+
+    """
+
+    buckets: tuple[float, ...]
+    counts: tuple[int, ...]
+    sum: float
+    count: int
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of every metric, keyed by `(name, labels)`."""
+
+    counters: dict[MetricKey, float]
+    gauges: dict[MetricKey, float]
+    histograms: dict[MetricKey, HistogramSnapshot]
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self.buckets, tuple(self.counts), self.sum, self.count)
+
+
+class MetricsRegistry:
+    """Thread-safe store of counters, gauges and histograms with pull collectors."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Create a disabled registry whose histograms use `buckets` (seconds)."""
+        self.enabled = False
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: dict[MetricKey, float] = {}
+        self._gauges: dict[MetricKey, float] = {}
+        self._histograms: dict[MetricKey, _Histogram] = {}
+        self._collectors: list[Collector] = []
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Add `amount` to a counter."""
+        if not self.enabled:
+            return
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge to `value`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[name, _labels(labels)] = value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record one observation (e.g. a latency in seconds) in a histogram."""
+        if not self.enabled:
+            return
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def time(self, name: str, **labels: str) -> contextlib.AbstractContextManager[None]:
+        """Return a context manager observing its wall time in histogram `name`."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(name, labels)
+
+    def register_collector(self, collector: Collector) -> None:
+        """Add a callable whose samples are pulled at every snapshot."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Copy all recorded metrics and pull the registered collectors."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = {key: hist.snapshot() for key, hist in self._histograms.items()}
+            collectors = list(self._collectors)
+        for collector in collectors:
+            for kind, name, labels, value in collector():
+                (counters if kind == "counter" else gauges)[name, labels] = value
+        return MetricsSnapshot(counters=counters, gauges=gauges, histograms=histograms)
+
+    def reset(self) -> None:
+        """Drop recorded values (collectors stay registered)."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render a snapshot in the Prometheus text exposition format."""
+        return format_prometheus(self.snapshot())
+
+    def write_prometheus(self, path: str | Path) -> None:
+        """Atomically write the Prometheus text to `path` (e.g. for a textfile collector)."""
+        path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as handle:
+            handle.write(self.to_prometheus())
+        Path(tmp_name).replace(path)
+
+    @contextlib.contextmanager
+    def _timer(self, name: str, labels: dict[str, str]) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+def format_prometheus(snapshot: MetricsSnapshot) -> str:
+    """Format `snapshot` as Prometheus text, prefixing every name with `PREFIX`."""
+    lines: list[str] = []
+    for kind, values in (("counter", snapshot.counters), ("gauge", snapshot.gauges)):
+        for name, group in _grouped(values):
+            lines.append(f"# TYPE {PREFIX}{name} {kind}")
+            lines.extend(
+                f"{PREFIX}{name}{_format_labels(labels)} {_format_value(value)}"
+                for labels, value in group
+            )
+    for name, histograms in _grouped(snapshot.histograms):
+        lines.append(f"# TYPE {PREFIX}{name} histogram")
+        for labels, histogram in histograms:
+            cumulative = 0
+            bounds = [*map(_format_value, histogram.buckets), "+Inf"]
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                bucket_labels = _format_labels((*labels, ("le", bound)))
+                lines.append(f"{PREFIX}{name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{PREFIX}{name}_sum{_format_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{PREFIX}{name}_count{_format_labels(labels)} {histogram.count}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def cache_collector(cache: str, info: Callable[[], CacheInfo]) -> Collector:
+    """Return a collector exposing `info()` as `cache_*` metrics labelled `cache=<cache>`."""
+
+    def collect() -> Iterator[Sample]:
+        stats = info()
+        labels = (("cache", cache),)
+        yield "counter", "cache_hits_total", labels, stats.hits
+        yield "counter", "cache_misses_total", labels, stats.misses
+        yield "counter", "cache_waits_total", labels, stats.waits
+        yield "counter", "cache_evictions_total", labels, stats.evictions
+        yield "gauge", "cache_entries", labels, stats.currsize
+        yield "gauge", "cache_max_entries", labels, stats.maxsize
+
+    return collect
+
+
+def sympy_cache_collector() -> Iterator[Sample]:
+    """Expose SymPy's global caches as `sympy_cache_*` metrics."""
+    stats = sympy_cache_info()
+    yield "gauge", "sympy_cache_entries", (), stats.entries
+    yield "gauge", "sympy_cache_functions", (), stats.functions
+    yield "counter", "sympy_cache_clears_total", (), stats.clears
+
+
+REGISTRY = MetricsRegistry()
+"""The process-wide registry used by the calculator's instrumentation."""
+
+for _name, _info in (
+    ("parse", parse_cache_info),
+    ("derivative", derivative_cache_info),
+    ("compiled", compiled_cache_info),
+    ("compiled_equations", compiled_equations_cache_info),
+    ("indexed", lambdified_cache_info),
+):
+    REGISTRY.register_collector(cache_collector(_name, _info))
+REGISTRY.register_collector(sympy_cache_collector)
+
+
+def enable_metrics() -> None:
+    """Start recording metrics in `REGISTRY`."""
+    REGISTRY.enabled = True
+
+
+def disable_metrics() -> None:
+    """Stop recording metrics; values recorded so far are kept."""
+    REGISTRY.enabled = False
+
+
+def _labels(labels: dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _grouped[T](values: dict[MetricKey, T]) -> Iterator[tuple[str, list[tuple[Labels, T]]]]:
+    groups: dict[str, list[tuple[Labels, T]]] = {}
+    for (name, labels), value in sorted(values.items()):
+        groups.setdefault(name, []).append((labels, value))
+    yield from groups.items()
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    pairs = [f'{key}="{_escape(value)}"' for key, value in labels]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value) or not float(value).is_integer():
+        return repr(float(value)).replace("nan", "NaN")
+    return str(int(value))
@@ -0,0 +1,254 @@
+"""Several equations over shared variables, with a joint Jacobian and output covariance."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from uncertainty_calculator._types import Digits, Equations, Variables
+from uncertainty_calculator.cache import CacheInfo, LRUCache
+from uncertainty_calculator.compiled import (
+    gradient_expressions,
+    input_columns,
+    vectorized_lambdify,
+)
+from uncertainty_calculator.compute import compute
+from uncertainty_calculator.parsers import ParseState, parse_inputs
+from uncertainty_calculator.render import RenderOptions, render_output
+from uncertainty_calculator.validation import validate_inputs
+
+DEFAULT_COMPILED_EQUATIONS_CACHE_SIZE = 64
+
+type JacobianKernel = Callable[
+    [NDArray[np.float64]], tuple[NDArray[np.float64], NDArray[np.float64]]
+]
+"""Maps an `(n_vars, rows)` input matrix to `(values[rows, n_out], jacobian[rows, n_out, n_vars])`."""
+
+
+@dataclass(frozen=True)
+class MultiEvaluation:
+    """Values and Jacobian of several equations over one or many input rows."""
+
+    value: NDArray[np.float64]
+    jacobian: NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class MultiPropagation:
+    """First-order propagated covariance of several outputs over one or many input rows.
+
+    Attributes:
+        mu: Output values, shape `(rows, n_out)`.
+        sigma: Standard uncertainty of each output, shape `(rows, n_out)`.
+        jacobian: Partial derivatives, shape `(rows, n_out, n_vars)`.
+        covariance: Output covariance `J @ cov_in @ J.T`, shape `(rows, n_out, n_out)`.
+
+    """
+
+    mu: NDArray[np.float64]
+    sigma: NDArray[np.float64]
+    jacobian: NDArray[np.float64]
+    covariance: NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class MultiOutput:
+    """Rendered LaTeX per output together with the joint numeric result.
+
+    Attributes:
+        latex: One rendered block per equation, in output order.
+        mu: Output values, shape `(n_out,)`.
+        sigma: Standard uncertainty of each output, shape `(n_out,)`.
+        covariance: Output covariance matrix, shape `(n_out, n_out)`.
+
+    """
+
+    latex: tuple[str, ...]
+    mu: NDArray[np.float64]
+    sigma: NDArray[np.float64]
+    covariance: NDArray[np.float64]
+
+
+class CompiledEquations:
+    """Several equations compiled to one kernel returning values and the full Jacobian.
+
+    Inputs follow `CompiledEquation`: scalars or 1-D arrays per variable name,
+    broadcast to a common number of rows.
+    """
+
+    def __init__(
+        self, names: tuple[str, ...], outputs: tuple[str, ...], kernel: JacobianKernel
+    ) -> None:
+        """Wrap a kernel over variables `names` producing the outputs named `outputs`."""
+        self.names = names
+        self.outputs = outputs
+        self.kernel = kernel
+
+    def evaluate(self, values: Mapping[str, ArrayLike]) -> MultiEvaluation:
+        """Evaluate every output and its gradient."""
+        value, jacobian = self.kernel(input_columns(self.names, values))
+        return MultiEvaluation(value=value, jacobian=jacobian)
+
+    def propagate(
+        self,
+        values: Mapping[str, ArrayLike],
+        uncertainties: Mapping[str, ArrayLike] | None = None,
+        covariance: ArrayLike | None = None,
+    ) -> MultiPropagation:
+        """Propagate input uncertainties to the full output covariance matrix.
+
+        Give either independent `uncertainties` per variable name, or an input
+        `covariance` of shape `(n_vars, n_vars)` (or `(rows, n_vars, n_vars)`)
+        in `names` order for correlated inputs.
+        """
+        return _propagate(self.names, self.evaluate(values), uncertainties, covariance)
+
+
+def _propagate(
+    names: tuple[str, ...],
+    evaluation: MultiEvaluation,
+    uncertainties: Mapping[str, ArrayLike] | None,
+    covariance: ArrayLike | None,
+) -> MultiPropagation:
+    if (uncertainties is None) == (covariance is None):
+        msg = "Give exactly one of uncertainties or covariance."
+        raise ValueError(msg)
+
+    jacobian = evaluation.jacobian
+    if uncertainties is not None:
+        variances = input_columns(names, uncertainties).T ** 2
+        weighted = jacobian * variances[:, np.newaxis, :]
+    else:
+        matrix = np.asarray(covariance, dtype=np.float64)
+        n_vars = len(names)
+        if matrix.shape[-2:] != (n_vars, n_vars):
+            msg = f"Input covariance must have shape (..., {n_vars}, {n_vars})."
+            raise ValueError(msg)
+        weighted = jacobian @ matrix
+    output_covariance = weighted @ jacobian.transpose(0, 2, 1)
+    return MultiPropagation(
+        mu=evaluation.value,
+        sigma=np.sqrt(np.diagonal(output_covariance, axis1=1, axis2=2)),
+        jacobian=jacobian,
+        covariance=output_covariance,
+    )
+
+
+_compiled_equations_cache: LRUCache[tuple[tuple[str, ...], tuple[str, ...]], CompiledEquations] = (
+    LRUCache(DEFAULT_COMPILED_EQUATIONS_CACHE_SIZE)
+)
+
+
+def compiled_equations_cache_info() -> CacheInfo:
+    """Return hit/miss/wait statistics of the process-wide compiled-equations cache."""
+    return _compiled_equations_cache.info()
+
+
+def set_compiled_equations_cache_size(maxsize: int) -> None:
+    """Bound the process-wide compiled-equations cache to `maxsize` entries (0 disables it)."""
+    _compiled_equations_cache.resize(maxsize)
+
+
+def clear_compiled_equations_cache() -> None:
+    """Drop all cached compiled equation sets and reset statistics."""
+    _compiled_equations_cache.clear()
+
+
+def parse_equations(equations: Equations, variables: Variables) -> list[ParseState]:
+    """Parse and validate every equation against the shared `variables`."""
+    variables = list(variables)
+    parse_states = [parse_inputs(equation, variables) for equation in equations.equations]
+    for parse_state in parse_states:
+        validate_inputs(parse_state)
+    return parse_states
+
+
+def compile_equations(equations: Equations, variables: Variables) -> CompiledEquations:
+    """Compile all outputs and their partial derivatives into one vectorized kernel.
+
+    Values and Jacobian entries are lambdified together, so subexpressions
+    shared between outputs are eliminated once across the whole set. Results
+    are cached process-wide by expressions and variable names.
+    """
+    variables = list(variables)
+    key = (
+        tuple(equation.expression for equation in equations.equations),
+        tuple(var.name for var in variables),
+    )
+    return _compiled_equations_cache.get_or_create(
+        key, lambda: _compile_equations(equations, variables)
+    )
+
+
+def _compile_equations(equations: Equations, variables: Variables) -> CompiledEquations:
+    parse_states = parse_equations(equations, variables)
+    symbols = parse_states[0].symbols
+    expressions = [parse_state.equation_expression for parse_state in parse_states]
+    jacobian = [gradient_expressions(parse_state) for parse_state in parse_states]
+    func = vectorized_lambdify(
+        symbols, [*expressions, *(pdv for row in jacobian for pdv in row)], cse=True
+    )
+    n_out, n_vars = len(expressions), len(symbols)
+
+    def kernel(columns: NDArray[np.float64]) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        rows = columns.shape[1]
+        outputs = func(*columns)
+        value = np.empty((rows, n_out))
+        for i in range(n_out):
+            value[:, i] = outputs[i]
+        partials = np.empty((rows, n_out, n_vars))
+        for k, partial in enumerate(outputs[n_out:]):
+            partials[:, k // n_vars, k % n_vars] = partial
+        return value, partials
+
+    return CompiledEquations(
+        names=tuple(symbol.name for symbol in symbols),
+        outputs=tuple(equation.latex_name for equation in equations.equations),
+        kernel=kernel,
+    )
+
+
+def run_equations(
+    equations: Equations, variables: Variables, digits: Digits, options: RenderOptions
+) -> MultiOutput:
+    """Render every output with `render_output` and propagate the joint covariance.
+
+    The Jacobian is assembled from the numeric partials `compute` already
+    produced for rendering, so nothing is differentiated or compiled twice.
+    """
+    variables = list(variables)
+    parse_states = parse_equations(equations, variables)
+    compute_states = [compute(parse_state, digits) for parse_state in parse_states]
+    latex = tuple(
+        render_output(parse_state, compute_state, options)
+        for parse_state, compute_state in zip(parse_states, compute_states)
+    )
+    evaluation = MultiEvaluation(
+        value=np.array([
+            [
+                float(parse_state.equation_expression.evalf(subs=parse_state.output_number))
+                for parse_state in parse_states
+            ]
+        ]),
+        jacobian=np.array([
+            [
+                [float(num) for _, _, num in compute_state.pdv_results]
+                for compute_state in compute_states
+            ]
+        ]),
+    )
+    propagation = _propagate(
+        tuple(symbol.name for symbol in parse_states[0].symbols),
+        evaluation,
+        {var.name: var.uncertainty for var in variables},
+        None,
+    )
+    return MultiOutput(
+        latex=latex,
+        mu=propagation.mu[0],
+        sigma=propagation.sigma[0],
+        covariance=propagation.covariance[0],
+    )
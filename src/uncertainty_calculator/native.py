@@ -0,0 +1,176 @@
+"""Native C kernels for equation values and gradients.
+
+The value and every partial derivative are printed as C99 with SymPy's code
+printer, built into a shared library with the system compiler and loaded via
+`ctypes`. Libraries are cached on disk under a hash of the generated source, so
+each distinct formula is compiled once per machine.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+from sympy import Rational, Symbol, cse, numbered_symbols
+from sympy.printing.c import C99CodePrinter
+
+CACHE_DIR_ENV = "UNCERTAINTY_CALCULATOR_KERNEL_DIR"
+_KERNEL_NAME = "uc_kernel"
+
+_HEADER = """\
+#include <math.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+#ifndef M_E
+#define M_E 2.71828182845904523536
+#endif
+"""
+
+
+class _KernelPrinter(C99CodePrinter):
+    """C99 printer whose powers follow NumPy for negative bases.
+
+    The stock printer turns `x**(1/3)` into `cbrt(x)`, the real cube root,
+    while NumPy (and SymPy's principal root) give nan for negative `x`.
+    """
+
+    def _print_Pow(self, expr: Any) -> str:
+        if expr.exp == Rational(1, 3):
+            return f"pow({self._print(expr.base)}, 1.0/3.0)"
+        return super()._print_Pow(expr)
+
+
+def default_cache_dir() -> Path:
+    """Return the kernel cache directory (overridable via `UNCERTAINTY_CALCULATOR_KERNEL_DIR`)."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "uncertainty_calculator" / "kernels"
+
+
+def find_compiler() -> str | None:
+    """Return the C compiler to use (`$CC`, then `cc`, `gcc`, `clang`), or None."""
+    candidates = [os.environ.get("CC"), "cc", "gcc", "clang"]
+    for candidate in candidates:
+        if candidate and shutil.which(candidate):
+            return candidate
+    return None
+
+
+def generate_c_source(symbols: list[Symbol], expression: Any, gradient: list[Any]) -> str | None:
+    """Print the value and gradient as one C function, or None if C cannot express them.
+
+    The generated `uc_kernel(inputs, rows, value, gradient)` reads an
+    `(n_vars, rows)` row-major input matrix and writes `value[rows]` and
+    `gradient[rows, len(gradient)]`. Variables are renamed positionally so arbitrary
+    `Variable.name`s never collide with C identifiers.
+    """
+    aliases = [Symbol(f"x{j}") for j in range(len(symbols))]
+    renaming = dict(zip(symbols, aliases))
+    outputs = [expression.xreplace(renaming), *(pdv.xreplace(renaming) for pdv in gradient)]
+    temporaries, reduced = cse(outputs, symbols=numbered_symbols("t"))
+
+    printer = _KernelPrinter()
+    try:
+        lines = [
+            f"        const double {alias} = inputs[{j} * rows + i];"
+            for j, alias in enumerate(aliases)
+        ]
+        lines.extend(
+            f"        const double {name} = {printer.doprint(rhs)};" for name, rhs in temporaries
+        )
+        lines.append(f"        value[i] = {printer.doprint(reduced[0])};")
+        lines.extend(
+            f"        gradient[i * {len(gradient)} + {j}] = {printer.doprint(pdv)};"
+            for j, pdv in enumerate(reduced[1:])
+        )
+    except (ValueError, NotImplementedError):
+        # Strict printing refuses functions without a C equivalent (SymPy raises
+        # `PrintMethodNotImplementedError`, a `NotImplementedError`, for most).
+        return None
+
+    body = "\n".join(lines)
+    return (
+        f"{_HEADER}\n"
+        f"void {_KERNEL_NAME}(const double *inputs, long rows, double *value, double *gradient)\n"
+        "{\n"
+        "    for (long i = 0; i < rows; ++i) {\n"
+        f"{body}\n"
+        "    }\n"
+        "}\n"
+    )
+
+
+def build_native_kernel(
+    symbols: list[Symbol],
+    expression: Any,
+    gradient: list[Any],
+    cache_dir: Path | None = None,
+) -> Callable[[NDArray[np.float64]], tuple[NDArray[np.float64], NDArray[np.float64]]] | None:
+    """Compile (or load from cache) a C kernel; return None when that is not possible."""
+    source = generate_c_source(symbols, expression, gradient)
+    compiler = find_compiler()
+    if source is None or compiler is None:
+        return None
+
+    library_path = _build_library(source, compiler, cache_dir or default_cache_dir())
+    if library_path is None:
+        return None
+
+    function = getattr(ctypes.CDLL(str(library_path)), _KERNEL_NAME)
+    matrix = np.ctypeslib.ndpointer(dtype=np.float64, flags="C_CONTIGUOUS")
+    function.argtypes = [matrix, ctypes.c_long, matrix, matrix]
+    function.restype = None
+    n_partials = len(gradient)
+
+    def kernel(columns: NDArray[np.float64]) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        rows = columns.shape[1]
+        value = np.empty(rows)
+        partials = np.empty((rows, n_partials))
+        function(columns, rows, value, partials)
+        return value, partials
+
+    return kernel
+
+
+def _build_library(source: str, compiler: str, cache_dir: Path) -> Path | None:
+    digest = hashlib.sha256(f"{compiler}\n{source}".encode()).hexdigest()[:32]
+    library_path = cache_dir / f"{_KERNEL_NAME}_{digest}.so"
+    if library_path.exists():
+        return library_path
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=cache_dir) as build_dir:
+            source_path = Path(build_dir) / "kernel.c"
+            source_path.write_text(source)
+            output_path = Path(build_dir) / library_path.name
+            subprocess.run(
+                [
+                    compiler,
+                    "-O2",
+                    "-shared",
+                    "-fPIC",
+                    "-o",
+                    str(output_path),
+                    str(source_path),
+                    "-lm",
+                ],
+                check=True,
+                capture_output=True,
+            )
+            # Atomic rename so concurrent builders never load a half-written library.
+            output_path.replace(library_path)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return library_path
@@ -4,13 +4,80 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
-from sympy import Symbol, symbols, sympify
+from sympy import Float, Symbol, symbols, sympify
 
 from uncertainty_calculator._types import Equation, Variables
+from uncertainty_calculator.cache import CacheInfo, LRUCache
+from uncertainty_calculator.expression import ExpressionTree, parse_tree
 from uncertainty_calculator.format import latex_number
 
+DEFAULT_PARSE_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ParsedExpression:
+    """Cached result of parsing one expression against one tuple of variable names.
+
+    The SymPy `expression` is built from `tree` on first access, so callers that
+    only evaluate numerically never construct it.
+    """
+
+    symbols: tuple[Symbol, ...]
+    unc_symbols: tuple[Symbol, ...]
+    tree: ExpressionTree
+
+    @cached_property
+    def expression(self) -> Any:
+        """The SymPy expression over `symbols`."""
+        return self.tree.to_sympy({symbol.name: symbol for symbol in self.symbols})
+
+
+_parse_cache: LRUCache[tuple[str, tuple[str, ...]], ParsedExpression] = LRUCache(
+    DEFAULT_PARSE_CACHE_SIZE
+)
+
+
+def parse_cache_info() -> CacheInfo:
+    """Return hit/miss statistics of the process-wide expression cache."""
+    return _parse_cache.info()
+
+
+def set_parse_cache_size(maxsize: int) -> None:
+    """Bound the process-wide expression cache to `maxsize` entries (0 disables it)."""
+    _parse_cache.resize(maxsize)
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached expressions and reset statistics."""
+    _parse_cache.clear()
+
+
+def parse_expression(expression: str, names: tuple[str, ...]) -> ParsedExpression:
+    """Parse `expression` with symbols for `names`, reusing cached results.
+
+    The expression is validated by the restricted `ast` grammar (see
+    `uncertainty_calculator.expression`); conversion to SymPy is deferred to
+    `ParsedExpression.expression`.
+    """
+    key = (expression, names)
+    return _parse_cache.get_or_create(key, lambda: _parse_expression(expression, names))
+
+
+def _parse_expression(expression: str, names: tuple[str, ...]) -> ParsedExpression:
+    return ParsedExpression(
+        symbols=tuple(symbols(list(names))),
+        unc_symbols=tuple(symbols([f"sigma_{name}" for name in names])),
+        tree=parse_tree(expression, names),
+    )
+
+
+def _to_number(value: Any) -> Any:
+    # Variable normalizes to float, so the generic sympify dispatch is rarely needed.
+    return Float(value) if type(value) is float else sympify(value)
+
 
 @dataclass
 class ParseState:
@@ -25,13 +92,34 @@ class ParseState:
     input_fullunc: list[str]
     input_sigma: list[Any]
     equation_latex_name: str
-    equation_expression: Any
+    parsed_expression: ParsedExpression
+
+    @property
+    def equation_expression(self) -> Any:
+        """The equation as a SymPy expression, built on first use."""
+        return self.parsed_expression.expression
+
+    @property
+    def expression_tree(self) -> ExpressionTree:
+        """The validated expression tree, for numeric evaluation without SymPy."""
+        return self.parsed_expression.tree
 
 
 def parse_inputs(equation: Equation, variables: Variables) -> ParseState:
     """Parse variables and initialize sympy symbols and lookup mappings."""
+    variables = list(variables)
     symbol_names: list[str] = []
-    uncertainty_names: list[str] = []
+    seen_names: set[str] = set()
+    for var_item in variables:
+        if var_item.name in seen_names:
+            msg = f"Duplicate variable name detected: {var_item.name!r}"
+            raise ValueError(msg)
+        seen_names.add(var_item.name)
+        symbol_names.append(var_item.name)
+
+    # Undefined identifiers and unsupported syntax fail here, before any SymPy work.
+    parsed = parse_expression(equation.expression, tuple(symbol_names))
+
     latex_symbols: list[str] = []
 
     input_mu: list[Any] = []
@@ -40,24 +128,14 @@ def parse_inputs(equation: Equation, variables: Variables) -> ParseState:
     input_fullsigma: list[str] = []
     input_fullunc: list[str] = []
 
-    seen_names: set[str] = set()
-
     for var_item in variables:
-        if var_item.name in seen_names:
-            msg = f"Duplicate variable name detected: {var_item.name!r}"
-            raise ValueError(msg)
-        seen_names.add(var_item.name)
-
-        sym_str = var_item.name
         latex_repr = var_item.latex_name.strip()
 
-        symbol_names.append(sym_str)
-        uncertainty_names.append(f"sigma_{sym_str}")
         latex_symbols.append(latex_repr)
         input_fullunc.append(f"\\sigma_{{{latex_repr}}}")
 
-        numeric_mu = sympify(var_item.value)
-        numeric_sigma = sympify(var_item.uncertainty)
+        numeric_mu = _to_number(var_item.value)
+        numeric_sigma = _to_number(var_item.uncertainty)
 
         input_mu.append(numeric_mu)
         input_sigma.append(numeric_sigma)
@@ -68,9 +146,8 @@ def parse_inputs(equation: Equation, variables: Variables) -> ParseState:
         latex_sigma = latex_number(numeric_sigma.evalf(2))
         input_fullsigma.append(latex_sigma)
 
-    symbols_parsed = symbols(symbol_names)
-    unc_symbols = symbols(uncertainty_names)
-    symbol_map = dict(zip(symbol_names, symbols_parsed))
+    symbols_parsed = list(parsed.symbols)
+    unc_symbols = list(parsed.unc_symbols)
 
     output_symbol = dict(zip(symbols_parsed + unc_symbols, latex_symbols + input_fullunc))
     output_number = dict(zip(symbols_parsed + unc_symbols, input_mu + input_sigma))
@@ -78,7 +155,6 @@ def parse_inputs(equation: Equation, variables: Variables) -> ParseState:
     uncertainty_values = dict(zip(symbols_parsed, input_sigma))
 
     equation_latex_name = equation.latex_name
-    equation_expression = sympify(equation.expression, locals=symbol_map)
 
     return ParseState(
         symbols=symbols_parsed,
@@ -90,5 +166,5 @@ def parse_inputs(equation: Equation, variables: Variables) -> ParseState:
         input_fullunc=input_fullunc,
         input_sigma=input_sigma,
         equation_latex_name=equation_latex_name,
-        equation_expression=equation_expression,
+        parsed_expression=parsed,
     )
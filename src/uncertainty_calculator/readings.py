@@ -0,0 +1,120 @@
+"""Streaming Type-A statistics that turn raw repeated readings into `Variable`s."""
+
+from __future__ import annotations
+
+import itertools
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from uncertainty_calculator._types import Variable
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def rectangular_uncertainty(half_width: float) -> float:
+    """Return the Type-B standard uncertainty `a/sqrt(3)` of a rectangular distribution."""
+    return half_width / math.sqrt(3)
+
+
+@dataclass
+class RunningStats:
+    """Online mean and sum of squared deviations of a stream of readings.
+
+    Readings are reduced chunk by chunk (Welford/Chan updates), so memory use
+    is constant in the number of readings. Partial results from separate
+    chunks, threads or processes are combined with `merge`.
+
+    Attributes:
+        count: Number of readings seen.
+        mean: Running mean.
+        m2: Sum of squared deviations from the running mean.
+
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(
+        self, readings: np.ndarray | Iterable[float], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> RunningStats:
+        """Consume `readings` (an array, memory map or iterator) and return `self`."""
+        if isinstance(readings, np.ndarray):
+            flat = readings.reshape(-1)
+            for start in range(0, flat.shape[0], chunk_size):
+                self._update_chunk(np.asarray(flat[start : start + chunk_size], np.float64))
+            return self
+
+        iterator = iter(readings)
+        while chunk := list(itertools.islice(iterator, chunk_size)):
+            self._update_chunk(np.asarray(chunk, np.float64))
+        return self
+
+    def merge(self, other: RunningStats) -> RunningStats:
+        """Return the statistics of both streams combined."""
+        count = self.count + other.count
+        if count == 0:
+            return RunningStats()
+        delta = other.mean - self.mean
+        return RunningStats(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+        )
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (with Bessel's correction)."""
+        if self.count < 2:
+            msg = f"At least two readings are required (got {self.count})."
+            raise ValueError(msg)
+        return self.m2 / (self.count - 1)
+
+    @property
+    def standard_error(self) -> float:
+        """Type-A standard uncertainty of the mean, `s/sqrt(n)`."""
+        return math.sqrt(self.variance / self.count)
+
+    def to_variable(self, name: str, latex_name: str, type_b: float = 0.0) -> Variable:
+        """Build a `Variable` from the mean and the Type-A uncertainty.
+
+        A Type-B standard uncertainty `type_b` (e.g. from
+        `rectangular_uncertainty`) is combined in quadrature.
+        """
+        return Variable(
+            name=name,
+            value=self.mean,
+            uncertainty=math.hypot(self.standard_error, type_b),
+            latex_name=latex_name,
+        )
+
+    def _update_chunk(self, chunk: np.ndarray) -> None:
+        if chunk.size == 0:
+            return
+        chunk_mean = float(chunk.mean())
+        chunk_m2 = float(np.square(chunk - chunk_mean).sum())
+        merged = self.merge(RunningStats(count=int(chunk.size), mean=chunk_mean, m2=chunk_m2))
+        self.count, self.mean, self.m2 = merged.count, merged.mean, merged.m2
+
+
+def variables_from_readings(
+    readings: Mapping[str, np.ndarray | Iterable[float]],
+    latex_names: Mapping[str, str] | None = None,
+    type_b: Mapping[str, float] | None = None,
+) -> list[Variable]:
+    """Reduce repeated readings per variable name into `Variable`s, in mapping order.
+
+    `latex_names` defaults to the variable name; `type_b` gives optional
+    instrument terms combined in quadrature with the Type-A uncertainty.
+    """
+    latex_names = latex_names or {}
+    type_b = type_b or {}
+    return [
+        RunningStats()
+        .update(values)
+        .to_variable(name, latex_names.get(name, name), type_b.get(name, 0.0))
+        for name, values in readings.items()
+    ]
@@ -0,0 +1,235 @@
+"""Named equations that are compiled in the background ahead of the first request."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import tomllib
+from collections.abc import Callable, Mapping
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from uncertainty_calculator._types import Equation, Variable, Variables
+from uncertainty_calculator.compiled import CompiledEquation, compile_equation
+from uncertainty_calculator.compute import derivatives, uncertain_symbols
+from uncertainty_calculator.parsers import parse_inputs
+from uncertainty_calculator.validation import validate_inputs
+
+
+@dataclass(frozen=True)
+class RegisteredEquation:
+    """An equation and its variable definitions registered under a name."""
+
+    name: str
+    equation: Equation
+    variables: tuple[Variable, ...]
+
+
+@dataclass(frozen=True)
+class WarmupEvent:
+    """Progress of a warmup, emitted after each entry finishes.
+
+    Attributes:
+        name: The entry that finished.
+        done: Entries finished so far (including failures).
+        total: Entries registered when the warmup started.
+        seconds: Time spent compiling this entry.
+        error: The exception raised while compiling it, if any.
+
+    """
+
+    name: str
+    done: int
+    total: int
+    seconds: float
+    error: BaseException | None = None
+
+
+class EquationRegistry:
+    """Look up equations by name and pre-compile them on a background thread pool.
+
+    Warming an entry parses and validates it, builds the simplified partial
+    derivatives used for rendering and compiles the numeric kernel. Results
+    land in the process-wide parse, derivative and compiled-equation caches,
+    so later `UncertaintyCalculator.run` calls and `compiled` lookups are cache
+    hits (size those caches to hold every registered formula). Threads rather
+    than processes are used because those caches are per process.
+    """
+
+    def __init__(self, *, native: bool = False) -> None:
+        """Create an empty registry; `native` is passed on to `compile_equation`."""
+        self.native = native
+        self._entries: dict[str, RegisteredEquation] = {}
+        self._futures: dict[str, Future[CompiledEquation]] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._progress: Callable[[WarmupEvent], None] | None = None
+        self._done = 0
+        self._total = 0
+
+    def register(self, name: str, equation: Equation, variables: Variables) -> None:
+        """Register `equation` with its `variables` under `name`."""
+        with self._lock:
+            if name in self._entries:
+                msg = f"Equation {name!r} is already registered."
+                raise ValueError(msg)
+            self._entries[name] = RegisteredEquation(name, equation, tuple(variables))
+
+    def load(self, path: str | Path) -> None:
+        """Register every equation defined in a `.json` or `.toml` file.
+
+        The file maps each name to `latex_name`, `expression` and a list of
+        `variables` with `name`, `value`, `uncertainty` and `latex_name`.
+        """
+        path = Path(path)
+        if path.suffix == ".toml":
+            config = tomllib.loads(path.read_text())
+        elif path.suffix == ".json":
+            config = json.loads(path.read_text())
+        else:
+            msg = f"Unsupported registry file type {path.suffix!r} (expected .json or .toml)."
+            raise ValueError(msg)
+        for name, spec in config.items():
+            self.register(name, *_definition(name, spec))
+
+    def names(self) -> tuple[str, ...]:
+        """Return the registered names in registration order."""
+        with self._lock:
+            return tuple(self._entries)
+
+    def __getitem__(self, name: str) -> RegisteredEquation:
+        """Return the definition registered under `name`."""
+        with self._lock:
+            try:
+                return self._entries[name]
+            except KeyError:
+                msg = f"No equation registered under {name!r}."
+                raise KeyError(msg) from None
+
+    def __len__(self) -> int:
+        """Return the number of registered equations."""
+        return len(self._entries)
+
+    def start_warmup(
+        self,
+        max_workers: int | None = None,
+        progress: Callable[[WarmupEvent], None] | None = None,
+    ) -> None:
+        """Queue every registered entry for compilation and return immediately.
+
+        `progress` is called from worker threads with a `WarmupEvent` as each
+        entry finishes; failures are reported there and re-raised by `compiled`.
+        """
+        with self._lock:
+            if self._executor is not None:
+                msg = "Warmup has already been started."
+                raise RuntimeError(msg)
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="equation-warmup"
+            )
+            self._progress = progress
+            self._total = len(self._entries)
+            for name in self._entries:
+                self._futures[name] = self._executor.submit(self._warm, name)
+
+    def compiled(self, name: str) -> CompiledEquation:
+        """Return the compiled equation `name`, compiling only that entry if needed.
+
+        If the warmup is compiling it, wait for that; if it is still queued (or
+        no warmup was started), compile it on the calling thread right away.
+        """
+        self[name]  # Raise KeyError for unknown names before touching the pool.
+        with self._lock:
+            future = self._futures.get(name)
+            # Take over a queued entry; later callers wait on the replacement future.
+            run_here = future is not None and future.cancel()
+            if run_here:
+                future = self._futures[name] = Future()
+        if future is None:
+            return self._warm(name)
+        if not run_here:
+            return future.result()
+
+        try:
+            compiled = self._warm(name)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        future.set_result(compiled)
+        return compiled
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every queued entry has finished; return False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for name in self.names():
+            with self._lock:
+                future = self._futures.get(name)
+            if future is None:
+                continue
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.exception(timeout=remaining)
+            except TimeoutError:
+                return False
+            except CancelledError:
+                continue
+        return True
+
+    def warmup_progress(self) -> tuple[int, int]:
+        """Return `(done, total)` for the current warmup."""
+        with self._lock:
+            return self._done, self._total
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the warmup pool, cancelling entries that have not started."""
+        with self._lock:
+            executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _warm(self, name: str) -> CompiledEquation:
+        entry = self[name]
+        started = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            parse_state = parse_inputs(entry.equation, entry.variables)
+            validate_inputs(parse_state)
+            derivatives(parse_state.equation_expression, uncertain_symbols(parse_state))
+            return compile_equation(entry.equation, entry.variables, native=self.native)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self._finished(name, time.perf_counter() - started, error)
+
+    def _finished(self, name: str, seconds: float, error: BaseException | None) -> None:
+        with self._lock:
+            if name not in self._futures:
+                # Compiled on demand outside a warmup; nothing to report.
+                return
+            self._done += 1
+            event = WarmupEvent(name, self._done, self._total, seconds, error)
+            progress = self._progress
+        if progress is not None:
+            progress(event)
+
+
+def _definition(name: str, spec: Mapping[str, Any]) -> tuple[Equation, list[Variable]]:
+    try:
+        equation = Equation(latex_name=spec["latex_name"], expression=spec["expression"])
+        variables = [
+            Variable(
+                name=var["name"],
+                value=var["value"],
+                uncertainty=var["uncertainty"],
+                latex_name=var["latex_name"],
+            )
+            for var in spec["variables"]
+        ]
+    except (KeyError, TypeError) as exc:
+        msg = f"Invalid definition for equation {name!r}: {exc}"
+        raise ValueError(msg) from None
+    return equation, variables
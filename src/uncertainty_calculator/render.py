@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import io
+import math
 from collections.abc import Callable
 from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+from sympy import Float, Symbol
 
 from uncertainty_calculator.compute import ComputeState
 from uncertainty_calculator.format import latex_number, latex_symbol, latex_value
+from uncertainty_calculator.indexed import IndexedComputeState, IndexedParseState
+from uncertainty_calculator.interval import Interval, outward_decimal
 from uncertainty_calculator.parsers import ParseState
 
 
-@dataclass
+@dataclass(frozen=True)
 class RenderOptions:
-    """Render configuration for the output."""
+    """Render configuration for the output (hashable, so renders can be memoized per variant)."""
 
     last_unit: str | None
     separate: bool
@@ -38,6 +45,145 @@ def render_output(
     return buffer.getvalue()
 
 
+def render_bounds(
+    parse_state: ParseState, bounds: Interval, digits: int, options: RenderOptions
+) -> str:
+    """Render worst-case bounds as `name in [lower, upper]` in their own environment.
+
+    Endpoints are rounded outward to `digits` significant digits, so the
+    printed interval still encloses the computed one. When the input ranges
+    leave the equation's domain the bounds are printed as undefined.
+    """
+    lower_bound, upper_bound = float(bounds.lower), float(bounds.upper)
+    if math.isnan(lower_bound) or math.isnan(upper_bound):
+        interval = "\\text{undefined}"
+    else:
+        lower, upper = outward_decimal(lower_bound, upper_bound, digits)
+        interval = f"\\left[{_latex_bound(lower)}, {_latex_bound(upper)}\\right]"
+        if options.last_unit is not None:
+            interval = f"{interval}\\ {options.last_unit}"
+
+    buffer = io.StringIO()
+
+    def printer(*args: object, end: str = "\n", sep: str = " ") -> None:
+        print(*args, file=buffer, end=end, sep=sep)
+
+    _env_start(printer, options.include_equation_number, aligned=False)
+    printer(f"{parse_state.equation_latex_name}\\in {interval}")
+    _env_end(printer, options.include_equation_number, aligned=False)
+    return buffer.getvalue()
+
+
+def render_indexed(
+    parse_state: IndexedParseState, compute_state: IndexedComputeState, options: RenderOptions
+) -> str:
+    r"""Render an equation over indexed variables with summation notation.
+
+    Each indexed variable gets one partial derivative line for the generic
+    reading `x_i`, whose value is shown only when it is the same for every
+    reading, and one `\sum_{i=1}^{N}` term in sigma. `insert` substitutes the
+    scalar values and `N`; readings stay symbolic.
+    """
+    name = parse_state.equation_latex_name
+    unit = "" if options.last_unit is None else f"\\ {options.last_unit}"
+    expression = parse_state.display(parse_state.expression)
+
+    definition = f"{name}&={latex_symbol(expression, parse_state.output_symbol)}"
+    if options.insert:
+        definition += f"={latex_value(expression, parse_state.output_value)}"
+    definition += f"={compute_state.result_mu}{unit}"
+
+    if options.last_unit is None:
+        result = f"{name}&={compute_state.result_mu} \\pm {compute_state.result_sigma}"
+    else:
+        result = (
+            f"{name}&=\\left ({compute_state.result_mu} \\pm {compute_state.result_sigma} "
+            f"\\right )\\ {options.last_unit}"
+        )
+
+    blocks = [
+        [definition],
+        _indexed_pdv_lines(parse_state, compute_state, options),
+        _indexed_sigma_lines(parse_state, compute_state, unit),
+        [result],
+    ]
+    buffer = io.StringIO()
+
+    def printer(*args: object, end: str = "\n", sep: str = " ") -> None:
+        print(*args, file=buffer, end=end, sep=sep)
+
+    if not options.separate:
+        _env_start(printer, options.include_equation_number, aligned=True)
+        printer("\\\\\n\\\\\n".join("\\\\\n".join(block) for block in blocks if block))
+        _env_end(printer, options.include_equation_number, aligned=True)
+        return buffer.getvalue()
+
+    for block in blocks:
+        if not block:
+            continue
+        if buffer.tell():
+            printer()
+        _env_start(printer, options.include_equation_number, aligned=True)
+        printer("\\\\\n".join(block))
+        _env_end(printer, options.include_equation_number, aligned=True)
+    return buffer.getvalue()
+
+
+def _indexed_partial(parse_state: IndexedParseState, symbol: Symbol) -> str:
+    return (
+        f"\\frac{{\\partial {parse_state.equation_latex_name} }}"
+        f"{{\\partial {parse_state.output_symbol[symbol]} }}"
+    )
+
+
+def _indexed_pdv_lines(
+    parse_state: IndexedParseState, compute_state: IndexedComputeState, options: RenderOptions
+) -> list[str]:
+    lines = []
+    for symbol, pdv, num in compute_state.pdv_results:
+        line = f"{_indexed_partial(parse_state, symbol)}&={latex_symbol(pdv, parse_state.output_symbol)}"
+        if options.insert:
+            line += f"={latex_value(pdv, parse_state.output_value)}"
+        # Rounding is monotonic, so the extremes agree exactly when all readings do.
+        low, high = (latex_number(Float(value).evalf(2)) for value in (np.min(num), np.max(num)))
+        if low == high:
+            line += f"={low}"
+        lines.append(line)
+    return lines
+
+
+def _indexed_sigma_lines(
+    parse_state: IndexedParseState, compute_state: IndexedComputeState, unit: str
+) -> list[str]:
+    sigma = f"\\sigma_{{{parse_state.equation_latex_name}}}"
+    if not compute_state.pdv_results:
+        return [f"{sigma}&={compute_state.result_sigma}{unit}"]
+
+    bounds = (
+        f"_{{{latex_symbol(parse_state.index, {})}=1}}^{{{latex_symbol(parse_state.count, {})}}}"
+    )
+    symbolic_terms = []
+    numeric_terms = []
+    for symbol, _, _ in compute_state.pdv_results:
+        latex_name = parse_state.output_symbol[symbol]
+        term = f"\\left({_indexed_partial(parse_state, symbol)} \\sigma_{{{latex_name}}}\\right)^2"
+        symbolic_terms.append(f"\\sum{bounds}{term}" if symbol in parse_state.readings else term)
+        # Readings are summed before rounding, so each variable shows one number.
+        magnitude = Float(compute_state.contributions[parse_state.names[symbol]] ** 0.5)
+        numeric_terms.append(f"\\left({latex_number(magnitude.evalf(2))}\\right)^2")
+    return [
+        f"{sigma}&=\\sqrt{{{'+'.join(symbolic_terms)}}}",
+        f"&=\\sqrt{{{'+'.join(numeric_terms)}}}",
+        f"&={compute_state.result_sigma}{unit}",
+    ]
+
+
+def _latex_bound(value: Decimal) -> str:
+    if value.is_infinite():
+        return "-\\infty" if value < 0 else "\\infty"
+    return latex_number(Float(str(value), max(1, len(value.as_tuple().digits))))
+
+
 def _env_start(printer: Callable[..., None], include_number: bool, aligned: bool) -> None:
     suffix = "" if include_number else "*"
     printer(f"\\begin{{equation{suffix}}}")
@@ -87,8 +233,8 @@ def _render_pdvs(
 ) -> None:
     separator = "&=" if aligned else "="
 
-    for symbol, pdv, num in compute_state.pdv_results:
-        if not parse_state.uncertainty_values[symbol]:
+    for symbol, pdv, _ in compute_state.pdv_results:
+        if not _is_rendered(parse_state, compute_state, symbol):
             continue
 
         lhs = (
@@ -101,13 +247,18 @@ def _render_pdvs(
         if options.insert:
             printer(latex_value(pdv, parse_state.output_value), end="=")
 
-        printer(latex_number(num.evalf(2)), end="\\\\\n")
+        printer(compute_state.rounded_pdvs[symbol], end="\\\\\n")
+
 
+def _is_rendered(parse_state: ParseState, compute_state: ComputeState, symbol: Symbol) -> bool:
+    # Exact variables and pruned (negligible) contributions are left out of the output.
+    return bool(parse_state.uncertainty_values[symbol]) and symbol not in compute_state.pruned
 
-def _sigma_symbolic_terms(parse_state: ParseState) -> list[str]:
+
+def _sigma_symbolic_terms(parse_state: ParseState, compute_state: ComputeState) -> list[str]:
     terms = []
     for symbol, fullunc in zip(parse_state.symbols, parse_state.input_fullunc):
-        if parse_state.uncertainty_values[symbol]:
+        if _is_rendered(parse_state, compute_state, symbol):
             terms.append(
                 f"\\left(\\frac{{\\partial {parse_state.equation_latex_name} }}"
                 f"{{\\partial {parse_state.output_symbol[symbol]} }} {fullunc}\\right)^2"
@@ -117,10 +268,10 @@ def _sigma_symbolic_terms(parse_state: ParseState) -> list[str]:
 
 def _sigma_intermediate_terms(parse_state: ParseState, compute_state: ComputeState) -> list[str]:
     terms = []
-    for i, (symbol, _, num) in enumerate(compute_state.pdv_results):
-        if parse_state.uncertainty_values[symbol]:
+    for i, (symbol, _, _) in enumerate(compute_state.pdv_results):
+        if _is_rendered(parse_state, compute_state, symbol):
             unc = parse_state.unc_symbols[i]
-            val_latex = latex_number(num.evalf(2))
+            val_latex = compute_state.rounded_pdvs[symbol]
             unc_latex = parse_state.output_value[unc]
             terms.append(f"\\left({val_latex} \\times {unc_latex}\\right)^2")
     return terms
@@ -129,7 +280,7 @@ def _sigma_intermediate_terms(parse_state: ParseState, compute_state: ComputeSta
 def _sigma_numeric_terms(parse_state: ParseState, compute_state: ComputeState) -> list[str]:
     terms = []
     for i, (symbol, _, num) in enumerate(compute_state.pdv_results):
-        if parse_state.uncertainty_values[symbol]:
+        if _is_rendered(parse_state, compute_state, symbol):
             unc = parse_state.unc_symbols[i]
             val = (num * parse_state.output_number[unc]).evalf(2)
             terms.append(f"\\left({latex_number(val)}\\right)^2")
@@ -157,7 +308,7 @@ def _render_sigma(
             printer(res_str)
         return
 
-    symbolic_terms = _sigma_symbolic_terms(parse_state)
+    symbolic_terms = _sigma_symbolic_terms(parse_state, compute_state)
     printer(
         f"\\sigma_{{{parse_state.equation_latex_name}}}&=\\sqrt{{{'+'.join(symbolic_terms)}}}\\\\"
     )
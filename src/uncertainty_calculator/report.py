@@ -0,0 +1,126 @@
+"""Stream many rendered results into one LaTeX document."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TextIO
+
+from uncertainty_calculator._types import Digits, Equation, Variables
+from uncertainty_calculator.compute import compute
+from uncertainty_calculator.metrics import REGISTRY
+from uncertainty_calculator.parsers import parse_inputs
+from uncertainty_calculator.render import RenderOptions, render_output
+from uncertainty_calculator.sympy_cache import maybe_clear_sympy_cache
+from uncertainty_calculator.validation import validate_inputs
+
+DEFAULT_PREAMBLE = (
+    "\\documentclass{article}\n"
+    "\\usepackage{amsmath}\n"
+    "\\usepackage[version=4]{mhchem}\n"
+    "\\begin{document}\n"
+)
+DEFAULT_POSTAMBLE = "\\end{document}\n"
+DEFAULT_MAX_PENDING = 64
+
+type ReportJob = tuple[Equation, Variables, RenderOptions]
+"""One result to render: equation, its variables and render options."""
+
+
+@dataclass(frozen=True)
+class JobTiming:
+    """Progress event emitted after each job is written.
+
+    Attributes:
+        index: Zero-based position of the job in the input.
+        seconds: Wall time spent parsing, computing and rendering the job.
+
+    """
+
+    index: int
+    seconds: float
+
+
+@dataclass
+class ReportSummary:
+    """Totals of one `write_report` call."""
+
+    jobs: int = 0
+    seconds: float = 0.0
+    job_seconds: list[float] = field(default_factory=list)
+
+
+def write_report(
+    jobs: Iterable[ReportJob],
+    handle: TextIO,
+    digits: Digits,
+    *,
+    preamble: str | None = DEFAULT_PREAMBLE,
+    postamble: str | None = DEFAULT_POSTAMBLE,
+    executor: Executor | None = None,
+    max_pending: int = DEFAULT_MAX_PENDING,
+    progress: Callable[[JobTiming], None] | None = None,
+) -> ReportSummary:
+    """Render `jobs` concurrently and write them to `handle` in input order.
+
+    Jobs are consumed lazily and at most `max_pending` are in flight, so
+    neither the job list nor the document is held in memory. Without an
+    `executor` a thread pool is used; a `ProcessPoolExecutor` also works, as
+    jobs and the worker function are picklable. `progress` is called with a
+    `JobTiming` as each job is written. Pass `preamble=None` and
+    `postamble=None` to write bare environments for inclusion elsewhere.
+    """
+    owned = executor is None
+    pool = ThreadPoolExecutor() if executor is None else executor
+    summary = ReportSummary()
+    started = time.perf_counter()
+    pending: deque[Future[tuple[str, float]]] = deque()
+
+    def drain_one() -> None:
+        latex, seconds = pending.popleft().result()
+        REGISTRY.set_gauge("report_queue_depth", len(pending))
+        REGISTRY.observe("report_job_seconds", seconds)
+        if summary.jobs:
+            handle.write("\n")
+        handle.write(latex)
+        summary.job_seconds.append(seconds)
+        if progress is not None:
+            progress(JobTiming(index=summary.jobs, seconds=seconds))
+        summary.jobs += 1
+
+    try:
+        if preamble is not None:
+            handle.write(preamble)
+        for equation, variables, options in jobs:
+            pending.append(pool.submit(render_job, equation, list(variables), options, digits))
+            REGISTRY.set_gauge("report_queue_depth", len(pending))
+            if len(pending) >= max_pending:
+                drain_one()
+        while pending:
+            drain_one()
+        if postamble is not None:
+            handle.write(postamble)
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown()
+
+    summary.seconds = time.perf_counter() - started
+    return summary
+
+
+def render_job(
+    equation: Equation, variables: Variables, options: RenderOptions, digits: Digits
+) -> tuple[str, float]:
+    """Run the full pipeline for one job; return its LaTeX and the time it took."""
+    started = time.perf_counter()
+    parse_state = parse_inputs(equation, variables)
+    validate_inputs(parse_state)
+    latex = render_output(parse_state, compute(parse_state, digits), options)
+    seconds = time.perf_counter() - started
+    maybe_clear_sympy_cache()
+    return latex, seconds
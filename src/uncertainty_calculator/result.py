@@ -0,0 +1,123 @@
+"""Calculation results that compute and render on demand."""
+
+from __future__ import annotations
+
+import math
+from functools import cached_property
+
+from uncertainty_calculator._types import Digits
+from uncertainty_calculator.compute import ComputeState, compute
+from uncertainty_calculator.interval import Interval, parse_state_bounds
+from uncertainty_calculator.metrics import REGISTRY
+from uncertainty_calculator.parsers import ParseState
+from uncertainty_calculator.render import RenderOptions, render_bounds, render_output
+
+
+class CalculationResult:
+    """One parsed and validated calculation whose results are produced on first use.
+
+    `mu` only evaluates the equation; symbolic partials (`compute_state`) are
+    built the first time anything needs them. LaTeX is rendered once per
+    `RenderOptions` and memoized, so switching to another layout re-renders
+    from the same partials and rounded numbers without recomputing them.
+    In notebooks the result displays itself through `_repr_latex_`.
+    """
+
+    def __init__(
+        self,
+        parse_state: ParseState,
+        digits: Digits,
+        options: RenderOptions,
+        prune_threshold: float | None = None,
+        coverage_factor: float | None = None,
+    ) -> None:
+        """Wrap a validated `parse_state`; `options` is the layout used by `latex()` by default."""
+        self.parse_state = parse_state
+        self.digits = digits
+        self.options = options
+        self.prune_threshold = prune_threshold
+        self.coverage_factor = coverage_factor
+        self._latex: dict[RenderOptions, str] = {}
+
+    @cached_property
+    def compute_state(self) -> ComputeState:
+        """Symbolic partials and rounded results, computed on first access."""
+        with REGISTRY.time("stage_seconds", stage="compute"):
+            return compute(self.parse_state, self.digits, self.prune_threshold)
+
+    @cached_property
+    def mu(self) -> float:
+        """Equation value at the variable values (no derivatives needed)."""
+        parse_state = self.parse_state
+        return float(parse_state.equation_expression.evalf(subs=parse_state.output_number))
+
+    @cached_property
+    def sigma(self) -> float:
+        """Propagated standard uncertainty, excluding pruned contributions."""
+        state = self.compute_state
+        return math.sqrt(
+            math.fsum(
+                float(num * sigma_value) ** 2
+                for (symbol, _, num), sigma_value in zip(
+                    state.pdv_results, self.parse_state.input_sigma
+                )
+                if symbol not in state.pruned
+            )
+        )
+
+    @cached_property
+    def partials(self) -> dict[str, float]:
+        """Numeric partial derivative per name of each variable with an uncertainty.
+
+        Exact variables are never differentiated, so they have no entry.
+        """
+        uncertainty_values = self.parse_state.uncertainty_values
+        return {
+            symbol.name: float(num)
+            for symbol, _, num in self.compute_state.pdv_results
+            if uncertainty_values[symbol]
+        }
+
+    @property
+    def sigma_error_bound(self) -> float:
+        """Amount by which `sigma` may underestimate the full sigma because of pruning."""
+        return self.compute_state.sigma_error_bound
+
+    @property
+    def result_mu(self) -> str:
+        """`mu` rounded to `digits.mu` significant digits, as LaTeX."""
+        return self.compute_state.result_mu
+
+    @property
+    def result_sigma(self) -> str:
+        """`sigma` rounded to `digits.sigma` significant digits, as LaTeX."""
+        return self.compute_state.result_sigma
+
+    @cached_property
+    def bounds(self) -> Interval | None:
+        """Worst-case bounds for the coverage factor, or None without one."""
+        if self.coverage_factor is None:
+            return None
+        with REGISTRY.time("stage_seconds", stage="bounds"):
+            return parse_state_bounds(self.parse_state, self.coverage_factor)
+
+    def latex(self, options: RenderOptions | None = None) -> str:
+        """Return the LaTeX output for `options` (default: the calculator's), rendering it once."""
+        options = options or self.options
+        if options not in self._latex:
+            with REGISTRY.time("stage_seconds", stage="render"):
+                latex = render_output(self.parse_state, self.compute_state, options)
+            if self.bounds is not None:
+                latex += "\n" + render_bounds(
+                    self.parse_state, self.bounds, self.digits.mu, options
+                )
+            self._latex[options] = latex
+        return self._latex[options]
+
+    def _repr_latex_(self) -> str:
+        """Render for Jupyter/IPython rich display."""
+        return self.latex()
+
+    def __str__(self) -> str:
+        """Return the LaTeX output for the default options."""
+        return self.latex()
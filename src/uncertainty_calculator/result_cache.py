@@ -0,0 +1,235 @@
+"""Optional cache of rendered results keyed by canonicalized calculator inputs."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Protocol
+
+from uncertainty_calculator._types import Digits, Equation, Variables
+from uncertainty_calculator.cache import CacheInfo, LRUCache
+from uncertainty_calculator.render import RenderOptions
+
+# Bump when the key payload or rendered output changes incompatibly so that
+# persistent (on-disk) caches never serve stale entries.
+KEY_SCHEMA = 1
+
+
+def result_key(
+    equation: Equation,
+    variables: Variables,
+    digits: Digits,
+    options: RenderOptions,
+    prune_threshold: float | None = None,
+    coverage_factor: float | None = None,
+) -> str:
+    """Return a stable SHA-256 hex digest of everything that determines the output.
+
+    Variable order is kept because it determines the rendering order; floats
+    are encoded exactly with `float.hex`. The prune threshold and the bounds
+    coverage factor are only part of the payload when set, so keys of plain
+    results are unchanged.
+    """
+    payload = {
+        "schema": KEY_SCHEMA,
+        "equation": [equation.latex_name, equation.expression],
+        "variables": [
+            [var.name, var.value.hex(), var.uncertainty.hex(), var.latex_name] for var in variables
+        ],
+        "digits": [digits.mu, digits.sigma],
+        "options": asdict(options),
+    }
+    if prune_threshold is not None:
+        payload["prune_threshold"] = float(prune_threshold).hex()
+    if coverage_factor is not None:
+        payload["coverage_factor"] = float(coverage_factor).hex()
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ResultBackend(Protocol):
+    """Storage for rendered results; implementations handle their own eviction."""
+
+    maxsize: int
+
+    def get(self, key: str) -> str | None:
+        """Return the stored result, or None if absent or expired."""
+        ...
+
+    def set(self, key: str, value: str) -> None:
+        """Store `value` under `key`."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every stored result."""
+        ...
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        ...
+
+
+class MemoryBackend:
+    """In-process LRU storage with an optional time-to-live in seconds."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        """Keep at most `maxsize` results, each for at most `ttl` seconds."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: LRUCache[str, tuple[float | None, str]] = LRUCache(maxsize)
+
+    def get(self, key: str) -> str | None:
+        """Return the stored result, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._entries.discard(key)
+            return None
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store `value` under `key`."""
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries.put(key, (expires_at, value))
+
+    def clear(self) -> None:
+        """Remove every stored result."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        return len(self._entries)
+
+
+class DiskBackend:
+    """Local on-disk storage (one JSON file per key) with LRU eviction and optional TTL.
+
+    Entries survive restarts and can be read by other processes on the same
+    machine. Recency is kept in an in-memory index seeded from the files'
+    modification times at start-up, so writes evict in constant time instead
+    of rescanning the directory.
+    """
+
+    def __init__(
+        self, directory: str | Path, maxsize: int = 10000, ttl: float | None = None
+    ) -> None:
+        """Store results under `directory`, keeping at most `maxsize` for at most `ttl` seconds."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        mtimes: list[tuple[float, str]] = []
+        for path in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                mtimes.append((path.stat().st_mtime, path.stem))
+        self._recency: OrderedDict[str, None] = OrderedDict.fromkeys(
+            key for _, key in sorted(mtimes)
+        )
+
+    def get(self, key: str) -> str | None:
+        """Return the stored result, or None if absent, expired or unreadable."""
+        path = self._path(key)
+        try:
+            text = path.read_text()
+        except OSError:
+            return None
+        try:
+            entry = json.loads(text)
+            expires_at, value = entry["expires_at"], entry["value"]
+        except (ValueError, KeyError, TypeError):
+            # A truncated or foreign file: drop it and treat it as a miss.
+            self._remove(key)
+            return None
+        if expires_at is not None and time.time() >= expires_at:
+            self._remove(key)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        with self._lock:
+            self._recency[key] = None
+            self._recency.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store `value` under `key`, evicting the least recently used files if full."""
+        expires_at = None if self.ttl is None else time.time() + self.ttl
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as handle:
+            json.dump({"expires_at": expires_at, "value": value}, handle)
+        Path(tmp_name).replace(self._path(key))
+        with self._lock:
+            self._recency[key] = None
+            self._recency.move_to_end(key)
+            while len(self._recency) > self.maxsize:
+                oldest, _ = self._recency.popitem(last=False)
+                self._path(oldest).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove every stored result."""
+        with self._lock:
+            self._recency.clear()
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        return sum(1 for _ in self.directory.glob("*.json"))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            self._recency.pop(key, None)
+            self._path(key).unlink(missing_ok=True)
+
+
+class ResultCache:
+    """Front end over a `ResultBackend` that counts hits and misses."""
+
+    def __init__(self, backend: ResultBackend | None = None) -> None:
+        """Use `backend` for storage (an unbounded-TTL `MemoryBackend` by default)."""
+        self.backend: ResultBackend = backend if backend is not None else MemoryBackend()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_create(self, key: str, factory: Callable[[], str]) -> str:
+        """Return the stored result for `key`, rendering and storing it on a miss."""
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if value is None:
+            value = factory()
+            self.backend.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove stored results and reset statistics."""
+        self.backend.clear()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss counters and backend occupancy."""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        return CacheInfo(
+            hits=hits, misses=misses, maxsize=self.backend.maxsize, currsize=len(self.backend)
+        )
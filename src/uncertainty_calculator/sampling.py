@@ -0,0 +1,299 @@
+"""Sampling-based propagation with quasi-random designs and adaptive stopping.
+
+Inputs are drawn as independent normals `N(value, uncertainty)` and pushed
+through the equation with NumPy (no SymPy). Samples come in batches; each
+batch is an independently randomized design (random points, a Latin
+hypercube, or a digitally shifted block of the Sobol sequence), so the spread
+of the per-batch estimates gives an honest standard error for mu and sigma.
+Batches are added until both are stable to the significant digits requested
+by `Digits`, or until `max_samples` is reached.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from uncertainty_calculator._types import Digits, Equation, Variables
+from uncertainty_calculator.expression import parse_tree
+from uncertainty_calculator.readings import RunningStats
+
+type Sampler = Literal["random", "sobol", "lhs"]
+
+SAMPLERS: tuple[Sampler, ...] = ("random", "sobol", "lhs")
+DEFAULT_BATCH_SIZE = 4096
+DEFAULT_MIN_BATCHES = 4
+DEFAULT_MAX_SAMPLES = 4_194_304
+DEFAULT_CONFIDENCE_Z = 2.0
+
+SOBOL_BITS = 32
+
+# Joe & Kuo (2008) primitive polynomials and initial direction numbers
+# (degree s, coefficient bits a, m_1..m_s) for dimensions 2 and up.
+_SOBOL_TABLE: tuple[tuple[int, int, tuple[int, ...]], ...] = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+MAX_SOBOL_DIMENSIONS = len(_SOBOL_TABLE) + 1
+
+
+@dataclass(frozen=True)
+class SamplingResult:
+    """Outcome of a sampling-based propagation.
+
+    Attributes:
+        mu: Mean of the sampled equation values.
+        sigma: Standard deviation of the sampled equation values.
+        mu_error: Standard error of `mu`, from the spread of the batch estimates.
+        sigma_error: Standard error of `sigma`, from the spread of the batch estimates.
+        samples: Number of samples drawn.
+        batches: Number of batches drawn.
+        converged: Whether both estimates met the stopping rule before `max_samples`.
+
+    """
+
+    mu: float
+    sigma: float
+    mu_error: float
+    sigma_error: float
+    samples: int
+    batches: int
+    converged: bool
+
+
+def sobol(
+    n: int, dimensions: int, start: int = 0, rng: np.random.Generator | None = None
+) -> NDArray[np.float64]:
+    """Return points `start .. start+n-1` of the Sobol sequence, shape `(n, dimensions)`.
+
+    With `rng`, every coordinate gets an independent random digital shift
+    (XOR), which keeps the net structure but makes the points unbiased. Points
+    are taken at the centre of their `2**-SOBOL_BITS` cell, so none is 0 or 1.
+    """
+    if dimensions > MAX_SOBOL_DIMENSIONS:
+        msg = (
+            f"Sobol sampling supports at most {MAX_SOBOL_DIMENSIONS} uncertain variables "
+            f"(got {dimensions})."
+        )
+        raise ValueError(msg)
+    if start < 0 or start + n > 1 << SOBOL_BITS:
+        msg = f"Sobol indices must lie in [0, 2**{SOBOL_BITS})."
+        raise ValueError(msg)
+    index = np.arange(start, start + n, dtype=np.uint64)
+    gray = index ^ (index >> np.uint64(1))
+    directions = _sobol_directions(dimensions)
+    points = np.zeros((n, dimensions), dtype=np.uint64)
+    for bit in range(SOBOL_BITS):
+        mask = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        points ^= np.where(mask[:, None], directions[:, bit], np.uint64(0))
+    if rng is not None:
+        points ^= rng.integers(0, 1 << SOBOL_BITS, size=dimensions, dtype=np.uint64)
+    return (points.astype(np.float64) + 0.5) / float(1 << SOBOL_BITS)
+
+
+def latin_hypercube(n: int, dimensions: int, rng: np.random.Generator) -> NDArray[np.float64]:
+    """Return `n` Latin hypercube points in `(0, 1)**dimensions`.
+
+    Each coordinate takes exactly one point in each of the `n` equal strata,
+    placed uniformly within its stratum.
+    """
+    strata = rng.permuted(np.tile(np.arange(n), (dimensions, 1)), axis=1).T
+    return (strata + rng.random((n, dimensions))) / n
+
+
+def normal_ppf(u: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Inverse standard normal CDF for `u` in `(0, 1)` (Acklam, relative error < 1.2e-9)."""
+    u = np.asarray(u, dtype=np.float64)
+    result = np.empty_like(u)
+    low = u < _PPF_SPLIT
+    high = u > 1 - _PPF_SPLIT
+    central = ~(low | high)
+
+    q = u[central] - 0.5
+    r = q * q
+    result[central] = q * np.polyval(_PPF_A, r) / np.polyval((*_PPF_B, 1.0), r)
+    q = np.sqrt(-2 * np.log(u[low]))
+    result[low] = np.polyval(_PPF_C, q) / np.polyval((*_PPF_D, 1.0), q)
+    q = np.sqrt(-2 * np.log1p(-u[high]))
+    result[high] = -np.polyval(_PPF_C, q) / np.polyval((*_PPF_D, 1.0), q)
+    return result
+
+
+def propagate_sampling(
+    equation: Equation,
+    variables: Variables,
+    digits: Digits,
+    *,
+    sampler: Sampler = "sobol",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    min_batches: int = DEFAULT_MIN_BATCHES,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    confidence_z: float = DEFAULT_CONFIDENCE_Z,
+    seed: int | None = None,
+) -> SamplingResult:
+    """Propagate by sampling until mu and sigma are stable to `digits`.
+
+    After at least `min_batches` batches, sampling stops once
+    `confidence_z` standard errors of each estimate fit within half a unit in
+    its last significant digit (`digits.mu` for mu, `digits.sigma` for
+    sigma). Mu is never required to be finer than sigma's last digit, so a
+    mean near zero still converges. Variables without uncertainty are held fixed. For `"sobol"`,
+    `batch_size` must be a power of two so every batch is a balanced net.
+    """
+    if sampler not in SAMPLERS:
+        msg = f"Unknown sampler {sampler!r} (expected one of {', '.join(SAMPLERS)})."
+        raise ValueError(msg)
+    if batch_size < 2 or (sampler == "sobol" and batch_size & (batch_size - 1)):
+        msg = f"Invalid batch_size {batch_size} for sampler {sampler!r}."
+        raise ValueError(msg)
+    if min_batches < 2:
+        msg = f"min_batches must be at least 2 to estimate an error (got {min_batches})."
+        raise ValueError(msg)
+    if max_samples < min_batches * batch_size:
+        msg = f"max_samples must be at least min_batches * batch_size ({min_batches * batch_size})."
+        raise ValueError(msg)
+
+    variables = list(variables)
+    tree = parse_tree(equation.expression, tuple(var.name for var in variables))
+    uncertain = [var for var in variables if var.uncertainty != 0]
+    fixed = {var.name: var.value for var in variables if var.uncertainty == 0}
+    draw = _designs(sampler, len(uncertain), batch_size, np.random.default_rng(seed))
+
+    total = RunningStats()
+    batch_mu: list[float] = []
+    batch_sigma: list[float] = []
+    converged = False
+    while not converged and total.count + batch_size <= max_samples:
+        normals = normal_ppf(draw(len(batch_mu)))
+        values: dict[str, ArrayLike] = dict(fixed)
+        for k, var in enumerate(uncertain):
+            values[var.name] = var.value + var.uncertainty * normals[:, k]
+        sampled = np.broadcast_to(np.asarray(tree.evaluate(values), np.float64), (batch_size,))
+        if not np.all(np.isfinite(sampled)):
+            msg = "Sampled equation values are not finite; check the variable ranges."
+            raise ValueError(msg)
+
+        stats = RunningStats().update(sampled)
+        total = total.merge(stats)
+        batch_mu.append(stats.mean)
+        batch_sigma.append(math.sqrt(stats.variance))
+        if len(batch_mu) >= min_batches:
+            sigma_tolerance = _half_unit(math.sqrt(total.variance), digits.sigma)
+            # A result is reported as mu ± sigma, so digits of mu below sigma's
+            # last one carry no information (and a mean near zero has no scale).
+            mu_tolerance = max(_half_unit(total.mean, digits.mu), sigma_tolerance)
+            converged = (
+                confidence_z * _standard_error(batch_mu) <= mu_tolerance
+                and confidence_z * _standard_error(batch_sigma) <= sigma_tolerance
+            )
+
+    return SamplingResult(
+        mu=total.mean,
+        sigma=math.sqrt(total.variance),
+        mu_error=_standard_error(batch_mu),
+        sigma_error=_standard_error(batch_sigma),
+        samples=total.count,
+        batches=len(batch_mu),
+        converged=converged,
+    )
+
+
+def _designs(
+    sampler: Sampler, dimensions: int, batch_size: int, rng: np.random.Generator
+) -> Callable[[int], NDArray[np.float64]]:
+    """Return a function mapping a batch number to its `(batch_size, dimensions)` design."""
+    if sampler == "sobol":
+        # Consecutive aligned blocks of the sequence, each with its own shift,
+        # are independent estimates and together extend one low-discrepancy net.
+        return lambda batch: sobol(batch_size, dimensions, batch * batch_size, rng)
+    if sampler == "lhs":
+        return lambda _: latin_hypercube(batch_size, dimensions, rng)
+    return lambda _: rng.random((batch_size, dimensions))
+
+
+def _sobol_directions(dimensions: int) -> NDArray[np.uint64]:
+    directions = np.zeros((dimensions, SOBOL_BITS), dtype=np.uint64)
+    for dim in range(dimensions):
+        if dim == 0:
+            m = [1] * SOBOL_BITS
+        else:
+            degree, coefficients, initial = _SOBOL_TABLE[dim - 1]
+            m = list(initial)
+            for j in range(degree, SOBOL_BITS):
+                value = m[j - degree] ^ (m[j - degree] << degree)
+                for k in range(1, degree):
+                    if (coefficients >> (degree - 1 - k)) & 1:
+                        value ^= m[j - k] << k
+                m.append(value)
+        for j in range(SOBOL_BITS):
+            directions[dim, j] = m[j] << (SOBOL_BITS - 1 - j)
+    return directions
+
+
+def _standard_error(estimates: list[float]) -> float:
+    if len(estimates) < 2:
+        return math.inf
+    return float(np.std(estimates, ddof=1)) / math.sqrt(len(estimates))
+
+
+def _half_unit(value: float, digits: int) -> float:
+    """Half a unit in the `digits`-th significant digit of `value`."""
+    if value == 0:
+        return 0.0
+    return 0.5 * 10 ** (math.floor(math.log10(abs(value))) - digits + 1)
+
+
+# Acklam's rational approximation of the inverse normal CDF.
+_PPF_SPLIT = 0.02425
+_PPF_A = (
+    -3.969683028665376e01,
+    2.209460984245205e02,
+    -2.759285104469687e02,
+    1.383577518672690e02,
+    -3.066479806614716e01,
+    2.506628277459239e00,
+)
+_PPF_B = (
+    -5.447609879822406e01,
+    1.615858368580409e02,
+    -1.556989798598866e02,
+    6.680131188771972e01,
+    -1.328068155288572e01,
+)
+_PPF_C = (
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e00,
+    -2.549732539343734e00,
+    4.374664141464968e00,
+    2.938163982698783e00,
+)
+_PPF_D = (
+    7.784695709041462e-03,
+    3.224671290700398e-01,
+    2.445134137142996e00,
+    3.754408661907416e00,
+)
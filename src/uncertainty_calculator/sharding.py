@@ -0,0 +1,221 @@
+"""Row-sharded batch propagation across processes over shared-memory columns.
+
+Inputs and outputs live in `multiprocessing.shared_memory` blocks. Each
+worker process compiles the equation once (in the pool initializer), attaches
+to the blocks by name, and writes its row range of the results in place, so
+neither `Variable`s nor arrays are pickled per row.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Self
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from uncertainty_calculator._types import Equation, Variables
+from uncertainty_calculator.compiled import CompiledEquation, Propagation, compile_equation
+
+SHARDS_PER_WORKER = 4
+
+# One shared block per field, in this order; shapes come from `SharedSpec.shape`.
+_FIELDS = ("values", "uncertainties", "mu", "sigma", "gradient", "contributions")
+
+
+@dataclass(frozen=True)
+class SharedSpec:
+    """Picklable description of a `SharedBatch`: block names and shapes."""
+
+    names: tuple[str, ...]
+    rows: int
+    blocks: tuple[str, ...]
+
+    def shape(self, field: str) -> tuple[int, ...]:
+        """Return the array shape of `field` (one of the batch fields)."""
+        n_vars = len(self.names)
+        return {
+            "values": (n_vars, self.rows),
+            "uncertainties": (n_vars, self.rows),
+            "mu": (self.rows,),
+            "sigma": (self.rows,),
+            "gradient": (self.rows, n_vars),
+            "contributions": (self.rows, n_vars),
+        }[field]
+
+
+class SharedBatch:
+    """Input columns and result arrays in shared memory, sized for `rows` rows.
+
+    Inputs are `(n_vars, rows)` matrices so a row range of one variable is a
+    contiguous slice; results follow `Propagation`. Use as a context manager,
+    or call `close` to release and unlink the blocks.
+    """
+
+    def __init__(self, spec: SharedSpec, blocks: list[SharedMemory], owner: bool) -> None:
+        """Wrap attached `blocks` described by `spec`; see `create` and `attach`."""
+        self.spec = spec
+        self._blocks = blocks
+        self._owner = owner
+        arrays = {
+            field: np.ndarray(spec.shape(field), dtype=np.float64, buffer=block.buf)
+            for field, block in zip(_FIELDS, blocks)
+        }
+        self.values: NDArray[np.float64] = arrays["values"]
+        self.uncertainties: NDArray[np.float64] = arrays["uncertainties"]
+        self.output = Propagation(
+            mu=arrays["mu"],
+            sigma=arrays["sigma"],
+            gradient=arrays["gradient"],
+            contributions=arrays["contributions"],
+        )
+
+    @classmethod
+    def create(cls, names: tuple[str, ...], rows: int) -> SharedBatch:
+        """Allocate zero-filled shared blocks for `rows` rows of variables `names`."""
+        if rows <= 0:
+            msg = f"rows must be positive (got {rows})"
+            raise ValueError(msg)
+        blocks: list[SharedMemory] = []
+        probe = SharedSpec(tuple(names), rows, ())
+        try:
+            for field in _FIELDS:
+                size = max(1, math.prod(probe.shape(field))) * np.dtype(np.float64).itemsize
+                blocks.append(SharedMemory(create=True, size=size))
+        except BaseException:
+            for block in blocks:
+                block.close()
+                block.unlink()
+            raise
+        spec = SharedSpec(tuple(names), rows, tuple(block.name for block in blocks))
+        return cls(spec, blocks, owner=True)
+
+    @classmethod
+    def attach(cls, spec: SharedSpec) -> SharedBatch:
+        """Map existing blocks by name (in a worker process); `close` will not unlink them."""
+        return cls(spec, [SharedMemory(name=name) for name in spec.blocks], owner=False)
+
+    def fill(self, values: Mapping[str, ArrayLike], uncertainties: Mapping[str, ArrayLike]) -> None:
+        """Copy per-variable inputs (scalars or length-`rows` arrays) into the shared columns."""
+        for j, name in enumerate(self.spec.names):
+            self.values[j] = values[name]
+            self.uncertainties[j] = uncertainties[name]
+
+    def close(self) -> None:
+        """Release the mappings, unlinking the blocks if this batch created them.
+
+        Arrays obtained from the batch must not be used afterwards.
+        """
+        del self.values, self.uncertainties, self.output
+        for block in self._blocks:
+            block.close()
+            if self._owner:
+                block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> Self:
+        """Return the batch itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close (and, for the creator, unlink) the blocks."""
+        self.close()
+
+
+class ShardedExecutor:
+    """A process pool whose workers each compile one equation once.
+
+    `propagate` splits a `SharedBatch` into row ranges; workers read their
+    input columns and write results straight into the shared output arrays.
+    """
+
+    def __init__(
+        self,
+        equation: Equation,
+        variables: Variables,
+        workers: int | None = None,
+        *,
+        native: bool = False,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Start `workers` processes (default: CPU count) compiling `equation` on startup."""
+        variables = list(variables)
+        self.names = compile_equation(equation, variables, native=native).names
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(equation, variables, native),
+        )
+
+    def batch(self, rows: int) -> SharedBatch:
+        """Allocate a `SharedBatch` with this equation's variable columns."""
+        return SharedBatch.create(self.names, rows)
+
+    def propagate(self, batch: SharedBatch, shard_rows: int | None = None) -> Propagation:
+        """Fill `batch.output` across the pool and return it.
+
+        By default rows are split into `SHARDS_PER_WORKER` shards per worker to
+        even out load.
+        """
+        if batch.spec.names != self.names:
+            msg = "Batch columns do not match the executor's equation variables."
+            raise ValueError(msg)
+        rows = batch.spec.rows
+        step = shard_rows or max(1, math.ceil(rows / (self.workers * SHARDS_PER_WORKER)))
+        ranges = [(start, min(start + step, rows)) for start in range(0, rows, step)]
+        futures = [
+            self._pool.submit(_propagate_shard, batch.spec, start, stop) for start, stop in ranges
+        ]
+        for future in futures:
+            future.result()
+        return batch.output
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        self._pool.shutdown()
+
+    def __enter__(self) -> Self:
+        """Return the executor itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Shut the worker processes down."""
+        self.close()
+
+
+# Per-process worker state, set once by the pool initializer.
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(equation: Equation, variables: Variables, native: bool) -> None:
+    _worker["compiled"] = compile_equation(equation, variables, native=native)
+    _worker["batch"] = None
+
+
+def _propagate_shard(spec: SharedSpec, start: int, stop: int) -> None:
+    batch: SharedBatch | None = _worker["batch"]
+    if batch is None or batch.spec != spec:
+        # Attach once per batch; tasks of the same batch reuse the mapping.
+        if batch is not None:
+            batch.close()
+        batch = _worker["batch"] = SharedBatch.attach(spec)
+    compiled: CompiledEquation = _worker["compiled"]
+    output = batch.output
+    compiled.propagate(
+        {name: batch.values[j, start:stop] for j, name in enumerate(spec.names)},
+        {name: batch.uncertainties[j, start:stop] for j, name in enumerate(spec.names)},
+        out=Propagation(
+            mu=output.mu[start:stop],
+            sigma=output.sigma[start:stop],
+            gradient=output.gradient[start:stop],
+            contributions=output.contributions[start:stop],
+        ),
+    )
@@ -0,0 +1,59 @@
+"""Structural analysis of parsed expressions for closed-form derivatives."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sympy import Add, Mul, S, Symbol
+
+
+def monomial_exponents(term: Any) -> dict[Symbol, Any] | None:
+    """Return `{symbol: exponent}` if `term` is a constant times powers of symbols, else None.
+
+    Exponents must be numbers; constant factors (including `pi`, `sqrt(2)`, ...)
+    are allowed anywhere in the product.
+    """
+    exponents: dict[Symbol, Any] = {}
+    for factor in Mul.make_args(term):
+        if not factor.free_symbols:
+            continue
+        base, exponent = factor.as_base_exp()
+        if not (base.is_Symbol and exponent.is_number):
+            return None
+        exponents[base] = exponent
+    return exponents
+
+
+def terms_by_symbol(expression: Any) -> dict[Symbol, list[Any]]:
+    """Index the additive terms of `expression` by the symbols they contain.
+
+    Building the index once keeps per-symbol work proportional to the terms that
+    actually involve the symbol instead of the whole expression.
+    """
+    index: dict[Symbol, list[Any]] = {}
+    for term in Add.make_args(expression):
+        for symbol in term.free_symbols:
+            index.setdefault(symbol, []).append(term)
+    return index
+
+
+def closed_form_derivative(terms: Sequence[Any], symbol: Symbol) -> Any | None:
+    """Differentiate a monomial term without `diff`/`simplify`.
+
+    `terms` are the additive terms of the expression that contain `symbol` (see
+    `terms_by_symbol`). When there is exactly one and it is a monomial
+    `c * symbol**a * ...`, the partial derivative is `a * term / symbol`, which
+    SymPy already keeps in the same canonical form that `simplify(diff(...))`
+    would return. Returns None when the structure does not apply so callers
+    fall back to the general path.
+    """
+    if not terms:
+        return S.Zero
+    if len(terms) != 1:
+        return None
+    term = terms[0]
+    exponents = monomial_exponents(term)
+    if exponents is None:
+        return None
+    return exponents[symbol] * term / symbol
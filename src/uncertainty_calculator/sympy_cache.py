@@ -0,0 +1,175 @@
+"""Monitoring and bounded clearing of SymPy's process-wide caches.
+
+SymPy memoizes most core operations (construction, `diff`, `subs`, assumption
+queries, ...) in per-function LRU caches registered in
+`sympy.core.cache.CACHE`. A long-running worker that sees many distinct
+formulas keeps up to `SYMPY_CACHE_SIZE` entries in each of them, and those
+entries pin large expression trees. `set_sympy_cache_policy` clears them
+periodically or once they exceed a size, from `maybe_clear_sympy_cache`,
+which the calculator calls after every run.
+
+Clearing is safe for this package's own caches (parsed expressions,
+derivatives, compiled equations, rendered results): SymPy objects are
+immutable and compare by value, so entries built before a clear remain valid
+and are still hit afterwards.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from sympy.core.cache import CACHE, clear_cache
+
+
+@dataclass(frozen=True)
+class SympyCacheInfo:
+    """Totals over SymPy's registered function caches.
+
+    Attributes:
+        functions: Number of cached SymPy functions.
+        entries: Entries currently held across all of them.
+        hits: Cache hits since the last clear.
+        misses: Cache misses since the last clear.
+        clears: Clears performed through this module.
+
+    """
+
+    functions: int
+    entries: int
+    hits: int
+    misses: int
+    clears: int
+
+
+@dataclass(frozen=True)
+class SympyCachePolicy:
+    """When `maybe_clear_sympy_cache` clears SymPy's caches; unset limits never trigger.
+
+    Attributes:
+        every_runs: Clear after this many calls.
+        max_entries: Clear once the caches hold more entries than this.
+        interval: Clear when this many seconds have passed since the last clear.
+
+    """
+
+    every_runs: int | None = None
+    max_entries: int | None = None
+    interval: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate that every limit is positive."""
+        for name in ("every_runs", "max_entries", "interval"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                msg = f"{name} must be positive (got {value!r})"
+                raise ValueError(msg)
+
+    @property
+    def active(self) -> bool:
+        """Whether any limit is set."""
+        return (self.every_runs, self.max_entries, self.interval) != (None, None, None)
+
+
+class SympyCacheGuard:
+    """Counts runs and clears SymPy's caches according to a `SympyCachePolicy`."""
+
+    def __init__(self, policy: SympyCachePolicy | None = None) -> None:
+        """Create a guard with `policy` (default: never clear automatically)."""
+        self.policy = policy or SympyCachePolicy()
+        self.clears = 0
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._last_clear = time.monotonic()
+
+    def set_policy(self, policy: SympyCachePolicy) -> None:
+        """Replace the policy and restart the run count."""
+        with self._lock:
+            self.policy = policy
+            self._runs = 0
+
+    def clear(self) -> None:
+        """Clear SymPy's caches now (this package's own caches are kept)."""
+        with self._lock:
+            clear_cache()
+            self.clears += 1
+            self._runs = 0
+            self._last_clear = time.monotonic()
+
+    def maybe_clear(self) -> bool:
+        """Count one run and clear if the policy says so; return whether it did.
+
+        Without a policy this returns after one attribute check. Entry counts
+        are only summed when `max_entries` is set.
+        """
+        policy = self.policy
+        if not policy.active:
+            return False
+        with self._lock:
+            self._runs += 1
+            due = (
+                (policy.every_runs is not None and self._runs >= policy.every_runs)
+                or (
+                    policy.interval is not None
+                    and time.monotonic() - self._last_clear >= policy.interval
+                )
+                or (
+                    policy.max_entries is not None
+                    and sum(info.currsize for info in _cache_infos()) > policy.max_entries
+                )
+            )
+        if due:
+            self.clear()
+        return due
+
+    def info(self) -> SympyCacheInfo:
+        """Return entry and hit/miss totals of SymPy's caches."""
+        entries = hits = misses = functions = 0
+        for info in _cache_infos():
+            functions += 1
+            entries += info.currsize
+            hits += info.hits
+            misses += info.misses
+        return SympyCacheInfo(functions, entries, hits, misses, self.clears)
+
+
+GUARD = SympyCacheGuard()
+"""The process-wide guard consulted after every calculator run."""
+
+
+def sympy_cache_info() -> SympyCacheInfo:
+    """Return entry and hit/miss totals of SymPy's caches."""
+    return GUARD.info()
+
+
+def clear_sympy_cache() -> None:
+    """Clear SymPy's caches now (this package's own caches are kept)."""
+    GUARD.clear()
+
+
+def set_sympy_cache_policy(
+    every_runs: int | None = None, max_entries: int | None = None, interval: float | None = None
+) -> None:
+    """Set when `maybe_clear_sympy_cache` clears; call without arguments to disable it."""
+    GUARD.set_policy(
+        SympyCachePolicy(every_runs=every_runs, max_entries=max_entries, interval=interval)
+    )
+
+
+def maybe_clear_sympy_cache() -> bool:
+    """Count one run on `GUARD` and clear SymPy's caches if its policy says so."""
+    return GUARD.maybe_clear()
+
+
+def _cache_infos() -> Iterator[Any]:
+    # Same unwrapping as `sympy.core.cache.CACHE.print_cache`.
+    for item in CACHE:
+        function = item
+        while hasattr(function, "__wrapped__"):
+            if hasattr(function, "cache_info"):
+                yield function.cache_info()
+                break
+            function = function.__wrapped__
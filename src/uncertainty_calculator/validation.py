@@ -7,10 +7,11 @@ from uncertainty_calculator.parsers import ParseState
 
 def validate_inputs(parse_state: ParseState) -> None:
     """Ensure all symbols referenced in the equation are defined by variables."""
-    defined_symbols = set(parse_state.symbols)
-    free_symbols = parse_state.equation_expression.free_symbols
+    # The expression tree records the names it references, so validating does
+    # not build the SymPy expression.
+    defined_names = {symbol.name for symbol in parse_state.symbols}
 
-    for sym in free_symbols:
-        if sym not in defined_symbols:
+    for sym in parse_state.expression_tree.names:
+        if sym not in defined_names:
             msg = f"Symbol '{sym}' used in equation but not defined in variables."
             raise ValueError(msg)
@@ -0,0 +1,93 @@
+"""Tests for memory-mapped batch outputs."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import Equation, Variable
+from uncertainty_calculator.batch import (
+    BatchOutput,
+    ColumnarInput,
+    propagate_columns,
+    propagate_into,
+)
+from uncertainty_calculator.compiled import compile_equation
+
+EQUATION = Equation(latex_name="y", expression="m*x + b")
+VARIABLES = [
+    Variable(name="m", value=2.5, uncertainty=0.1, latex_name="m"),
+    Variable(name="x", value=4.0, uncertainty=0.2, latex_name="x"),
+    Variable(name="b", value=1.0, uncertainty=0.5, latex_name="b"),
+]
+
+
+def test_propagate_into_fills_disjoint_slices(tmp_path):
+    """Chunks written to disjoint slices should match a single in-memory propagation."""
+    compiled = compile_equation(EQUATION, VARIABLES)
+    x = np.linspace(0.0, 9.0, 10)
+    values = {"m": 2.5, "x": x, "b": 1.0}
+    uncertainties = {"m": 0.1, "x": 0.2, "b": 0.5}
+
+    output = BatchOutput.create(tmp_path, rows=10, names=compiled.names)
+    stop = propagate_into(compiled, {**values, "x": x[:4]}, uncertainties, output, start=0)
+    propagate_into(compiled, {**values, "x": x[4:]}, uncertainties, output, start=stop)
+    output.flush()
+
+    expected = compiled.propagate(values, uncertainties)
+    reopened = BatchOutput.open(tmp_path)
+    assert reopened.names == ("m", "x", "b")
+    np.testing.assert_allclose(reopened.mu, expected.mu)
+    np.testing.assert_allclose(reopened.sigma, expected.sigma)
+    np.testing.assert_allclose(reopened.gradient, expected.gradient)
+    np.testing.assert_allclose(np.load(tmp_path / "contributions.npy"), expected.contributions)
+
+
+def test_propagate_into_rejects_overflowing_chunk(tmp_path):
+    """Chunks past the preallocated rows should be rejected before writing."""
+    compiled = compile_equation(EQUATION, VARIABLES)
+    output = BatchOutput.create(tmp_path, rows=2, names=compiled.names)
+
+    with pytest.raises(ValueError, match="exceed the 2 preallocated rows"):
+        propagate_into(
+            compiled, {"m": 1.0, "x": np.ones(3), "b": 0.0}, {"m": 0, "x": 0, "b": 0}, output, 0
+        )
+
+
+def test_columnar_directory_streams_chunks_into_output(tmp_path):
+    """Directory columns plus scalar fallbacks should match an in-memory propagation."""
+    compiled = compile_equation(EQUATION, VARIABLES)
+    source_dir = tmp_path / "archive"
+    source_dir.mkdir()
+    x = np.linspace(1.0, 2.0, 7)
+    sigma_x = np.full(7, 0.05)
+    np.save(source_dir / "x.npy", x)
+    np.save(source_dir / "sigma_x.npy", sigma_x)
+
+    source = ColumnarInput.from_directory(source_dir, VARIABLES)
+    output = BatchOutput.create(tmp_path / "out", rows=source.rows, names=compiled.names)
+    propagate_columns(compiled, source, output, chunk_rows=3)
+
+    expected = compiled.propagate({"m": 2.5, "x": x, "b": 1.0}, {"m": 0.1, "x": sigma_x, "b": 0.5})
+    np.testing.assert_allclose(output.mu, expected.mu)
+    np.testing.assert_allclose(output.sigma, expected.sigma)
+
+
+def test_uncertainty_only_columns_set_the_row_count(tmp_path):
+    """Per-row uncertainty columns over scalar values should fill every output row."""
+    compiled = compile_equation(EQUATION, VARIABLES)
+    source_dir = tmp_path / "archive"
+    source_dir.mkdir()
+    sigma_x = np.linspace(0.1, 0.5, 5)
+    np.save(source_dir / "sigma_x.npy", sigma_x)
+
+    source = ColumnarInput.from_directory(source_dir, VARIABLES)
+    output = BatchOutput.create(tmp_path / "out", rows=source.rows, names=compiled.names)
+    propagate_columns(compiled, source, output, chunk_rows=2)
+
+    expected = compiled.propagate(
+        {"m": 2.5, "x": 4.0, "b": 1.0}, {"m": 0.1, "x": sigma_x, "b": 0.5}
+    )
+    np.testing.assert_allclose(output.mu, np.full(5, 11.0))
+    np.testing.assert_allclose(output.sigma, expected.sigma)
+    np.testing.assert_allclose(output.contributions, expected.contributions)
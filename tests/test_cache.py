@@ -0,0 +1,79 @@
+"""Tests for cache helpers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from uncertainty_calculator.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """The oldest untouched entry should be evicted first."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (3, 1, 2)
+
+
+def test_lru_cache_resize_rejects_negative_sizes():
+    """Size limits must be non-negative integers."""
+    with pytest.raises(ValueError, match="maxsize must be a non-negative integer"):
+        LRUCache(maxsize=-1)
+
+
+def test_get_or_create_runs_factory_once_under_concurrency():
+    """Concurrent misses on one key should share a single factory call."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=4)
+    n_threads = 8
+    barrier = threading.Barrier(n_threads)
+    calls = []
+
+    def factory() -> int:
+        calls.append(1)
+        time.sleep(0.2)
+        return 42
+
+    def worker() -> int:
+        barrier.wait()
+        return cache.get_or_create("formula", factory)
+
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        results = list(pool.map(lambda _: worker(), range(n_threads)))
+
+    assert results == [42] * n_threads
+    assert len(calls) == 1
+    info = cache.info()
+    assert (info.misses, info.waits) == (1, n_threads - 1)
+
+
+def test_get_or_create_does_not_cache_failures():
+    """A failing factory should raise and leave the key uncached."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=4)
+
+    def failing() -> int:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        cache.get_or_create("formula", failing)
+    assert cache.get_or_create("formula", lambda: 1) == 1
+
+
+def test_lru_cache_counts_evictions():
+    """Entries dropped to honor the size limit should be counted."""
+    cache: LRUCache[str, int] = LRUCache(2)
+    for i, key in enumerate("abcd"):
+        cache.put(key, i)
+    cache.resize(1)
+
+    assert cache.info().evictions == 3
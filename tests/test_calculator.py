@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from tests.conftest import RawCase
 from tests.legacy_calculator import run_legacy_calculator
 from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
@@ -48,6 +50,39 @@ def test_calculator_output_matches_legacy(
     assert actual_output == expected_output
 
 
+@pytest.mark.parametrize(
+    "expression",
+    ["erf(x)*gamma(y) + cbrt(y)", "cot(x) - sec(x) + Max(x, y)", "x*log10(y)"],
+)
+def test_sympy_functions_outside_the_numeric_grammar_match_legacy(expression):
+    """Functions that `sympify` resolved before the restricted grammar should still render."""
+    variables = [
+        Variable(name="x", value=0.5, uncertainty=0.01, latex_name="x"),
+        Variable(name="y", value=2.0, uncertainty=0.05, latex_name="y"),
+    ]
+    calculator = UncertaintyCalculator(
+        digits=Digits(mu=3, sigma=2),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=False,
+    )
+
+    expected_output = run_legacy_calculator(
+        equation=["F", expression],
+        variables=_legacy_variables_from_dataclasses(variables),
+        digits=Digits(mu=3, sigma=2),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=False,
+    )
+
+    assert calculator.run(Equation(latex_name="F", expression=expression), variables) == (
+        expected_output
+    )
+
+
 def test_run_can_be_called_multiple_times_with_new_inputs():
     """Calculator should not leak state between runs when inputs change."""
     digits = Digits(mu=2, sigma=2)
@@ -0,0 +1,121 @@
+"""Tests for compiled numeric evaluation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import Digits, Equation, Variable
+from uncertainty_calculator.compiled import compile_equation
+from uncertainty_calculator.compute import compute
+from uncertainty_calculator.parsers import parse_inputs
+
+
+def test_compiled_propagation_matches_symbolic_compute(equation, variables):
+    """The NumPy kernel should reproduce the symbolic mu and sigma for every case."""
+    compiled = compile_equation(equation, variables)
+    result = compiled.propagate(
+        {var.name: var.value for var in variables},
+        {var.name: var.uncertainty for var in variables},
+    )
+    parse_state = parse_inputs(equation, variables)
+    compute_state = compute(parse_state, Digits(mu=2, sigma=2))
+    expected_mu = float(parse_state.equation_expression.evalf(subs=parse_state.output_number))
+    expected_sigma = (
+        sum(
+            float(num * sigma) ** 2
+            for (_, _, num), sigma in zip(compute_state.pdv_results, parse_state.input_sigma)
+        )
+        ** 0.5
+    )
+
+    assert compiled.backend == "numpy"
+    assert result.mu[0] == pytest.approx(expected_mu, rel=1e-10)
+    assert result.sigma[0] == pytest.approx(expected_sigma, rel=1e-10)
+
+
+def test_compiled_evaluate_broadcasts_batched_inputs():
+    """Array and scalar inputs should broadcast to one row per batch element."""
+    equation = Equation(latex_name="E", expression="0.5*m*v**2")
+    variables = [
+        Variable(name="m", value=1, uncertainty=0.1, latex_name="m"),
+        Variable(name="v", value=1, uncertainty=0.1, latex_name="v"),
+    ]
+    compiled = compile_equation(equation, variables)
+
+    evaluation = compiled.evaluate({"m": 2.0, "v": np.array([1.0, 2.0, 3.0])})
+
+    np.testing.assert_allclose(evaluation.value, [1.0, 4.0, 9.0])
+    np.testing.assert_allclose(evaluation.gradient, [[0.5, 2.0], [2.0, 4.0], [4.5, 6.0]])
+
+
+@pytest.mark.parametrize("native", [False, True])
+def test_exact_variables_are_evaluated_but_not_differentiated(native):
+    """Exact variables stay inputs; only the remaining gradient columns are produced."""
+    equation = Equation(latex_name="F", expression="K*q1*q2/r**2")
+    variables = [
+        Variable(name="K", value=8.99e9, uncertainty=0, latex_name="K"),
+        Variable(name="q1", value=1e-6, uncertainty=1e-8, latex_name="q_1"),
+        Variable(name="q2", value=2e-6, uncertainty=1e-8, latex_name="q_2"),
+        Variable(name="r", value=0.5, uncertainty=0.01, latex_name="r"),
+    ]
+    values = {var.name: var.value for var in variables}
+    uncertainties = {var.name: var.uncertainty for var in variables}
+    full = compile_equation(equation, variables, native=native)
+
+    folded = compile_equation(equation, variables, native=native, exact={"K"})
+    result = folded.propagate(values, uncertainties)
+
+    assert folded.names == full.names
+    assert folded.gradient_names == ("q1", "q2", "r")
+    expected = full.propagate(values, uncertainties)
+    np.testing.assert_allclose(result.mu, expected.mu, rtol=1e-12)
+    np.testing.assert_allclose(result.gradient, expected.gradient[:, 1:], rtol=1e-12)
+    np.testing.assert_allclose(result.sigma, expected.sigma, rtol=1e-12)
+    assert compile_equation(equation, variables, native=native, exact=["K"]) is folded
+
+
+def test_compiled_evaluate_requires_every_variable():
+    """Missing inputs should be reported by name."""
+    compiled = compile_equation(
+        Equation(latex_name="y", expression="a + b"),
+        [
+            Variable(name="a", value=1, uncertainty=0.1, latex_name="a"),
+            Variable(name="b", value=1, uncertainty=0.1, latex_name="b"),
+        ],
+    )
+    with pytest.raises(ValueError, match="Missing values for variables: b"):
+        compiled.evaluate({"a": 1.0})
+
+
+def test_special_functions_evaluate_over_array_columns():
+    """Functions NumPy lacks (erf, gamma and its polygamma derivative) should vectorize."""
+    equation = Equation(latex_name="z", expression="erf(x)*gamma(y) + cbrt(y)")
+    variables = [
+        Variable(name="x", value=0.5, uncertainty=0.1, latex_name="x"),
+        Variable(name="y", value=2.0, uncertainty=0.1, latex_name="y"),
+    ]
+    compiled = compile_equation(equation, variables)
+    x = np.array([0.5, 1.0])
+
+    evaluation = compiled.evaluate({"x": x, "y": 2.0})
+
+    parse_state = parse_inputs(equation, variables)
+    expected = [
+        float(pdv.subs(parse_state.output_number))
+        for _, pdv, _ in compute(parse_state, Digits(mu=3, sigma=2)).pdv_results
+    ]
+    assert evaluation.value.shape == (2,)
+    np.testing.assert_allclose(evaluation.gradient[0], expected, rtol=1e-12)
+
+
+def test_functions_without_a_numeric_implementation_are_rejected():
+    """Undefined functions should fail at compile time with a ValueError."""
+    with pytest.raises(ValueError, match="No NumPy implementation"):
+        compile_equation(
+            Equation(latex_name="z", expression="f(x)*y"),
+            [
+                Variable(name="x", value=0.5, uncertainty=0.1, latex_name="x"),
+                Variable(name="y", value=2.0, uncertainty=0.1, latex_name="y"),
+            ],
+        )
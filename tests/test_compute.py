@@ -3,10 +3,19 @@
 
 from __future__ import annotations
 
-from sympy import S, Symbol
+import numpy as np
+import pytest
+from sympy import S, Symbol, diff, simplify
 
-from uncertainty_calculator import Digits, Equation, Variable
-from uncertainty_calculator.compute import compute
+from tests.legacy_calculator import run_legacy_calculator
+from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
+from uncertainty_calculator.compiled import clear_compiled_cache, compiled_cache_info
+from uncertainty_calculator.compute import (
+    clear_derivative_cache,
+    compute,
+    compute_numeric,
+    derivative_cache_info,
+)
 from uncertainty_calculator.parsers import parse_inputs
 
 
@@ -26,3 +35,165 @@ def test_compute_zero_uncertainty_sets_zero_derivative_and_sigma():
     assert pdv_expr == S.Zero
     assert pdv_num == S.Zero
     assert compute_state.result_sigma == "0"
+
+
+def test_compute_monomial_fast_path_matches_general_derivative():
+    """Closed-form partials of monomials should equal simplified symbolic derivatives."""
+    equation = Equation(latex_name="y", expression="0.5*m*v**2/sqrt(t) + 3*c")
+    variables = [
+        Variable(name=name, value=value, uncertainty=0.1, latex_name=name)
+        for name, value in (("m", 2.0), ("v", 3.0), ("t", 4.0), ("c", 5.0))
+    ]
+    parse_state = parse_inputs(equation, variables)
+    compute_state = compute(parse_state, digits=Digits(mu=3, sigma=2))
+
+    for symbol, pdv_expr, _ in compute_state.pdv_results:
+        assert pdv_expr == simplify(diff(parse_state.equation_expression, symbol))
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "atan(x/K)*y",
+        "A*(x + y)**2/K",
+        "x*exp(A)*exp(y)",
+        "h*c/(x*k*y)*exp(-h*c/(x*k*y)) + K*y/e_0",
+        "sqrt(x**2 + K*y**2)/A + sin(A)*x/(1 + y)",
+    ],
+)
+def test_exact_variables_render_like_legacy(expression):
+    """Partials of nonlinear formulas with exact variables should match the legacy output."""
+    exact = {"A": 1.5, "K": 4.0, "h": 6.6e-34, "c": 3.0e8, "k": 1.4e-23, "e_0": 8.9e-12}
+    variables = [
+        Variable(name=name, value=value, uncertainty=0.0, latex_name=name)
+        for name, value in exact.items()
+        if name in expression
+    ] + [
+        Variable(name="x", value=0.5, uncertainty=0.01, latex_name="x"),
+        Variable(name="y", value=2.0, uncertainty=0.05, latex_name="y"),
+    ]
+    options = {
+        "last_unit": None,
+        "separate": False,
+        "insert": False,
+        "include_equation_number": False,
+    }
+
+    expected = run_legacy_calculator(
+        equation=["z", expression],
+        variables=[
+            (f"{var.name} = {var.value} +- {var.uncertainty}", var.name) for var in variables
+        ],
+        digits=Digits(mu=3, sigma=2),
+        **options,
+    )
+
+    calculator = UncertaintyCalculator(digits=Digits(mu=3, sigma=2), **options)
+    assert calculator.run(Equation(latex_name="z", expression=expression), variables) == expected
+
+
+def test_compute_reuses_cached_derivatives():
+    """A second compute over the same formula should not re-differentiate it."""
+    clear_derivative_cache()
+    parse_state = _simple_parse_state(value=2.0)
+    first = compute(parse_state, digits=Digits(mu=2, sigma=2))
+    second = compute(parse_state, digits=Digits(mu=2, sigma=2))
+
+    assert first.pdv_results == second.pdv_results
+    info = derivative_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_compute_numeric_matches_symbolic_and_holds_no_sympy_objects(equation, variables):
+    """Numeric-only compute should agree with the symbolic path using plain floats/arrays."""
+    parse_state = parse_inputs(equation, variables)
+    compute_state = compute(parse_state, digits=Digits(mu=2, sigma=2))
+    numeric_state = compute_numeric(equation, variables)
+
+    assert isinstance(numeric_state.mu, float)
+    assert isinstance(numeric_state.sigma, float)
+    assert isinstance(numeric_state.partials, np.ndarray)
+    uncertain = [i for i, var in enumerate(variables) if var.uncertainty]
+    assert numeric_state.names == tuple(variables[i].name for i in uncertain)
+    for i, contribution in zip(uncertain, numeric_state.contributions, strict=True):
+        (_, _, num), sigma = compute_state.pdv_results[i], parse_state.input_sigma[i]
+        assert contribution == pytest.approx(float(num * sigma) ** 2, rel=1e-9, abs=1e-300)
+
+
+def test_prune_drops_negligible_terms_within_the_error_bound():
+    """Pruned contributions should be excluded from sigma and the bound should be exact."""
+    equation = Equation(latex_name="y", expression="a*exp(c) + 1e-4*b + c**2")
+    variables = [
+        Variable(name="a", value=2.0, uncertainty=0.1, latex_name="a"),
+        Variable(name="b", value=1.0, uncertainty=0.1, latex_name="b"),
+        Variable(name="c", value=0.5, uncertainty=0.05, latex_name="c"),
+    ]
+    parse_state = parse_inputs(equation, variables)
+    full_sigma = compute_numeric(equation, variables).sigma
+
+    compute_state = compute(parse_state, Digits(mu=3, sigma=6), prune_threshold=1e-3)
+
+    b = parse_state.symbols[1]
+    assert compute_state.pruned == {b}
+    pruned_sigma = float(compute_state.result_sigma)
+    assert 0 < full_sigma - pruned_sigma <= compute_state.sigma_error_bound * (1 + 1e-9) + 1e-6
+    assert compute_state.sigma_error_bound == pytest.approx(
+        full_sigma - np.sqrt(full_sigma**2 - (1e-4 * 0.1) ** 2)
+    )
+
+
+def test_prune_reuses_the_compiled_kernel():
+    """Pruning the same formula again should not rebuild its numeric kernel."""
+    clear_compiled_cache()
+    parse_state = parse_inputs(
+        Equation(latex_name="y", expression="a*exp(c) + 1e-4*b"),
+        [
+            Variable(name="a", value=2.0, uncertainty=0.1, latex_name="a"),
+            Variable(name="b", value=1.0, uncertainty=0.1, latex_name="b"),
+            Variable(name="c", value=0.5, uncertainty=0.05, latex_name="c"),
+        ],
+    )
+
+    first = compute(parse_state, Digits(mu=3, sigma=2), prune_threshold=1e-3)
+    second = compute(parse_state, Digits(mu=3, sigma=2), prune_threshold=1e-3)
+
+    assert first.sigma_error_bound == second.sigma_error_bound > 0
+    info = compiled_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    ("expression", "pruned"),
+    [("erf(x)*gamma(y) + 1e-6*cbrt(y)*w", {"w"}), ("f(x)*y + 1e-6*w", set())],
+)
+def test_prune_handles_functions_outside_numpy(expression, pruned):
+    """Special functions prune through the kernel; unevaluable formulas are left unpruned."""
+    variables = [
+        Variable(name="x", value=0.5, uncertainty=0.01, latex_name="x"),
+        Variable(name="y", value=3.0, uncertainty=0.02, latex_name="y"),
+        Variable(name="w", value=2.0, uncertainty=0.01, latex_name="w"),
+    ]
+    parse_state = parse_inputs(Equation(latex_name="z", expression=expression), variables)
+    digits = Digits(mu=3, sigma=2)
+
+    compute_state = compute(parse_state, digits, prune_threshold=0.01)
+
+    assert {symbol.name for symbol in compute_state.pruned} == pruned
+    if not pruned:
+        full = compute(parse_state, digits)
+        assert compute_state.result_sigma == full.result_sigma
+        assert compute_state.sigma_error_bound == 0.0
+
+
+def test_prune_threshold_zero_keeps_every_term(equation, variables):
+    """A zero threshold should reproduce the unpruned computation."""
+    parse_state = parse_inputs(equation, variables)
+    digits = Digits(mu=3, sigma=3)
+
+    pruned = compute(parse_state, digits, prune_threshold=0.0)
+    full = compute(parse_state, digits)
+
+    assert pruned.pruned == frozenset()
+    assert (pruned.result_mu, pruned.result_sigma) == (full.result_mu, full.result_sigma)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        compute(parse_state, digits, prune_threshold=2.0)
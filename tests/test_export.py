@@ -0,0 +1,139 @@
+"""Tests for standalone module export."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import Equation, Variable
+from uncertainty_calculator.compute import compute_numeric
+from uncertainty_calculator.export import export_module
+
+EQUATION = Equation(latex_name="I", expression="I0 * exp(-t/tau) * sin(omega*t + phi)")
+VARIABLES = [
+    Variable(name="I0", value=2.0, uncertainty=0.05, latex_name="I_0"),
+    Variable(name="t", value=0.25, uncertainty=0.01, latex_name="t"),
+    Variable(name="tau", value=1.2, uncertainty=0.02, latex_name=r"\tau"),
+    Variable(name="omega", value=3.14, uncertainty=0.01, latex_name=r"\omega"),
+    Variable(name="phi", value=0.1, uncertainty=0.02, latex_name=r"\phi"),
+]
+
+_IMPORT_WITHOUT_SYMPY = """
+import importlib.util, json, sys
+sys.modules["sympy"] = None
+sys.modules["uncertainty_calculator"] = None
+spec = importlib.util.spec_from_file_location("generated", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+args = json.loads(sys.argv[2])
+print(json.dumps([module.value(*args), list(module.gradient(*args)), module.sigma(*args)]))
+"""
+
+
+def test_exported_module_runs_without_sympy(tmp_path):
+    """The generated module should import with SymPy blocked and match numeric compute."""
+    path = tmp_path / "generated.py"
+    export_module(EQUATION, VARIABLES, path, include_latex=True)
+    args = [var.value for var in VARIABLES]
+
+    completed = subprocess.run(
+        [sys.executable, "-c", _IMPORT_WITHOUT_SYMPY, str(path), json.dumps(args)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    value, gradient, sigma = json.loads(completed.stdout)
+
+    expected = compute_numeric(EQUATION, VARIABLES)
+    assert value == pytest.approx(expected.mu, rel=1e-12)
+    assert gradient == pytest.approx(list(expected.partials), rel=1e-12)
+    assert sigma == pytest.approx(expected.sigma, rel=1e-12)
+
+
+def test_export_is_deterministic_across_processes():
+    """Regenerating in a fresh interpreter with another hash seed should be byte-identical."""
+    first = export_module(EQUATION, VARIABLES, backend="numpy", include_latex=True)
+    script = (
+        "from tests.test_export import EQUATION, VARIABLES;"
+        "from uncertainty_calculator.export import export_module;"
+        "print(export_module(EQUATION, VARIABLES, backend='numpy', include_latex=True), end='')"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONHASHSEED": "12345", "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert completed.stdout == first
+
+
+@pytest.mark.parametrize("name", ["math", "gradient", "sum", "zip", "value", "sigma"])
+def test_export_rejects_names_that_clash_with_generated_code(name):
+    """Variable names reused by the generated module should be rejected."""
+    with pytest.raises(ValueError, match="clashes with a name used by the generated module"):
+        export_module(
+            Equation(latex_name="y", expression=f"{name} + 1"),
+            [Variable(name=name, value=1, uncertainty=0.1, latex_name="m")],
+        )
+
+
+def _load(source, tmp_path):
+    path = tmp_path / "generated.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("generated", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("backend", ["math", "numpy"])
+@pytest.mark.parametrize("expression", ["Abs(x - y)", "Max(x, y)*erf(y)", "Min(x, 2*y)"])
+def test_exported_functions_match_numeric_compute(tmp_path, backend, expression):
+    """Absolute values, Max/Min and math functions should export with their imports."""
+    equation = Equation(latex_name="z", expression=expression)
+    variables = [
+        Variable(name="x", value=0.4, uncertainty=0.05, latex_name="x"),
+        Variable(name="y", value=0.7, uncertainty=0.02, latex_name="y"),
+    ]
+    if backend == "numpy" and "erf" in expression:
+        with pytest.raises(ValueError, match="No NumPy implementation for erf"):
+            export_module(equation, variables, backend=backend)
+        return
+
+    module = _load(export_module(equation, variables, backend=backend), tmp_path)
+
+    expected = compute_numeric(equation, variables)
+    assert module.value(0.4, 0.7) == pytest.approx(expected.mu, rel=1e-12)
+    assert list(module.gradient(0.4, 0.7)) == pytest.approx(list(expected.partials), rel=1e-12)
+    assert module.sigma(0.4, 0.7) == pytest.approx(expected.sigma, rel=1e-12)
+
+
+def test_numpy_export_evaluates_max_over_arrays(tmp_path):
+    """Max/Min print through `functools.reduce`, which the numpy module must import."""
+    equation = Equation(latex_name="z", expression="Max(x, y)")
+    variables = [
+        Variable(name="x", value=1.0, uncertainty=0.1, latex_name="x"),
+        Variable(name="y", value=2.0, uncertainty=0.1, latex_name="y"),
+    ]
+    source = export_module(equation, variables, backend="numpy")
+    assert "import functools" in source
+
+    module = _load(source, tmp_path)
+    np.testing.assert_allclose(module.value(np.array([1.0, 3.0]), np.array([2.0, 2.0])), [2, 3])
+
+
+def test_export_rejects_functions_without_a_printable_implementation():
+    """Derivatives the backend cannot print should fail at export time, not on import."""
+    with pytest.raises(ValueError, match="Cannot export"):
+        export_module(
+            Equation(latex_name="z", expression="gamma(x)"),
+            [Variable(name="x", value=1.5, uncertainty=0.1, latex_name="x")],
+            backend="numpy",
+        )
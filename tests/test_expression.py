@@ -0,0 +1,78 @@
+"""Tests for the restricted-grammar expression parser."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sympy import srepr, symbols, sympify
+
+from uncertainty_calculator.expression import parse_tree
+
+NAMES = ("K", "eta", "u", "l", "phi", "e_0", "e_r")
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "(K*pi*eta*u*l)/(4*pi*phi*e_0*e_r)",
+        "-K^2*eta - u/3 + 0.1*l - 1.25e-3 + 2/3",
+        "sqrt(u) * exp(-l/eta) + log(phi, 10) - Abs(e_r)**-0.5 + E",
+        "erf(u)*gamma(eta) + cbrt(l) - Max(K, phi) + log10(e_0)*sec(e_r)",
+    ],
+)
+def test_to_sympy_matches_sympify(expression):
+    """Conversion should build exactly the expression `sympify` builds."""
+    symbol_map = dict(zip(NAMES, symbols(list(NAMES))))
+
+    converted = parse_tree(expression, NAMES).to_sympy(symbol_map)
+
+    assert srepr(converted) == srepr(sympify(expression, locals=symbol_map))
+
+
+def test_evaluate_is_vectorized_without_sympy():
+    """Numeric evaluation should broadcast NumPy arrays through the tree."""
+    tree = parse_tree("a*sin(b) + 2^a", ("a", "b"))
+
+    result = tree.evaluate({"a": np.array([1.0, 2.0]), "b": 0.5})
+
+    np.testing.assert_allclose(result, np.array([1.0, 2.0]) * np.sin(0.5) + [2.0, 4.0])
+    assert tree.names == ("a", "b")
+
+
+@pytest.mark.parametrize(
+    ("expression", "message"),
+    [
+        ("m*x + b", "Symbol 'b' used in equation but not defined"),
+        ("plot(m)", "Unsupported function 'plot'"),
+        ("m.conjugate()", "Unsupported function 'm.conjugate'"),
+        ("m.real", "Unsupported syntax Attribute"),
+        ("m % 2", "Unsupported operator Mod"),
+        ("'m'", "Unsupported literal"),
+        ("m +", "Invalid equation expression"),
+        ("x(m)", "cannot be called"),
+        ("atan2(m)", "takes 2 positional"),
+    ],
+)
+def test_parse_tree_rejects_invalid_input(expression, message):
+    """Invalid identifiers and syntax should fail with a descriptive ValueError."""
+    with pytest.raises(ValueError, match=message):
+        parse_tree(expression, ("m", "x"))
+
+
+def test_evaluate_rejects_symbolic_only_functions():
+    """Functions without a numeric implementation should be named in the error."""
+    tree = parse_tree("erf(a) + sin(a)", ("a",))
+
+    assert tree.functions == ("erf", "sin")
+    with pytest.raises(ValueError, match="No numeric implementation for functions: erf"):
+        tree.evaluate({"a": 0.5})
+
+
+def test_evaluate_handles_long_sums():
+    """A sum with thousands of terms should compile without hitting the recursion limit."""
+    names = tuple(f"x_{i}" for i in range(2000))
+    tree = parse_tree(" - ".join(names), names)
+
+    result = tree.evaluate(dict.fromkeys(names, 1.0))
+
+    assert result == 1.0 - (len(names) - 1)
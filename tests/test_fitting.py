@@ -0,0 +1,61 @@
+"""Tests for weighted least-squares fits."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import Equation, Equations, Variable
+from uncertainty_calculator.fitting import linear_fit, polynomial_fit
+from uncertainty_calculator.multi import compile_equations
+
+X = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+Y = np.array([1.1, 2.9, 5.2, 6.8, 9.1])
+SIGMA = np.array([0.1, 0.2, 0.1, 0.2, 0.3])
+
+
+def test_linear_fit_matches_numpy_polyfit():
+    """Parameters and unscaled covariance should agree with `numpy.polyfit`."""
+    fit = linear_fit(X, Y, SIGMA)
+
+    expected, expected_cov = np.polyfit(X, Y, 1, w=1 / SIGMA, cov="unscaled")
+    # polyfit orders coefficients by decreasing power.
+    np.testing.assert_allclose(fit.coefficients[0], expected[::-1])
+    np.testing.assert_allclose(fit.covariance[0], expected_cov[::-1, ::-1])
+    assert fit.dof == 3
+
+
+def test_polynomial_fit_is_vectorized_over_datasets():
+    """A batch of datasets should give the same result as fitting each one alone."""
+    rng = np.random.default_rng(1)
+    ys = 1 + 2 * X - 0.5 * X**2 + rng.normal(scale=0.05, size=(4, X.size))
+
+    batch = polynomial_fit(X, ys, 0.05, degree=2, absolute_sigma=False)
+
+    for d in range(ys.shape[0]):
+        single = polynomial_fit(X, ys[d], 0.05, degree=2, absolute_sigma=False)
+        np.testing.assert_allclose(batch.coefficients[d], single.coefficients[0])
+        np.testing.assert_allclose(batch.covariance[d], single.covariance[0])
+
+
+def test_fit_parameters_feed_correlated_propagation():
+    """Propagating with the fit covariance should match the analytic prediction band."""
+    fit = linear_fit(X, Y, SIGMA)
+    x0 = Variable(name="x_0", value=2.5, uncertainty=0.0, latex_name="x_0")
+    variables = [*fit.variables(["a", "b"]), x0]
+    compiled = compile_equations(Equations([Equation("y_0", "a + b*x_0")]), variables)
+
+    result = compiled.propagate(
+        {var.name: var.value for var in variables},
+        covariance=fit.input_covariance(variables, ["a", "b"]),
+    )
+
+    cov = fit.covariance[0]
+    expected = cov[0, 0] + 2 * 2.5 * cov[0, 1] + 2.5**2 * cov[1, 1]
+    assert result.sigma[0, 0] == pytest.approx(expected**0.5)
+
+
+def test_fit_rejects_too_few_points():
+    """A fit needs at least as many points as parameters."""
+    with pytest.raises(ValueError, match="Not enough points"):
+        polynomial_fit([0.0, 1.0], [0.0, 1.0], 0.1, degree=2)
@@ -0,0 +1,141 @@
+"""Tests for equations over indexed variables."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import (
+    Digits,
+    Equation,
+    IndexedVariable,
+    UncertaintyCalculator,
+    Variable,
+)
+from uncertainty_calculator.compute import (
+    clear_derivative_cache,
+    compute_numeric,
+    derivative_cache_info,
+)
+from uncertainty_calculator.indexed import (
+    clear_lambdified_cache,
+    compute_indexed,
+    lambdified_cache_info,
+    parse_indexed,
+)
+
+RNG = np.random.default_rng(7)
+X = RNG.uniform(1.0, 3.0, 6)
+SIGMA_X = RNG.uniform(0.01, 0.1, 6)
+W = RNG.uniform(1.0, 2.0, 6)
+INDEXED = [
+    IndexedVariable(name="x", values=X, uncertainties=SIGMA_X, latex_name="x"),
+    IndexedVariable(name="w", values=W, uncertainties=0.02, latex_name="w"),
+    Variable(name="y", value=2.0, uncertainty=0.05, latex_name="y"),
+]
+EXPANDED = [
+    *(Variable(f"x{j}", X[j], SIGMA_X[j], f"x_{j}") for j in range(6)),
+    *(Variable(f"w{j}", W[j], 0.02, f"w_{j}") for j in range(6)),
+    Variable(name="y", value=2.0, uncertainty=0.05, latex_name="y"),
+]
+
+
+def _joined(template: str) -> str:
+    return "+".join(template.format(j=j) for j in range(6))
+
+
+@pytest.mark.parametrize(
+    ("expression", "expanded"),
+    [
+        ("sum(x[i])/N", f"({_joined('x{j}')})/6"),
+        ("sum(w[i]*x[i])/sum(w[i])", f"({_joined('w{j}*x{j}')})/({_joined('w{j}')})"),
+        (
+            "y*sum(x[i]^2)/N + sum(exp(x[i]/y))",
+            f"y*({_joined('x{j}**2')})/6 + {_joined('exp(x{j}/y)')}",
+        ),
+        (
+            "sqrt(sum((x[i] - sum(x[i])/N)^2)/(N - 1))",
+            f"sqrt(({_joined('(x{j} - (' + _joined('x{j}') + ')/6)**2')})/5)",
+        ),
+    ],
+)
+def test_indexed_results_match_expanded_scalar_variables(expression, expanded):
+    """Mu and sigma should equal those of the formula written out over N scalar variables."""
+    parse_state = parse_indexed(Equation("z", expression), INDEXED)
+    result = compute_indexed(parse_state, Digits(mu=4, sigma=2))
+    reference = compute_numeric(Equation("z", expanded), EXPANDED)
+
+    assert result.mu == pytest.approx(reference.mu, rel=1e-12)
+    assert result.sigma == pytest.approx(reference.sigma, rel=1e-12)
+
+
+def test_symbolic_work_does_not_depend_on_the_number_of_readings():
+    """A longer array should reuse every cached derivative and evaluator of a shorter one."""
+    clear_derivative_cache()
+    clear_lambdified_cache()
+    equation = Equation("z", "sum(w[i]*x[i])/sum(w[i])")
+    for n in (3, 300):
+        variables = [
+            IndexedVariable("x", np.linspace(1.0, 2.0, n), 0.1, "x"),
+            IndexedVariable("w", np.linspace(1.0, 3.0, n), 0.01, "w"),
+        ]
+        compute_indexed(parse_indexed(equation, variables), Digits(mu=3, sigma=2))
+        if n == 3:
+            misses = derivative_cache_info().misses
+            lambdified_misses = lambdified_cache_info().misses
+
+    assert derivative_cache_info().misses == misses
+    assert lambdified_cache_info().misses == lambdified_misses
+    assert lambdified_cache_info().hits >= lambdified_misses
+
+
+def test_run_indexed_renders_summation_notation():
+    """The equation, partials and sigma should be written with sums over i."""
+    calculator = UncertaintyCalculator(
+        digits=Digits(mu=3, sigma=1),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=False,
+    )
+    variables = [IndexedVariable("x", [1.0, 2.0, 3.0, 4.0], 0.2, "x")]
+
+    latex = calculator.run_indexed(Equation(r"\bar{x}", "sum(x[i])/N"), variables)
+
+    assert "\\bar{x}&=\\frac{\\sum_{i=1}^{N} {x}_{i}}{N}=2.5\\\\" in latex
+    assert "\\frac{\\partial \\bar{x} }{\\partial {x}_{i} }&=\\frac{1}{N}=0.25\\\\" in latex
+    assert "\\sum_{i=1}^{N}\\left(\\frac{\\partial \\bar{x} }{\\partial {x}_{i} }" in latex
+    assert "\\bar{x}&=2.5 \\pm 0.1" in latex
+
+
+@pytest.mark.parametrize(
+    ("expression", "message"),
+    [
+        ("x/N", "must be subscripted"),
+        ("x[i] + sum(x[i])", "only be used inside sum"),
+        ("sum(x[i]) + sum(x[j])", "same index"),
+        ("sum(y)", "does not reference any indexed variable"),
+        ("sum(x[i], 2)", "takes 1 positional"),
+        ("sum(q[i])", "Unsupported subscript"),
+        ("sum(x[i]*q)", "not defined in variables"),
+    ],
+)
+def test_invalid_indexed_expressions_are_rejected(expression, message):
+    """Index notation errors should raise a ValueError naming the problem."""
+    variables = [IndexedVariable("x", [1.0, 2.0], 0.1, "x"), Variable("y", 1.0, 0.1, "y")]
+    with pytest.raises(ValueError, match=message):
+        parse_indexed(Equation("z", expression), variables)
+
+
+def test_indexed_variables_must_share_length_and_avoid_reserved_names():
+    """Readings must line up across variables, and N is the reading count."""
+    with pytest.raises(ValueError, match="same number of readings"):
+        parse_indexed(
+            Equation("z", "sum(x[i]*w[i])"),
+            [IndexedVariable("x", [1.0, 2.0], 0.1, "x"), IndexedVariable("w", [1.0], 0.1, "w")],
+        )
+    with pytest.raises(ValueError, match="reserved"):
+        parse_indexed(
+            Equation("z", "sum(x[i])/N"),
+            [IndexedVariable("x", [1.0, 2.0], 0.1, "x"), Variable("N", 2.0, 0.0, "N")],
+        )
@@ -0,0 +1,156 @@
+"""Tests for worst-case interval bounds."""
+
+from __future__ import annotations
+
+import math
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
+from uncertainty_calculator.expression import FUNCTIONS, parse_tree
+from uncertainty_calculator.interval import (
+    INTERVAL_NAMESPACE,
+    Interval,
+    outward_decimal,
+    parse_state_bounds,
+    propagate_bounds,
+)
+from uncertainty_calculator.parsers import parse_inputs
+
+NAMES = ("a", "b", "c")
+VALUES = {"a": 1.5, "b": 0.3, "c": 4.0}
+UNCERTAINTIES = {"a": 0.1, "b": 0.02, "c": 0.5}
+
+
+def test_namespace_covers_the_grammar():
+    """Every function and constant of the expression grammar needs an interval version."""
+    assert set(FUNCTIONS) | {"pi", "E"} == set(INTERVAL_NAMESPACE)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "a*sin(b) + a**2/c",
+        "sqrt(a)*exp(-b)/c",
+        "cos(4*a*b)*log(c, 10) - tan(b)",
+        "(a - b)**3 + cosh(a - 1.5) + abs(b - 0.3)*acos(b)",
+        "a**b**0.5 + atan2(b, a - 1.5)",
+    ],
+)
+def test_bounds_enclose_sampled_values(expression):
+    """No point of the input box may evaluate outside the bounds."""
+    tree = parse_tree(expression, NAMES)
+    bounds = propagate_bounds(tree, VALUES, UNCERTAINTIES, coverage_factor=2.0)
+
+    rng = np.random.default_rng(0)
+    box = {
+        name: VALUES[name] + 2 * UNCERTAINTIES[name] * rng.uniform(-1, 1, 50_000) for name in NAMES
+    }
+    corners = {name: VALUES[name] + 2 * UNCERTAINTIES[name] * np.array([-1, 1]) for name in NAMES}
+    for points in (box, corners):
+        sampled = tree.evaluate(points)
+        assert np.all(bounds.contains(sampled))
+
+
+def test_bounds_are_rounded_outward():
+    """Even exactly representable results should not be reported as tight equalities."""
+    bounds = propagate_bounds(
+        parse_tree("a + b", ("a", "b")), {"a": 1.0, "b": 2.0}, {"a": 0, "b": 0}
+    )
+
+    assert bounds.lower < 3.0 < bounds.upper
+    assert bounds.width < 1e-14
+
+
+def test_special_cases_follow_interval_rules():
+    """Even powers, periodic extrema, poles and domain errors need dedicated handling."""
+    x = Interval(-1.0, 2.0)
+    assert float((x**2).lower) == 0.0
+    assert float(INTERVAL_NAMESPACE["sin"](Interval(0.0, 3.0)).upper) == 1.0
+    assert float((1 / x).upper) == np.inf
+    assert np.isnan(INTERVAL_NAMESPACE["sqrt"](x).lower)
+
+
+def test_bounds_are_vectorized_over_rows():
+    """Array inputs should bound every row independently."""
+    tree = parse_tree("a*b", ("a", "b"))
+    bounds = propagate_bounds(
+        tree, {"a": np.array([1.0, 2.0, 3.0]), "b": 2.0}, {"a": 0.1, "b": 0.5}
+    )
+
+    assert bounds.lower.shape == (3,)
+    np.testing.assert_allclose(bounds.lower, [0.9 * 1.5, 1.9 * 1.5, 2.9 * 1.5])
+    np.testing.assert_allclose(bounds.upper, [1.1 * 2.5, 2.1 * 2.5, 3.1 * 2.5])
+
+
+def test_parse_state_bounds_reuse_parsed_tree():
+    """Bounds from a parse state should equal bounds from the raw values."""
+    variables = [
+        Variable(name=n, value=VALUES[n], uncertainty=UNCERTAINTIES[n], latex_name=n) for n in NAMES
+    ]
+    parse_state = parse_inputs(Equation(latex_name="f", expression="a/c - b"), variables)
+
+    bounds = parse_state_bounds(parse_state, coverage_factor=3.0)
+    expected = propagate_bounds(parse_state.expression_tree, VALUES, UNCERTAINTIES, 3.0)
+
+    assert (float(bounds.lower), float(bounds.upper)) == (
+        float(expected.lower),
+        float(expected.upper),
+    )
+
+
+def test_outward_decimal_rounds_away_from_the_interval():
+    """Printed endpoints must still enclose the computed interval."""
+    assert tuple(map(str, outward_decimal(0.6722, 1.5303, 3))) == ("0.67", "1.54")
+    with pytest.raises(ValueError, match="undefined"):
+        outward_decimal(float("nan"), 1.0, 3)
+
+
+def test_outward_decimal_rounds_the_finite_endpoint_of_a_half_bounded_interval():
+    """An infinite endpoint should not leave the other one at full float precision."""
+    lower, upper = outward_decimal(math.exp(660), math.inf, 3)
+
+    assert upper == Decimal("Infinity")
+    assert len(lower.as_tuple().digits) == 3
+    assert lower <= Decimal(math.exp(660))
+
+
+def test_calculator_renders_bounds_after_the_result():
+    """With a coverage factor the bounds follow the usual output in their own environment."""
+    variables = [
+        Variable(name=n, value=VALUES[n], uncertainty=UNCERTAINTIES[n], latex_name=n) for n in NAMES
+    ]
+    equation = Equation(latex_name="f", expression="a*sin(b) + a**2/c")
+    options = {"last_unit": r"\text{V}", "separate": False, "insert": True}
+
+    plain = UncertaintyCalculator(Digits(3, 2), include_equation_number=False, **options)
+    bounded = UncertaintyCalculator(
+        Digits(3, 2), include_equation_number=False, coverage_factor=2.0, **options
+    )
+
+    output = bounded.run(equation, variables)
+    assert output.startswith(plain.run(equation, variables) + "\n")
+    assert output.endswith(
+        "\\begin{equation*}\nf\\in \\left[0.67, 1.54\\right]\\ \\text{V}\n\\end{equation*}\n"
+    )
+
+
+def test_calculator_renders_undefined_bounds_outside_the_domain():
+    """Bounds reaching outside the equation's domain should render, not fail the run."""
+    calculator = UncertaintyCalculator(
+        Digits(3, 2),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=False,
+        coverage_factor=1.0,
+    )
+
+    output = calculator.run(
+        Equation(latex_name="f", expression="sqrt(a)"),
+        [Variable(name="a", value=0.1, uncertainty=0.2, latex_name="a")],
+    )
+
+    assert output.endswith("\\begin{equation*}\nf\\in \\text{undefined}\n\\end{equation*}\n")
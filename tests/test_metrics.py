@@ -0,0 +1,88 @@
+"""Tests for the metrics registry and Prometheus exporter."""
+
+from __future__ import annotations
+
+import pytest
+
+from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
+from uncertainty_calculator.cache import LRUCache
+from uncertainty_calculator.metrics import (
+    REGISTRY,
+    MetricsRegistry,
+    cache_collector,
+    disable_metrics,
+    enable_metrics,
+)
+
+
+@pytest.fixture
+def global_metrics():
+    """Enable the process-wide registry for one test."""
+    REGISTRY.reset()
+    enable_metrics()
+    yield REGISTRY
+    disable_metrics()
+    REGISTRY.reset()
+
+
+def test_disabled_registry_records_nothing():
+    """Recording calls on a disabled registry should be no-ops."""
+    registry = MetricsRegistry()
+
+    registry.inc("events_total")
+    registry.set_gauge("depth", 3)
+    with registry.time("latency_seconds"):
+        pass
+
+    snapshot = registry.snapshot()
+    assert (snapshot.counters, snapshot.gauges, snapshot.histograms) == ({}, {}, {})
+
+
+def test_prometheus_text_has_cumulative_buckets_and_labels():
+    """Histograms should export cumulative `le` buckets, `_sum` and `_count`."""
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.enabled = True
+    registry.inc("events_total", 2, kind='a"b')
+    for value in (0.05, 0.5, 5.0):
+        registry.observe("latency_seconds", value)
+
+    text = registry.to_prometheus()
+
+    assert "# TYPE uncertainty_calculator_events_total counter" in text
+    assert 'uncertainty_calculator_events_total{kind="a\\"b"} 2' in text
+    assert 'uncertainty_calculator_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'uncertainty_calculator_latency_seconds_bucket{le="1"} 2' in text
+    assert 'uncertainty_calculator_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "uncertainty_calculator_latency_seconds_count 3" in text
+
+
+def test_cache_collector_reports_evictions(tmp_path):
+    """Cache statistics should be pulled into snapshots and file exports."""
+    registry = MetricsRegistry()
+    cache: LRUCache[int, int] = LRUCache(1)
+    registry.register_collector(cache_collector("demo", cache.info))
+    cache.put(1, 1)
+    cache.put(2, 2)
+
+    registry.write_prometheus(tmp_path / "metrics.prom")
+
+    assert registry.snapshot().counters["cache_evictions_total", (("cache", "demo"),)] == 1
+    assert 'cache_entries{cache="demo"} 1' in (tmp_path / "metrics.prom").read_text()
+
+
+def test_run_records_stage_latencies(global_metrics):
+    """`UncertaintyCalculator.run` should time every pipeline stage when enabled."""
+    calculator = UncertaintyCalculator(Digits(mu=2, sigma=2), None, False, False, False)
+    variables = [Variable(name="x", value=2.0, uncertainty=0.1, latex_name="x")]
+
+    calculator.run(Equation(latex_name="y", expression="x**2"), variables)
+    with pytest.raises(ValueError, match="not defined"):
+        calculator.run(Equation(latex_name="y", expression="x*z"), variables)
+
+    snapshot = global_metrics.snapshot()
+    assert snapshot.counters["runs_total", ()] == 2
+    assert snapshot.counters["run_errors_total", ()] == 1
+    # The failing run stops in the parse stage.
+    for stage, count in (("parse", 2), ("validate", 1), ("compute", 1), ("render", 1)):
+        assert snapshot.histograms["stage_seconds", (("stage", stage),)].count == count
+    assert ("cache_hits_total", (("cache", "parse"),)) in snapshot.counters
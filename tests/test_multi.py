@@ -0,0 +1,124 @@
+"""Tests for multi-output equations."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import (
+    Digits,
+    Equation,
+    Equations,
+    UncertaintyCalculator,
+    Variable,
+    multi,
+)
+from uncertainty_calculator.compiled import compile_equation
+from uncertainty_calculator.multi import (
+    clear_compiled_equations_cache,
+    compile_equations,
+    compiled_equations_cache_info,
+)
+
+EQUATIONS = Equations([
+    Equation(latex_name="A", expression="x*y"),
+    Equation(latex_name="B", expression="x/y + sin(x*y)"),
+])
+VARIABLES = [
+    Variable(name="x", value=2.0, uncertainty=0.1, latex_name="x"),
+    Variable(name="y", value=3.0, uncertainty=0.2, latex_name="y"),
+]
+
+
+def test_compiled_equations_match_single_output_kernels():
+    """Per-output values and sigmas should equal those of each equation compiled alone."""
+    values = {"x": np.array([1.0, 2.0]), "y": 3.0}
+    uncertainties = {"x": 0.1, "y": 0.2}
+
+    result = compile_equations(EQUATIONS, VARIABLES).propagate(values, uncertainties)
+
+    for i, equation in enumerate(EQUATIONS.equations):
+        single = compile_equation(equation, VARIABLES).propagate(values, uncertainties)
+        np.testing.assert_allclose(result.mu[:, i], single.mu)
+        np.testing.assert_allclose(result.sigma[:, i], single.sigma)
+        np.testing.assert_allclose(result.jacobian[:, i], single.gradient)
+
+
+def test_output_covariance_includes_cross_terms():
+    """Off-diagonal entries should be sum(dA/dx_k * dB/dx_k * sigma_k**2)."""
+    equations = Equations([
+        Equation(latex_name="S", expression="x + y"),
+        Equation(latex_name="D", expression="x - y"),
+    ])
+    compiled = compile_equations(equations, VARIABLES)
+
+    result = compiled.propagate({"x": 2.0, "y": 3.0}, {"x": 0.1, "y": 0.2})
+
+    np.testing.assert_allclose(result.covariance[0], [[0.05, -0.03], [-0.03, 0.05]])
+
+
+def test_input_covariance_propagates_correlations():
+    """A full input covariance should be honored instead of independent sigmas."""
+    compiled = compile_equations(Equations([Equation("S", "x + y")]), VARIABLES)
+
+    result = compiled.propagate({"x": 2.0, "y": 3.0}, covariance=[[0.01, 0.01], [0.01, 0.04]])
+
+    assert result.sigma[0, 0] == pytest.approx(0.07**0.5)
+    with pytest.raises(ValueError, match="exactly one"):
+        compiled.propagate({"x": 2.0, "y": 3.0})
+
+
+def test_run_many_renders_each_output_like_run():
+    """Rendered blocks should equal per-output `run` calls."""
+    calculator = UncertaintyCalculator(
+        digits=Digits(mu=3, sigma=3),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=True,
+    )
+
+    output = calculator.run_many(EQUATIONS, VARIABLES)
+
+    assert output.latex == tuple(
+        calculator.run(equation, VARIABLES) for equation in EQUATIONS.equations
+    )
+    assert output.covariance.shape == (2, 2)
+    np.testing.assert_allclose(np.sqrt(np.diag(output.covariance)), output.sigma)
+
+
+def test_run_many_reuses_rendered_partials(monkeypatch):
+    """The joint covariance should come from the rendered partials, without recompiling."""
+    monkeypatch.setattr(multi, "gradient_expressions", lambda _: pytest.fail("recompiled"))
+    calculator = UncertaintyCalculator(
+        digits=Digits(mu=3, sigma=3),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=False,
+    )
+
+    output = calculator.run_many(EQUATIONS, VARIABLES)
+
+    monkeypatch.undo()
+    expected = compile_equations(EQUATIONS, VARIABLES).propagate(
+        {"x": 2.0, "y": 3.0}, {"x": 0.1, "y": 0.2}
+    )
+    np.testing.assert_allclose(output.mu, expected.mu[0], rtol=1e-12)
+    np.testing.assert_allclose(output.covariance, expected.covariance[0], rtol=1e-12)
+
+
+def test_compile_equations_is_cached():
+    """Compiling the same equation set again should reuse the first kernel."""
+    clear_compiled_equations_cache()
+
+    first = compile_equations(EQUATIONS, VARIABLES)
+
+    assert compile_equations(EQUATIONS, VARIABLES) is first
+    assert compiled_equations_cache_info().hits == 1
+
+
+def test_equations_requires_at_least_one_equation():
+    """An empty equation set should be rejected."""
+    with pytest.raises(ValueError, match="at least one"):
+        Equations([])
@@ -0,0 +1,80 @@
+"""Tests for native C kernels."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sympy import S, symbols, zeta
+
+from uncertainty_calculator import Equation, Variable
+from uncertainty_calculator.compiled import clear_compiled_cache, compile_equation
+from uncertainty_calculator.native import CACHE_DIR_ENV, find_compiler, generate_c_source
+
+EQUATION = Equation(latex_name="I", expression="I0 * exp(-t/tau) * sin(omega*t + phi) + pi")
+VARIABLES = [
+    Variable(name=name, value=1.0, uncertainty=0.1, latex_name=name)
+    for name in ("I0", "t", "tau", "omega", "phi")
+]
+
+
+@pytest.mark.skipif(find_compiler() is None, reason="no C compiler available")
+def test_native_kernel_matches_numpy_kernel(tmp_path, monkeypatch):
+    """Native and NumPy backends should agree and share the evaluate interface."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    clear_compiled_cache()
+    rng = np.random.default_rng(0)
+    values = {var.name: rng.uniform(0.5, 2.0, size=100) for var in VARIABLES}
+
+    native = compile_equation(EQUATION, VARIABLES, native=True)
+    reference = compile_equation(EQUATION, VARIABLES)
+
+    assert native.backend == "native"
+    assert len(list(tmp_path.glob("*.so"))) == 1
+    expected = reference.evaluate(values)
+    actual = native.evaluate(values)
+    np.testing.assert_allclose(actual.value, expected.value, rtol=1e-12)
+    np.testing.assert_allclose(actual.gradient, expected.gradient, rtol=1e-12)
+
+    # A fresh compilation reuses the shared library cached on disk.
+    clear_compiled_cache()
+    compile_equation(EQUATION, VARIABLES, native=True)
+    assert len(list(tmp_path.glob("*.so"))) == 1
+
+
+def test_native_falls_back_without_compiler(tmp_path, monkeypatch):
+    """Without a usable compiler the NumPy kernel should be used transparently."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr("uncertainty_calculator.native.find_compiler", lambda: None)
+    clear_compiled_cache()
+
+    compiled = compile_equation(EQUATION, VARIABLES, native=True)
+
+    assert compiled.backend == "numpy"
+    assert compiled.evaluate({var.name: 1.0 for var in VARIABLES}).gradient.shape == (1, 5)
+
+
+def test_unprintable_functions_are_reported_as_unsupported():
+    """SymPy's NotImplementedError-based print errors should mean "no C source"."""
+    x = symbols("x")
+
+    assert generate_c_source([x], zeta(x), [S.Zero]) is None
+
+
+@pytest.mark.skipif(find_compiler() is None, reason="no C compiler available")
+@pytest.mark.parametrize("expression", ["Abs(x)*y", "x**(1/3)*y"])
+def test_native_and_numpy_agree_for_abs_and_cube_roots(expression, tmp_path, monkeypatch):
+    """Abs must compile on both backends, and negative cube roots are nan on both."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    clear_compiled_cache()
+    variables = [Variable("x", -8.0, 0.1, "x"), Variable("y", 2.0, 0.1, "y")]
+    values = {"x": np.array([-8.0, 8.0]), "y": 2.0}
+
+    native = compile_equation(Equation("z", expression), variables, native=True)
+    reference = compile_equation(Equation("z", expression), variables)
+
+    assert native.backend == "native"
+    with np.errstate(invalid="ignore"):
+        expected = reference.evaluate(values)
+    actual = native.evaluate(values)
+    np.testing.assert_allclose(actual.value, expected.value, rtol=1e-12)
+    np.testing.assert_allclose(actual.gradient, expected.gradient, rtol=1e-12)
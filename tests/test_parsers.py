@@ -6,7 +6,14 @@ import pytest
 
 from tests.input_parsers import parse_equation, parse_variables
 from uncertainty_calculator import Equation, Variable
-from uncertainty_calculator.parsers import parse_inputs
+from uncertainty_calculator.parsers import (
+    DEFAULT_PARSE_CACHE_SIZE,
+    clear_parse_cache,
+    parse_cache_info,
+    parse_inputs,
+    set_parse_cache_size,
+)
+from uncertainty_calculator.validation import validate_inputs
 
 
 def test_parse_equation_trims_and_builds_dataclass():
@@ -51,3 +58,53 @@ def test_parsing_rejects_duplicate_variable_names():
     ]
     with pytest.raises(ValueError, match="Duplicate variable name detected"):
         parse_inputs(equation, variables)
+
+
+def test_parse_inputs_reuses_cached_expression():
+    """Repeated parses of the same expression and names should hit the cache."""
+    clear_parse_cache()
+    equation = Equation(latex_name="y", expression="a*b")
+    variables = [
+        Variable(name="a", value=1, uncertainty=0.1, latex_name="a"),
+        Variable(name="b", value=2, uncertainty=0.2, latex_name="b"),
+    ]
+
+    first = parse_inputs(equation, variables)
+    second = parse_inputs(equation, variables)
+
+    assert first.equation_expression is second.equation_expression
+    assert first.symbols == second.symbols
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_parse_inputs_defers_sympy_conversion():
+    """Parsing and validating should not build the SymPy expression until it is used."""
+    clear_parse_cache()
+    parse_state = parse_inputs(
+        Equation(latex_name="y", expression="a*log10(b)"),
+        [
+            Variable(name="a", value=1, uncertainty=0.1, latex_name="a"),
+            Variable(name="b", value=2, uncertainty=0.2, latex_name="b"),
+        ],
+    )
+    validate_inputs(parse_state)
+
+    assert "expression" not in vars(parse_state.parsed_expression)
+    assert parse_state.equation_expression.free_symbols == set(parse_state.symbols)
+    assert "expression" in vars(parse_state.parsed_expression)
+
+
+def test_parse_cache_size_zero_disables_caching():
+    """A zero-sized cache should never retain entries."""
+    set_parse_cache_size(0)
+    try:
+        clear_parse_cache()
+        equation = Equation(latex_name="y", expression="x")
+        variables = [Variable(name="x", value=1, uncertainty=0.1, latex_name="x")]
+        parse_inputs(equation, variables)
+        parse_inputs(equation, variables)
+        assert parse_cache_info().hits == 0
+        assert parse_cache_info().currsize == 0
+    finally:
+        set_parse_cache_size(DEFAULT_PARSE_CACHE_SIZE)
@@ -0,0 +1,59 @@
+"""Tests for streaming Type-A statistics."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator.readings import (
+    RunningStats,
+    rectangular_uncertainty,
+    variables_from_readings,
+)
+
+
+def test_running_stats_match_numpy_across_chunks():
+    """Chunked updates should reproduce the batch mean and sample variance."""
+    rng = np.random.default_rng(0)
+    readings = 1e6 + rng.normal(size=10_001)
+
+    stats = RunningStats().update(readings, chunk_size=97)
+
+    assert stats.count == readings.size
+    assert stats.mean == pytest.approx(readings.mean(), rel=1e-15)
+    assert stats.variance == pytest.approx(readings.var(ddof=1), rel=1e-9)
+
+
+def test_merge_equals_single_stream_and_accepts_iterators():
+    """Merging partial results should equal reducing the concatenated stream."""
+    readings = [1.0, 2.0, 4.0, 8.0, 16.0]
+    left = RunningStats().update(iter(readings[:2]))
+    right = RunningStats().update(x for x in readings[2:])
+
+    merged = left.merge(right)
+
+    assert merged.mean == pytest.approx(np.mean(readings))
+    assert merged.variance == pytest.approx(np.var(readings, ddof=1))
+    assert RunningStats().merge(RunningStats()) == RunningStats()
+
+
+def test_variables_combine_type_a_and_type_b_in_quadrature():
+    """The emitted uncertainty should be hypot(s/sqrt(n), type_b)."""
+    readings = np.array([9.9, 10.1, 10.0, 10.2, 9.8])
+    type_b = rectangular_uncertainty(0.1)
+
+    (variable,) = variables_from_readings({"l": readings}, {"l": "l_0"}, {"l": type_b})
+
+    type_a = readings.std(ddof=1) / math.sqrt(readings.size)
+    assert variable.name == "l"
+    assert variable.latex_name == "l_0"
+    assert variable.value == pytest.approx(10.0)
+    assert variable.uncertainty == pytest.approx(math.hypot(type_a, 0.1 / math.sqrt(3)))
+
+
+def test_single_reading_has_no_type_a_uncertainty():
+    """At least two readings are needed for a sample standard deviation."""
+    with pytest.raises(ValueError, match="At least two readings"):
+        RunningStats().update([1.0]).to_variable("x", "x")
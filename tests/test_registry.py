@@ -0,0 +1,102 @@
+"""Tests for the named equation registry."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from uncertainty_calculator import Equation, Variable
+from uncertainty_calculator.compiled import CompiledEquation
+from uncertainty_calculator.registry import EquationRegistry
+
+VARIABLES = [
+    Variable(name="m", value=2.0, uncertainty=0.1, latex_name="m"),
+    Variable(name="v", value=3.0, uncertainty=0.2, latex_name="v"),
+]
+
+
+def _registry(count: int, registry: EquationRegistry | None = None) -> EquationRegistry:
+    registry = registry or EquationRegistry()
+    for i in range(count):
+        expression = f"{i + 1}*m*v**2 + v"
+        registry.register(f"eq{i}", Equation(latex_name=f"E_{i}", expression=expression), VARIABLES)
+    return registry
+
+
+def test_warmup_compiles_every_entry_and_reports_progress():
+    """All entries should be compiled in the background with one event each."""
+    registry = _registry(4)
+    events = []
+
+    registry.start_warmup(max_workers=2, progress=events.append)
+    assert registry.wait(timeout=120)
+
+    assert sorted(event.name for event in events) == list(registry.names())
+    assert sorted(event.done for event in events) == [1, 2, 3, 4]
+    assert registry.warmup_progress() == (4, 4)
+    assert isinstance(registry.compiled("eq2"), CompiledEquation)
+    registry.shutdown()
+
+
+def test_request_before_warmup_finishes_compiles_only_its_entry(monkeypatch):
+    """A queued entry should be compiled on the requesting thread, leaving others queued."""
+    registry = EquationRegistry()
+    # The first entry occupies the single worker so every other entry stays queued.
+    registry.register("blocker", Equation("B", "m"), VARIABLES)
+    _registry(3, registry)
+    release = threading.Event()
+    monkeypatch.setattr(registry, "_warm", _blocking(registry._warm, "blocker", release))
+    registry.start_warmup(max_workers=1)
+
+    try:
+        compiled = registry.compiled("eq1")
+        assert compiled.evaluate({"m": 1.0, "v": 1.0}).value[0] == pytest.approx(3.0)
+        assert registry.warmup_progress()[0] == 1
+    finally:
+        release.set()
+    assert registry.wait(timeout=120)
+    assert registry.warmup_progress() == (4, 4)
+    registry.shutdown()
+
+
+def _blocking(warm, name, release):
+    def wrapper(entry_name):
+        if entry_name == name:
+            release.wait(timeout=60)
+        return warm(entry_name)
+
+    return wrapper
+
+
+def test_load_json_and_toml_definitions(tmp_path):
+    """Config files should register equations with their variables."""
+    spec = {
+        "energy": {
+            "latex_name": "E",
+            "expression": "0.5*m*v**2",
+            "variables": [
+                {"name": "m", "value": 2.0, "uncertainty": 0.1, "latex_name": "m"},
+                {"name": "v", "value": 3.0, "uncertainty": 0.2, "latex_name": "v"},
+            ],
+        }
+    }
+    (tmp_path / "eqs.json").write_text(json.dumps(spec))
+    (tmp_path / "eqs.toml").write_text(
+        '[momentum]\nlatex_name = "p"\nexpression = "m*v"\n'
+        '[[momentum.variables]]\nname = "m"\nvalue = 2.0\nuncertainty = 0.1\nlatex_name = "m"\n'
+        '[[momentum.variables]]\nname = "v"\nvalue = 3\nuncertainty = 0.2\nlatex_name = "v"\n'
+    )
+    registry = EquationRegistry()
+
+    registry.load(tmp_path / "eqs.json")
+    registry.load(tmp_path / "eqs.toml")
+
+    assert registry.names() == ("energy", "momentum")
+    assert registry["momentum"].variables[1].value == 3.0
+    assert registry.compiled("energy").evaluate({"m": 2.0, "v": 3.0}).value[0] == 9.0
+    with pytest.raises(ValueError, match="already registered"):
+        registry.load(tmp_path / "eqs.json")
+    with pytest.raises(KeyError, match="No equation registered"):
+        registry.compiled("missing")
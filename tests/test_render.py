@@ -46,3 +46,25 @@ def test_zero_uncertainty_renders_sigma_without_empty_sqrt():
     )
     assert "\\sigma_{y}&=0" in output
     assert "sqrt{" not in output
+
+
+def test_pruned_terms_are_not_rendered():
+    """Negligible contributions should be omitted from the partials and sigma lines."""
+    calculator = UncertaintyCalculator(
+        digits=Digits(mu=3, sigma=2),
+        last_unit=None,
+        separate=False,
+        insert=True,
+        include_equation_number=False,
+        prune_threshold=1e-3,
+    )
+    variables = [
+        Variable(name="a", value=2.0, uncertainty=0.1, latex_name="a"),
+        Variable(name="b", value=1.0, uncertainty=0.1, latex_name=r"\beta"),
+    ]
+
+    output = calculator.run(Equation(latex_name="y", expression="a**2 + 1e-5*b"), variables)
+
+    assert r"\partial a" in output
+    assert r"\partial \beta" not in output
+    assert r"\sigma_{\beta}" not in output
@@ -0,0 +1,63 @@
+"""Tests for the streaming report writer."""
+
+from __future__ import annotations
+
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+from tests.conftest import CASES
+from tests.input_parsers import parse_equation, parse_variables
+from uncertainty_calculator import Digits, UncertaintyCalculator
+from uncertainty_calculator.render import RenderOptions
+from uncertainty_calculator.report import DEFAULT_POSTAMBLE, DEFAULT_PREAMBLE, write_report
+
+DIGITS = Digits(mu=3, sigma=2)
+OPTIONS = [
+    RenderOptions(last_unit=None, separate=False, insert=True, include_equation_number=True),
+    RenderOptions(
+        last_unit=r"\text{V}", separate=True, insert=False, include_equation_number=False
+    ),
+]
+
+
+def _jobs():
+    for case in CASES:
+        for options in OPTIONS:
+            yield parse_equation(case.equation), parse_variables(case.variables), options
+
+
+def _expected_body() -> str:
+    blocks = []
+    for equation, variables, options in _jobs():
+        calculator = UncertaintyCalculator(
+            DIGITS,
+            options.last_unit,
+            options.separate,
+            options.insert,
+            options.include_equation_number,
+        )
+        blocks.append(calculator.run(equation, variables))
+    return "\n".join(blocks)
+
+
+def test_report_streams_results_in_input_order_with_progress():
+    """The document should be the preamble, each `run` output in order, and the postamble."""
+    handle = io.StringIO()
+    events = []
+
+    summary = write_report(_jobs(), handle, DIGITS, max_pending=3, progress=events.append)
+
+    assert handle.getvalue() == DEFAULT_PREAMBLE + _expected_body() + DEFAULT_POSTAMBLE
+    assert summary.jobs == len(CASES) * len(OPTIONS)
+    assert [event.index for event in events] == list(range(summary.jobs))
+    assert all(seconds > 0 for seconds in summary.job_seconds)
+
+
+def test_report_runs_on_a_process_pool_without_preamble():
+    """Jobs should be picklable so a process pool can render them."""
+    handle = io.StringIO()
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        write_report(_jobs(), handle, DIGITS, preamble=None, postamble=None, executor=pool)
+
+    assert handle.getvalue() == _expected_body()
@@ -0,0 +1,107 @@
+"""Tests for lazily computed calculation results."""
+
+from __future__ import annotations
+
+import pytest
+
+from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
+from uncertainty_calculator import result as result_module
+from uncertainty_calculator.compute import compute_numeric
+from uncertainty_calculator.render import RenderOptions
+
+EQUATION = Equation(latex_name=r"\eta", expression="K*x**2/(4*e_0) + sin(x)")
+VARIABLES = [
+    Variable(name="K", value=2.0, uncertainty=0.1, latex_name="K"),
+    Variable(name="x", value=3.0, uncertainty=0.2, latex_name="x"),
+    Variable(name="e_0", value=8.85, uncertainty=0.0, latex_name=r"\varepsilon_0"),
+]
+
+
+def _options(**overrides) -> RenderOptions:
+    defaults = {
+        "last_unit": None,
+        "separate": False,
+        "insert": False,
+        "include_equation_number": False,
+    }
+    return RenderOptions(**(defaults | overrides))
+
+
+def _calculator(options: RenderOptions) -> UncertaintyCalculator:
+    return UncertaintyCalculator(
+        digits=Digits(mu=3, sigma=2),
+        last_unit=options.last_unit,
+        separate=options.separate,
+        insert=options.insert,
+        include_equation_number=options.include_equation_number,
+    )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"separate": True},
+        {"insert": True, "last_unit": "m"},
+        {"separate": True, "insert": True, "include_equation_number": True},
+    ],
+)
+def test_lazy_result_renders_like_eager_run(options):
+    """Every layout rendered from one lazy result should equal an eager run with it."""
+    result = _calculator(_options()).run(EQUATION, VARIABLES, lazy=True)
+    variant = _options(**options)
+
+    assert result.latex(variant) == _calculator(variant).run(EQUATION, VARIABLES)
+
+
+def test_mu_does_not_compute_partials():
+    """Reading mu should only evaluate the equation; sigma needs the partials."""
+    result = _calculator(_options()).run(EQUATION, VARIABLES, lazy=True)
+    numeric = compute_numeric(EQUATION, VARIABLES)
+
+    assert result.mu == pytest.approx(numeric.mu, rel=1e-12)
+    assert "compute_state" not in vars(result)
+    assert result.sigma == pytest.approx(numeric.sigma, rel=1e-12)
+    assert result.partials.keys() == {"K", "x"}
+    assert result.partials["K"] == pytest.approx(3.0**2 / (4 * 8.85), rel=1e-12)
+    assert "compute_state" in vars(result)
+
+
+def test_each_render_options_variant_is_rendered_once(monkeypatch):
+    """Repeated requests for a layout should reuse the memoized LaTeX."""
+    calls = []
+    render_output = result_module.render_output
+    monkeypatch.setattr(
+        result_module,
+        "render_output",
+        lambda *args: calls.append(args[2]) or render_output(*args),
+    )
+    result = _calculator(_options()).run(EQUATION, VARIABLES, lazy=True)
+    separate = _options(separate=True, insert=True)
+
+    assert result._repr_latex_() == str(result) == result.latex()
+    assert result.latex(separate) is result.latex(separate)
+    assert calls == [result.options, separate]
+    assert "rounded_pdvs" in vars(result.compute_state)
+
+
+def test_pruned_result_reports_the_sigma_error_bound():
+    """A pruned result should expose how much its sigma may be underestimated."""
+    equation = Equation(latex_name="y", expression="a + 1e-4*b")
+    variables = [
+        Variable(name="a", value=2.0, uncertainty=0.1, latex_name="a"),
+        Variable(name="b", value=1.0, uncertainty=0.1, latex_name="b"),
+    ]
+    calculator = UncertaintyCalculator(
+        digits=Digits(mu=3, sigma=2),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=False,
+        prune_threshold=1e-3,
+    )
+
+    result = calculator.run(equation, variables, lazy=True)
+
+    full_sigma = compute_numeric(equation, variables).sigma
+    assert result.sigma_error_bound == pytest.approx(full_sigma - result.sigma, rel=1e-9)
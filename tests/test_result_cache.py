@@ -0,0 +1,115 @@
+"""Tests for the rendered-result cache."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
+from uncertainty_calculator.render import RenderOptions
+from uncertainty_calculator.result_cache import (
+    DiskBackend,
+    MemoryBackend,
+    ResultCache,
+    result_key,
+)
+
+EQUATION = Equation(latex_name="y", expression="a*b")
+VARIABLES = [
+    Variable(name="a", value=2.0, uncertainty=0.1, latex_name="a"),
+    Variable(name="b", value=3.0, uncertainty=0.2, latex_name="b"),
+]
+OPTIONS = RenderOptions(last_unit=None, separate=False, insert=False, include_equation_number=False)
+
+
+def _calculator(result_cache: ResultCache) -> UncertaintyCalculator:
+    return UncertaintyCalculator(
+        digits=Digits(mu=2, sigma=2),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=False,
+        result_cache=result_cache,
+    )
+
+
+def test_result_key_is_stable_and_input_sensitive():
+    """Equal inputs hash equally; any value change produces a new key."""
+    digits = Digits(mu=2, sigma=2)
+    key = result_key(EQUATION, VARIABLES, digits, OPTIONS)
+    assert key == result_key(Equation("y", "a*b"), list(VARIABLES), Digits(2, 2), OPTIONS)
+
+    changed = [VARIABLES[0], Variable(name="b", value=3.0, uncertainty=0.21, latex_name="b")]
+    assert key != result_key(EQUATION, changed, digits, OPTIONS)
+    assert key != result_key(EQUATION, VARIABLES, Digits(mu=3, sigma=2), OPTIONS)
+    assert key != result_key(EQUATION, VARIABLES, digits, OPTIONS, coverage_factor=2.0)
+
+
+@pytest.mark.parametrize("backend_kind", ["memory", "disk"])
+def test_calculator_serves_repeated_runs_from_cache(tmp_path, backend_kind):
+    """Identical runs should render once and return the stored output afterwards."""
+    backend = MemoryBackend() if backend_kind == "memory" else DiskBackend(tmp_path)
+    cache = ResultCache(backend)
+    calc = _calculator(cache)
+
+    first = calc.run(equation=EQUATION, variables=VARIABLES)
+    second = calc.run(equation=EQUATION, variables=VARIABLES)
+
+    assert first == second
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_memory_backend_expires_entries_after_ttl(monkeypatch):
+    """Entries older than the TTL should be treated as misses."""
+    clock = [100.0]
+    monkeypatch.setattr("uncertainty_calculator.result_cache.time.monotonic", lambda: clock[0])
+    backend = MemoryBackend(ttl=10)
+    backend.set("k", "v")
+
+    assert backend.get("k") == "v"
+    clock[0] += 10
+    assert backend.get("k") is None
+    assert len(backend) == 0
+
+
+def test_disk_backend_evicts_least_recently_used(tmp_path):
+    """The disk backend should drop the least recently read entry when over capacity."""
+    backend = DiskBackend(tmp_path, maxsize=2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    assert backend.get("a") == "1"
+    backend.set("c", "3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    assert backend.get("c") == "3"
+    assert len(backend) == 2
+
+
+def test_disk_backend_seeds_recency_from_modification_times(tmp_path):
+    """A reopened cache should evict the file with the oldest modification time first."""
+    backend = DiskBackend(tmp_path, maxsize=2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    os.utime(tmp_path / "a.json", (2_000_000_000, 2_000_000_000))
+    os.utime(tmp_path / "b.json", (1_000_000_000, 1_000_000_000))
+
+    reopened = DiskBackend(tmp_path, maxsize=2)
+    reopened.set("c", "3")
+
+    assert reopened.get("b") is None
+    assert reopened.get("a") == "1"
+
+
+@pytest.mark.parametrize("content", ['{"expires_at": null, "val', "[1, 2]", "{}"])
+def test_disk_backend_treats_corrupt_entries_as_misses(tmp_path, content):
+    """Truncated or malformed files should be deleted and reported as misses."""
+    backend = DiskBackend(tmp_path)
+    backend.set("k", "v")
+    (tmp_path / "k.json").write_text(content)
+
+    assert backend.get("k") is None
+    assert not (tmp_path / "k.json").exists()
+    assert ResultCache(backend).get_or_create("k", lambda: "w") == "w"
@@ -0,0 +1,117 @@
+"""Tests for sampling-based propagation."""
+
+from __future__ import annotations
+
+import math
+import statistics
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import Digits, Equation, Variable
+from uncertainty_calculator.sampling import (
+    SAMPLERS,
+    latin_hypercube,
+    normal_ppf,
+    propagate_sampling,
+    sobol,
+)
+
+VARIABLES = [
+    Variable(name="a", value=1.5, uncertainty=0.1, latex_name="a"),
+    Variable(name="b", value=0.3, uncertainty=0.02, latex_name="b"),
+    Variable(name="c", value=4.0, uncertainty=0.0, latex_name="c"),
+]
+
+
+def test_sobol_matches_reference_points():
+    """Unshifted points should follow the Gray-code Sobol sequence."""
+    points = sobol(8, 2) - 0.5 / 2**32
+
+    np.testing.assert_array_equal(points[:, 0], [0, 0.5, 0.75, 0.25, 0.375, 0.875, 0.625, 0.125])
+    np.testing.assert_array_equal(points[:, 1], [0, 0.5, 0.25, 0.75, 0.375, 0.875, 0.125, 0.625])
+
+
+@pytest.mark.parametrize("design", ["sobol", "lhs"])
+def test_designs_stratify_every_coordinate(design):
+    """Each coordinate should put exactly one point in each of the n strata."""
+    rng = np.random.default_rng(0)
+    n, dimensions = 256, 12
+    points = (
+        sobol(n, dimensions, n, rng) if design == "sobol" else latin_hypercube(n, dimensions, rng)
+    )
+
+    for column in points.T:
+        np.testing.assert_array_equal(np.sort(np.floor(column * n)), np.arange(n))
+
+
+def test_normal_ppf_matches_inverse_cdf():
+    """The rational approximation should agree with the exact quantiles in both tails."""
+    u = np.array([1e-10, 1e-4, 0.02, 0.3, 0.5, 0.8, 0.99, 1 - 1e-7])
+    expected = [statistics.NormalDist().inv_cdf(x) for x in u]
+
+    np.testing.assert_allclose(normal_ppf(u), expected, rtol=1e-8)
+
+
+@pytest.mark.parametrize("sampler", SAMPLERS)
+def test_linear_equation_converges_to_linear_propagation(sampler):
+    """For a linear formula sampling should agree with first-order propagation."""
+    equation = Equation(latex_name="f", expression="a + 2*b*c")
+
+    result = propagate_sampling(equation, VARIABLES, Digits(mu=3, sigma=2), sampler=sampler, seed=0)
+
+    assert result.converged
+    assert result.samples == result.batches * 4096
+    assert result.mu == pytest.approx(1.5 + 2.4, abs=4 * result.mu_error)
+    assert result.sigma == pytest.approx(math.hypot(0.1, 0.16), abs=4 * result.sigma_error)
+
+
+def test_sobol_stops_earlier_than_random_sampling():
+    """Quasi-random batches should meet a tight tolerance with far fewer samples."""
+    equation = Equation(latex_name="f", expression="a*sin(b) + a**2/c")
+    digits = Digits(mu=4, sigma=3)
+
+    sobol_result = propagate_sampling(equation, VARIABLES, digits, batch_size=1024, seed=1)
+    random_result = propagate_sampling(
+        equation, VARIABLES, digits, sampler="random", batch_size=1024, seed=1
+    )
+
+    assert sobol_result.converged
+    assert sobol_result.samples * 8 <= random_result.samples
+
+
+def test_mean_near_zero_converges_at_sigma_resolution():
+    """A vanishing mean should stop once it is resolved to sigma's last digit."""
+    equation = Equation(latex_name="f", expression="a - 1.5")
+
+    result = propagate_sampling(equation, VARIABLES, Digits(mu=3, sigma=2), seed=0)
+
+    assert result.converged
+    assert result.samples <= 16 * 4096
+    assert result.mu == pytest.approx(0.0, abs=0.005)
+
+
+def test_sample_budget_stops_unconverged():
+    """Reaching `max_samples` should return the estimate flagged as not converged."""
+    equation = Equation(latex_name="f", expression="a*b")
+
+    result = propagate_sampling(
+        equation, VARIABLES, Digits(mu=9, sigma=9), batch_size=256, max_samples=2048, seed=0
+    )
+
+    assert not result.converged
+    assert result.samples == 2048
+    assert result.batches == 8
+
+
+def test_invalid_options_are_rejected():
+    """Unknown samplers and unbalanced Sobol batches should fail before sampling."""
+    equation = Equation(latex_name="f", expression="a*b")
+    digits = Digits(mu=3, sigma=2)
+
+    with pytest.raises(ValueError, match="Unknown sampler"):
+        propagate_sampling(equation, VARIABLES, digits, sampler="grid")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Invalid batch_size"):
+        propagate_sampling(equation, VARIABLES, digits, batch_size=1000)
+    with pytest.raises(ValueError, match="not defined"):
+        propagate_sampling(Equation(latex_name="f", expression="a*z"), VARIABLES, digits)
@@ -0,0 +1,80 @@
+"""Stress tests for generated models with many variables."""
+
+from __future__ import annotations
+
+import random
+
+from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
+from uncertainty_calculator import compute as compute_module
+from uncertainty_calculator.compute import compute
+from uncertainty_calculator.parsers import parse_inputs
+from uncertainty_calculator.validation import validate_inputs
+
+
+def _calibration_model(n: int) -> tuple[Equation, list[Variable]]:
+    """Generate an auto-calibration style sum with `n` uncertain inputs and `n` constants."""
+    rng = random.Random(n)
+    terms: list[str] = []
+    variables: list[Variable] = []
+    for i in range(n):
+        terms.append(f"exp(c_{i}*x_{i})" if i % 10 == 0 else f"c_{i}*x_{i}**2")
+        variables.append(
+            Variable(
+                name=f"x_{i}", value=rng.uniform(1, 2), uncertainty=0.01, latex_name=f"x_{{{i}}}"
+            )
+        )
+        variables.append(
+            Variable(name=f"c_{i}", value=rng.uniform(1, 2), uncertainty=0, latex_name=f"c_{{{i}}}")
+        )
+    return Equation(latex_name="y", expression=" + ".join(terms)), variables
+
+
+def _parse_and_compute_work(n: int, monkeypatch) -> int:
+    """Count the terms differentiated and symbols substituted for an `n`-input model."""
+    work = 0
+    derivative, substitute = compute_module._derivative, compute_module._substitute
+
+    def counted_derivative(terms, symbol):
+        nonlocal work
+        work += len(terms)
+        return derivative(terms, symbol)
+
+    def counted_substitute(expr, numbers):
+        nonlocal work
+        work += len(expr.free_symbols)
+        return substitute(expr, numbers)
+
+    monkeypatch.setattr(compute_module, "_derivative", counted_derivative)
+    monkeypatch.setattr(compute_module, "_substitute", counted_substitute)
+    # Derivatives of the same model may be cached by another test in this process.
+    compute_module.clear_derivative_cache()
+    equation, variables = _calibration_model(n)
+    parse_state = parse_inputs(equation, variables)
+    validate_inputs(parse_state)
+    compute(parse_state, Digits(mu=3, sigma=2))
+    return work
+
+
+def test_thousand_variable_model_renders_every_term():
+    """A generated 1000-input model should run end to end through the calculator."""
+    n = 1000
+    equation, variables = _calibration_model(n)
+    calc = UncertaintyCalculator(
+        digits=Digits(mu=3, sigma=2),
+        last_unit=None,
+        separate=False,
+        insert=False,
+        include_equation_number=False,
+    )
+
+    output = calc.run(equation=equation, variables=variables)
+
+    assert output.count("\\frac{\\partial y }") == 2 * n
+
+
+def test_parse_and_compute_scale_near_linearly(monkeypatch):
+    """Per-symbol work should touch only that symbol's terms, so 4x inputs cost 4x work."""
+    small = _parse_and_compute_work(250, monkeypatch)
+    large = _parse_and_compute_work(1000, monkeypatch)
+
+    assert large == 4 * small
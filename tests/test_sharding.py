@@ -0,0 +1,71 @@
+"""Tests for shared-memory row-sharded propagation."""
+
+from __future__ import annotations
+
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from uncertainty_calculator import Equation, Variable
+from uncertainty_calculator.compiled import compile_equation
+from uncertainty_calculator.sharding import ShardedExecutor, SharedBatch
+
+EQUATION = Equation(latex_name="f", expression="a*sin(b) + a**2/c")
+VARIABLES = [
+    Variable(name="a", value=1.5, uncertainty=0.1, latex_name="a"),
+    Variable(name="b", value=0.3, uncertainty=0.02, latex_name="b"),
+    Variable(name="c", value=4.0, uncertainty=0.5, latex_name="c"),
+]
+
+
+def _inputs(rows: int) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    rng = np.random.default_rng(0)
+    values = {var.name: var.value * rng.uniform(0.5, 1.5, rows) for var in VARIABLES}
+    sigmas = {var.name: np.full(rows, var.uncertainty) for var in VARIABLES}
+    return values, sigmas
+
+
+@pytest.mark.parametrize("shard_rows", [None, 7, 1000])
+def test_sharded_matches_single_process(shard_rows):
+    """Shards written in place by spawned workers should equal one in-process call."""
+    values, sigmas = _inputs(103)
+    expected = compile_equation(EQUATION, VARIABLES).propagate(values, sigmas)
+    context = multiprocessing.get_context("spawn")
+    with (
+        ShardedExecutor(EQUATION, VARIABLES, workers=2, mp_context=context) as executor,
+        executor.batch(103) as batch,
+    ):
+        batch.fill(values, sigmas)
+        result = executor.propagate(batch, shard_rows=shard_rows)
+        np.testing.assert_allclose(result.mu, expected.mu)
+        np.testing.assert_allclose(result.sigma, expected.sigma)
+        np.testing.assert_allclose(result.gradient, expected.gradient)
+        np.testing.assert_allclose(result.contributions, expected.contributions)
+
+
+def test_executor_reuses_workers_across_batches():
+    """Workers should re-attach when a new batch arrives."""
+    with ShardedExecutor(EQUATION, VARIABLES, workers=2) as executor:
+        for rows in (5, 11):
+            values, sigmas = _inputs(rows)
+            expected = compile_equation(EQUATION, VARIABLES).propagate(values, sigmas)
+            with executor.batch(rows) as batch:
+                batch.fill(values, sigmas)
+                np.testing.assert_allclose(executor.propagate(batch).sigma, expected.sigma)
+
+
+def test_batch_column_mismatch_is_rejected():
+    """A batch laid out for other variables must not reach the workers."""
+    with (
+        ShardedExecutor(EQUATION, VARIABLES, workers=1) as executor,
+        SharedBatch.create(("a", "b"), 4) as batch,
+        pytest.raises(ValueError, match="match"),
+    ):
+        executor.propagate(batch)
+
+
+def test_batch_rejects_empty():
+    """Shared blocks cannot be sized for zero rows."""
+    with pytest.raises(ValueError, match="rows must be positive"):
+        SharedBatch.create(("a",), 0)
@@ -0,0 +1,30 @@
+"""Tests for structural expression analysis."""
+
+from __future__ import annotations
+
+from sympy import S, symbols, sympify
+
+from uncertainty_calculator.structure import (
+    closed_form_derivative,
+    monomial_exponents,
+    terms_by_symbol,
+)
+
+
+def test_monomial_exponents_detects_products_of_powers():
+    """Constant factors are ignored and symbolic exponents are rejected."""
+    x, y = symbols("x y")
+    assert monomial_exponents(sympify("pi*x**2/(4*y)", locals={"x": x, "y": y})) == {
+        x: 2,
+        y: -1,
+    }
+    assert monomial_exponents(x**y) is None
+    assert monomial_exponents(sympify("sin(x)")) is None
+
+
+def test_closed_form_derivative_falls_back_for_shared_symbols():
+    """A symbol spread across several terms should defer to the general path."""
+    x, y, z = symbols("x y z")
+    assert closed_form_derivative(terms_by_symbol(x * y + 2 * z)[x], x) == y
+    assert closed_form_derivative(terms_by_symbol(x * y + x * z)[x], x) is None
+    assert closed_form_derivative(terms_by_symbol(y + z).get(x, []), x) == S.Zero
@@ -0,0 +1,96 @@
+"""Tests for SymPy cache monitoring and clearing."""
+
+from __future__ import annotations
+
+import pytest
+from sympy import Symbol, sympify
+
+from uncertainty_calculator import Digits, Equation, UncertaintyCalculator, Variable
+from uncertainty_calculator.metrics import REGISTRY
+from uncertainty_calculator.parsers import parse_cache_info
+from uncertainty_calculator.sympy_cache import (
+    GUARD,
+    SympyCacheGuard,
+    SympyCachePolicy,
+    clear_sympy_cache,
+    set_sympy_cache_policy,
+    sympy_cache_info,
+)
+
+VARIABLES = [
+    Variable(name="a", value=2.0, uncertainty=0.1, latex_name="a"),
+    Variable(name="b", value=3.0, uncertainty=0.2, latex_name="b"),
+]
+
+
+@pytest.fixture(autouse=True)
+def no_policy():
+    """Leave the process-wide guard without a policy after each test."""
+    yield
+    set_sympy_cache_policy()
+
+
+def test_info_reports_entries_and_clear_empties_them():
+    """SymPy work should show up as entries, and a clear should drop them."""
+    clears = sympy_cache_info().clears
+    sympify("x**2 + sin(y)").diff(Symbol("x"))
+    assert sympy_cache_info().entries > 0
+
+    clear_sympy_cache()
+
+    info = sympy_cache_info()
+    assert (info.entries, info.clears) == (0, clears + 1)
+    assert info.functions > 0
+
+
+def test_every_runs_policy_clears_on_schedule():
+    """Without a policy nothing is cleared; with one, every n-th run clears."""
+    guard = SympyCacheGuard()
+    assert not any(guard.maybe_clear() for _ in range(5))
+
+    guard.set_policy(SympyCachePolicy(every_runs=3))
+    assert [guard.maybe_clear() for _ in range(6)] == [False, False, True] * 2
+    assert guard.clears == 2
+
+
+def test_max_entries_and_interval_policies(monkeypatch):
+    """Size and age limits should each trigger a clear."""
+    guard = SympyCacheGuard(SympyCachePolicy(max_entries=1))
+    sympify("x + y")
+    assert guard.maybe_clear()
+
+    clock = [1000.0]
+    monkeypatch.setattr("uncertainty_calculator.sympy_cache.time.monotonic", lambda: clock[0])
+    guard = SympyCacheGuard(SympyCachePolicy(interval=60))
+    assert not guard.maybe_clear()
+    clock[0] += 61
+    assert guard.maybe_clear()
+
+
+def test_clearing_keeps_package_caches_valid():
+    """Parsed expressions cached before a clear should still be hit and render identically."""
+    calculator = UncertaintyCalculator(Digits(3, 2), None, False, True, True)
+    equation = Equation(latex_name="y", expression="a*b**2 + a/b")
+    first = calculator.run(equation, VARIABLES)
+    hits = parse_cache_info().hits
+
+    set_sympy_cache_policy(every_runs=1)
+    assert calculator.run(equation, VARIABLES) == first
+    assert calculator.run(equation, VARIABLES) == first
+    assert parse_cache_info().hits == hits + 2
+    assert GUARD.clears >= 2
+
+
+def test_metrics_expose_sympy_cache():
+    """Snapshots should include the SymPy cache gauges and clear counter."""
+    clear_sympy_cache()
+    snapshot = REGISTRY.snapshot()
+
+    assert snapshot.gauges["sympy_cache_entries", ()] >= 0
+    assert snapshot.counters["sympy_cache_clears_total", ()] == GUARD.clears
+
+
+def test_invalid_policy_is_rejected():
+    """Limits must be positive."""
+    with pytest.raises(ValueError, match="every_runs must be positive"):
+        SympyCachePolicy(every_runs=0)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from uncertainty_calculator import Digits, Variable
+from uncertainty_calculator import Digits, IndexedVariable, Variable
 
 
 def test_digits_dataclass_behaves_like_config():
@@ -35,3 +35,15 @@ def test_variable_rejects_string_numeric_fields():
         Variable(name="x", value="1", uncertainty=0.1, latex_name="x")
     with pytest.raises(TypeError, match="uncertainty must be a real number"):
         Variable(name="x", value=1.0, uncertainty="0.1", latex_name="x")
+
+
+def test_indexed_variable_broadcasts_shared_uncertainty():
+    """A scalar uncertainty should apply to every reading; lengths must otherwise match."""
+    variable = IndexedVariable(name="x", values=[1, 2, 3], uncertainties=0.5, latex_name="x")
+    assert variable.values == (1.0, 2.0, 3.0)
+    assert variable.uncertainties == (0.5, 0.5, 0.5)
+
+    with pytest.raises(ValueError, match="3 values but 2 uncertainties"):
+        IndexedVariable(name="x", values=[1, 2, 3], uncertainties=[0.1, 0.2], latex_name="x")
+    with pytest.raises(ValueError, match="must not be empty"):
+        IndexedVariable(name="x", values=[], uncertainties=0.1, latex_name="x")